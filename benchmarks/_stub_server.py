@@ -0,0 +1,34 @@
+"""Local stub of the WeFact API used by the benchmarks."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answer every POST with a small WeFact-style success payload."""
+
+    protocol_version = "HTTP/1.1"  # Required for keep-alive
+    disable_nagle_algorithm = True
+    body = json.dumps({"status": "success", "invoices": []}).encode()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(handler=StubHandler):
+    """Start the stub server in a background thread and return (server, url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}/v2/"
@@ -0,0 +1,59 @@
+"""
+Benchmark: throughput and peak memory of the Base64 file helpers.
+
+Compares the whole-file helpers (convert_to_base64, and b64decode followed by
+a single write) with the chunked encode_base64_stream / decode_base64_stream,
+reading through buffers or a memory map. Peak memory is what Python
+allocates (tracemalloc); memory-mapped pages are not counted.
+
+Usage:
+    python benchmarks/bench_base64.py [size_mb]
+"""
+
+import base64
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from wefact.utils import convert_to_base64, decode_base64_stream, encode_base64_stream  # noqa: E402
+
+
+def measure(label, size_mb, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {size_mb / elapsed:8.1f} MB/s  peak {peak / 2**20:8.1f} MiB")
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "scan.pdf"
+        encoded = Path(tmp) / "scan.b64"
+        decoded = Path(tmp) / "decoded.pdf"
+        with open(source, "wb") as f:
+            for _ in range(size_mb):
+                f.write(bytes(range(256)) * 4096)
+
+        print(f"{size_mb} MB file")
+        measure("convert_to_base64", size_mb, lambda: encoded.write_text(convert_to_base64(source)))
+        measure("encode_base64_stream", size_mb, lambda: encode_base64_stream(source, encoded))
+        measure("encode_base64_stream (mmap)", size_mb, lambda: encode_base64_stream(source, encoded, use_mmap=True))
+
+        def whole_decode():
+            decoded.write_bytes(base64.b64decode(encoded.read_text()))
+
+        measure("b64decode + write", size_mb, whole_decode)
+        measure("decode_base64_stream", size_mb, lambda: decode_base64_stream(encoded, decoded))
+        assert decoded.read_bytes() == source.read_bytes()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark: per-call latency with and without connection pooling.
+
+Runs against a local stub server, so only connection setup is measured
+(no TLS). Against api.mijnwefact.nl the difference is larger, because every
+unpooled call also pays for a TLS handshake.
+
+Usage:
+    python benchmarks/bench_connection_pool.py [calls]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from wefact import WeFact  # noqa: E402
+from wefact.resources import InvoiceResource  # noqa: E402
+
+from _stub_server import start_stub_server  # noqa: E402
+
+
+def bench(label, resource, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        resource.list()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {calls} calls in {elapsed:.3f}s ({elapsed / calls * 1000:.3f} ms/call)")
+    return elapsed
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    server, url = start_stub_server()
+    try:
+        unpooled = bench("unpooled", InvoiceResource("bench", url, requests_per_minute=None), calls)
+        with WeFact(api_key="bench", api_url=url, requests_per_minute=None) as client:
+            pooled = bench("pooled", client.invoices, calls)
+        print(f"speedup      {unpooled / pooled:.2f}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
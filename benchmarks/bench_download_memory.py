@@ -0,0 +1,77 @@
+"""
+Benchmark: peak memory of a large invoice PDF download.
+
+Downloads the same document once with download() followed by
+decode_base64_to_file(), and once with download_to(), from a local stub
+server, and reports the peak memory allocated by Python (tracemalloc).
+
+Usage:
+    python benchmarks/bench_download_memory.py [size_mb]
+"""
+
+import base64
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from wefact import WeFact, decode_base64_to_file  # noqa: E402
+
+from _stub_server import StubHandler, start_stub_server  # noqa: E402
+
+
+def download_handler(size_mb):
+    pdf = bytes(range(256)) * 4096 * size_mb
+    document = {
+        "controller": "invoice",
+        "action": "download",
+        "status": "success",
+        "invoice": {"Filename": "F0001.pdf", "Base64": base64.b64encode(pdf).decode()},
+    }
+
+    class DownloadHandler(StubHandler):
+        # Slashes escaped like PHP's json_encode does
+        body = json.dumps(document).replace("/", "\\/").encode()
+
+    return DownloadHandler
+
+
+def measure(label, download):
+    tracemalloc.start()
+    start = time.perf_counter()
+    download()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<14} peak {peak / 2**20:8.1f} MiB  {elapsed:6.2f}s")
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    # Built before measuring: the server's copy of the response is not counted
+    server, url = start_stub_server(download_handler(size_mb))
+    try:
+        with tempfile.TemporaryDirectory() as tmp, \
+                WeFact(api_key="bench", api_url=url, requests_per_minute=None) as client:
+            target = Path(tmp) / "invoice.pdf"
+
+            def in_memory():
+                response = client.invoices.download(Identifier=1)
+                decode_base64_to_file(response["invoice"]["Base64"], target)
+
+            def streamed():
+                client.invoices.download_to(target, Identifier=1)
+
+            print(f"{size_mb} MB PDF")
+            measure("download()", in_memory)
+            measure("download_to()", streamed)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: translating exported columns with get_enum_value / get_enum_name.
+
+Compares the previous linear scans with the indexed lookups and the batch
+functions, for a column of mixed values, names and partial names. Checks
+that both implementations return the same results.
+
+Usage:
+    python benchmarks/bench_enum_lookup.py [rows]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from wefact.enums import (  # noqa: E402
+    Currency,
+    PricePeriod,
+    get_enum_name,
+    get_enum_names,
+    get_enum_value,
+    get_enum_values,
+)
+
+
+def legacy_get_enum_value(enum_class, name_or_value):
+    """The scanning implementation get_enum_value() replaces."""
+    name_upper = str(name_or_value).upper()
+    for item in enum_class:
+        if item.value == name_or_value:
+            return item.value
+    try:
+        return enum_class[name_upper].value
+    except KeyError:
+        for item in enum_class:
+            if name_upper in item.name:
+                return item.value
+        raise ValueError(f"Invalid {enum_class.__name__}: {name_or_value}")
+
+
+def legacy_get_enum_name(enum_class, value):
+    """The scanning implementation get_enum_name() replaces."""
+    for item in enum_class:
+        if item.value == value:
+            return item.name
+    raise ValueError(f"Invalid {enum_class.__name__} value: {value}")
+
+
+def column(enum_class, rows):
+    """Values as they appear in exports, plus names and partial names."""
+    choices = [item.value for item in enum_class]
+    choices += [name.lower() for name in enum_class.__members__]
+    choices += [item.name[:3] for item in enum_class]
+    random.seed(0)
+    return [random.choice(choices) for _ in range(rows)]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for enum_class in (PricePeriod, Currency):
+        names = column(enum_class, rows)
+        values = [item.value for item in enum_class] * (rows // len(enum_class))
+
+        legacy, legacy_ms = timed(lambda: [legacy_get_enum_value(enum_class, x) for x in names])
+        single, single_ms = timed(lambda: [get_enum_value(enum_class, x) for x in names])
+        batch, batch_ms = timed(lambda: get_enum_values(enum_class, names))
+        assert legacy == single == batch, f"{enum_class.__name__}: get_enum_value results differ"
+        print(
+            f"{enum_class.__name__:<12} get_enum_value  legacy {legacy_ms:8.1f} ms  "
+            f"indexed {single_ms:8.1f} ms  batch {batch_ms:8.1f} ms  "
+            f"speedup {legacy_ms / batch_ms:.1f}x"
+        )
+
+        legacy, legacy_ms = timed(lambda: [legacy_get_enum_name(enum_class, x) for x in values])
+        single, single_ms = timed(lambda: [get_enum_name(enum_class, x) for x in values])
+        batch, batch_ms = timed(lambda: get_enum_names(enum_class, values))
+        assert legacy == single == batch, f"{enum_class.__name__}: get_enum_name results differ"
+        print(
+            f"{enum_class.__name__:<12} get_enum_name   legacy {legacy_ms:8.1f} ms  "
+            f"indexed {single_ms:8.1f} ms  batch {batch_ms:8.1f} ms  "
+            f"speedup {legacy_ms / batch_ms:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: form-encoding request payloads.
+
+Compares the previous recursive ``flatten_params`` + ``urlencode`` pipeline
+with the single-pass ``encode_params`` encoder, and with ``_encode_request``,
+which reuses the cached api_key/controller/action prefix. Checks that all of
+them produce byte-identical request bodies.
+
+Usage:
+    python benchmarks/bench_flatten_params.py [iterations]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+from urllib.parse import urlencode
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from wefact.enums import Action  # noqa: E402
+from wefact.request import encode_params  # noqa: E402
+from wefact.resources import InvoiceResource  # noqa: E402
+
+
+def legacy_flatten_params(params, parent_key=''):
+    """The recursive implementation encode_params() replaces."""
+    from enum import Enum
+
+    def to_string(val):
+        if isinstance(val, Enum):
+            return val.value
+        return str(val)
+
+    items = []
+    for key, value in params.items():
+        new_key = f"{parent_key}[{key}]" if parent_key else key
+        if isinstance(value, dict):
+            items.extend(legacy_flatten_params(value, new_key))
+        elif isinstance(value, (list, tuple)):
+            for idx, item in enumerate(value):
+                if isinstance(item, dict):
+                    items.extend(legacy_flatten_params(item, f"{new_key}[{idx}]"))
+                else:
+                    items.append((f"{new_key}[{idx}]", to_string(item)))
+        else:
+            items.append((new_key, to_string(value)))
+    return items
+
+
+def payloads():
+    base = {'api_key': 'bench-key', 'controller': 'invoice'}
+    yield 'flat show', {**base, 'action': Action.SHOW, 'Identifier': '1234'}
+    yield 'invoice, 500 lines', {
+        **base,
+        'action': Action.ADD,
+        'DebtorCode': 'DB0001',
+        'Debtor': {'CompanyName': 'Acme B.V.', 'Address': 'Main Street 1'},
+        'InvoiceLines': [
+            {
+                'Number': idx,
+                'ProductCode': f'P{idx:04d}',
+                'Description': f'Product {idx} – monthly service',
+                'PriceExcl': 12.5,
+                'TaxCode': 'V21',
+            }
+            for idx in range(500)
+        ],
+    }
+
+
+def measure(func, iterations):
+    return min(timeit.repeat(func, number=iterations, repeat=5)) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    # Envelope prefixes are cached on the resource's context
+    mixin = InvoiceResource('bench-key', requests_per_minute=None)
+
+    for label, payload in payloads():
+        envelope = {key: payload.pop(key) for key in ('api_key', 'controller', 'action')}
+        full = {**envelope, **payload}
+
+        def request_body():
+            return mixin._encode_request(envelope['controller'], envelope['action'], payload)
+
+        legacy_body = urlencode(legacy_flatten_params(full))
+        assert encode_params(full) == legacy_body, f"{label}: encode_params output differs"
+        assert request_body() == legacy_body, f"{label}: _encode_request output differs"
+
+        legacy = measure(lambda: urlencode(legacy_flatten_params(full)), iterations)
+        current = measure(lambda: encode_params(full), iterations)
+        cached = measure(request_body, iterations)
+        print(
+            f"{label:<20} legacy {legacy:9.1f} us  "
+            f"encode_params {current:9.1f} us  "
+            f"_encode_request {cached:9.1f} us  "
+            f"speedup {legacy / cached:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: local SQLite mirror (wefact.sync.Mirror).
+
+Mirrors synthetic invoice listings served in memory (no network), then
+measures refreshes with 1% of the invoices changed: a full listing compared
+item by item, and an incremental one listing only the invoices modified
+since the watermark. Finally measures the latency of the reads dashboards
+make: by Identifier, by code and by status.
+
+Usage:
+    python benchmarks/bench_mirror.py [invoices]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from wefact.resources.base import BaseResource  # noqa: E402
+from wefact.sync import Mirror  # noqa: E402
+
+
+class StubInvoices(BaseResource):
+    """Invoice listing served from memory instead of BaseResource.iter_pages() requests."""
+
+    controller_name = "invoice"
+
+    def __init__(self, count):
+        self.items = [
+            {
+                "Identifier": str(i),
+                "InvoiceCode": f"INV{10000 + i}",
+                "DebtorCode": f"DB{10000 + i % 500}",
+                "Status": random.choice("02348"),
+                "Date": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}",
+                "AmountIncl": f"{random.uniform(10, 5000):.2f}",
+                "Modified": "2025-01-01 00:00:00",
+            }
+            for i in range(1, count + 1)
+        ]
+
+    def iter_pages(self, offset=0, per_page=1000, prefetch=0, modified=None, **params):
+        since = (modified or {}).get("from", "")
+        items = [item for item in self.items if item["Modified"] >= since]
+        for start in range(offset, len(items), per_page):
+            yield items[start:start + per_page]
+
+
+def timed(func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    random.seed(0)
+    invoices = StubInvoices(count)
+    with tempfile.TemporaryDirectory() as directory, Mirror(Path(directory) / "wefact.db") as mirror:
+        result, seconds = timed(lambda: mirror.sync(invoices))
+        print(f"full load          {count} invoices  {seconds * 1e3:8.1f} ms  ({result.inserted} inserted)")
+
+        for day, sync in ((2, lambda: mirror.sync(invoices, full=True)), (3, lambda: mirror.sync(invoices))):
+            for item in random.sample(invoices.items, count // 100):
+                item.update(Status="9", Modified=f"2025-01-{day:02d} 00:00:00")
+            result, seconds = timed(sync)
+            print(
+                f"{'full listing' if day == 2 else 'since watermark':<18} {count} invoices  {seconds * 1e3:8.1f} ms  "
+                f"({result.listed} listed, {result.updated} updated)"
+            )
+
+        reads = 10_000
+        identifiers = [random.randint(1, count) for _ in range(reads)]
+        _, seconds = timed(lambda: [mirror.get("invoice", i) for i in identifiers])
+        print(f"get by Identifier  {seconds / reads * 1e6:8.1f} us per read")
+        codes = [f"INV{10000 + i}" for i in identifiers]
+        _, seconds = timed(lambda: [mirror.find("invoice", InvoiceCode=code) for code in codes])
+        print(f"find by code       {seconds / reads * 1e6:8.1f} us per read")
+        _, seconds = timed(
+            lambda: mirror.query("SELECT COUNT(*), SUM(AmountIncl) FROM invoices WHERE Status = 2"), 100
+        )
+        print(f"sum by status      {seconds * 1e6:8.1f} us per query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: peak memory of a large attachment upload.
+
+Uploads the same file once as an in-memory Base64 string and once streamed
+from its path, against a local stub server that discards the body, and
+reports the peak memory allocated by Python (tracemalloc) for each.
+
+Usage:
+    python benchmarks/bench_upload_memory.py [size_mb]
+"""
+
+import base64
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from wefact import WeFact  # noqa: E402
+
+from _stub_server import StubHandler, start_stub_server  # noqa: E402
+
+
+class DiscardingHandler(StubHandler):
+    """Read the request body in small pieces so the server adds no memory."""
+
+    def do_POST(self):
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(remaining, 65536)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+
+def measure(label, upload):
+    tracemalloc.start()
+    start = time.perf_counter()
+    upload()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} peak {peak / 2**20:8.1f} MiB  {elapsed:6.2f}s")
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    server, url = start_stub_server(DiscardingHandler)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "scan.pdf"
+        with open(path, "wb") as f:
+            for _ in range(size_mb):
+                f.write(bytes(range(256)) * 4096)
+
+        try:
+            with WeFact(api_key="bench", api_url=url, requests_per_minute=None) as client:
+                def in_memory():
+                    content = base64.b64encode(path.read_bytes()).decode()
+                    client.invoices.attachment_add(ReferenceIdentifier=1, Filename="scan.pdf", Base64=content)
+
+                def streamed():
+                    client.invoices.attachment_add(ReferenceIdentifier=1, Filename="scan.pdf", Base64=path)
+
+                print(f"{size_mb} MB attachment")
+                measure("in-memory", in_memory)
+                measure("streamed", streamed)
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
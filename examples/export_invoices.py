@@ -0,0 +1,21 @@
+"""
+Example: Export all invoice PDFs of a period
+
+Downloads the PDFs of all paid invoices into a ZIP archive, 8 at a time.
+Run it again after an interruption and it continues where it stopped.
+
+The same can be done from the command line:
+    wefact-export invoices invoices-paid.zip --filter status=4 --workers 8
+"""
+
+import os
+
+from wefact import WeFact, export_pdfs
+
+client = WeFact(api_key=os.getenv("WEFACT_API_KEY", "your_api_key_here"))
+
+result = export_pdfs(client.invoices, "invoices-paid.zip", workers=8, status=4)
+
+print(f"✓ Exported {result.exported} invoices ({result.skipped} already exported)")
+for identifier, error in result.failed.items():
+    print(f"✗ Invoice {identifier}: {error}")
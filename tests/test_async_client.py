@@ -0,0 +1,337 @@
+"""Tests for the asyncio client."""
+
+import asyncio
+from urllib.parse import parse_qs
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from wefact import AsyncWeFact
+from wefact.exceptions import ClientError, NotFoundError, ValidationError
+from wefact.resources import AsyncInvoiceResource
+
+
+def make_client(handler, **kwargs):
+    """Create an AsyncWeFact whose transport is served by `handler`."""
+    client = AsyncWeFact(api_key="test_key", requests_per_minute=None, **kwargs)
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def form(request):
+    """Decode the form-encoded request body into a flat dict."""
+    return {k: v[0] for k, v in parse_qs(request.content.decode()).items()}
+
+
+class TestAsyncWeFact:
+    """Test AsyncWeFact client behaviour."""
+    
+    def test_resource_types(self):
+        """Test resources are async variants sharing the client session."""
+        client = AsyncWeFact(api_key="test_key")
+        assert isinstance(client.invoices, AsyncInvoiceResource)
+        assert client.debtors.session is client.session
+    
+    def test_invalid_api_key(self):
+        """Test invalid API keys are rejected."""
+        with pytest.raises(TypeError):
+            AsyncWeFact(api_key=123)
+        with pytest.raises(ValueError):
+            AsyncWeFact(api_key=" ")
+    
+    def test_action_is_awaitable(self):
+        """Test resource actions are awaitable and send the request form."""
+        seen = []
+        
+        def handler(request):
+            seen.append(form(request))
+            return httpx.Response(200, json={"status": "success", "invoice": {"Identifier": "1"}})
+        
+        async def run():
+            async with make_client(handler) as client:
+                return await client.invoices.credit(Identifier=1)
+        
+        result = asyncio.run(run())
+        assert result["invoice"]["Identifier"] == "1"
+        assert seen[0]["controller"] == "invoice"
+        assert seen[0]["action"] == "credit"
+        assert seen[0]["Identifier"] == "1"
+        assert seen[0]["api_key"] == "test_key"
+    
+    def test_nested_params_encoding(self):
+        """Test nested parameters are flattened into form fields."""
+        seen = []
+        
+        def handler(request):
+            seen.append(form(request))
+            return httpx.Response(200, json={"status": "success"})
+        
+        async def run():
+            async with make_client(handler) as client:
+                await client.transactions.match(Identifier=5, InvoiceIdentifiers=["10", "11"])
+        
+        asyncio.run(run())
+        assert seen[0]["action"] == "match"
+        assert seen[0]["InvoiceIdentifiers[1]"] == "11"
+    
+    def test_cost_category_unwrap(self):
+        """Test cost category responses are unwrapped from settings."""
+        def handler(request):
+            return httpx.Response(200, json={"status": "success", "settings": {"costcategories": [{"Identifier": "1"}]}})
+        
+        async def run():
+            async with make_client(handler) as client:
+                return await client.cost_categories.list()
+        
+        result = asyncio.run(run())
+        assert result["costcategories"] == [{"Identifier": "1"}]
+    
+    def test_resources_are_cached(self):
+        """Test resource instances are cached and follow the client session."""
+        client = AsyncWeFact(api_key="test_key")
+        invoices = client.invoices
+        assert invoices is client.invoices
+        client.session = httpx.AsyncClient()
+        assert invoices.session is client.session
+    
+    def test_response_hooks(self):
+        """Test response hooks receive failed responses."""
+        def handler(request):
+            return httpx.Response(404, json={"errors": ["Not found"]})
+        
+        seen = []
+        
+        async def run():
+            async with make_client(handler, retry=None) as client:
+                client.context.add_response_hook(seen.append)
+                await client.invoices.show(Identifier=1)
+        
+        with pytest.raises(NotFoundError):
+            asyncio.run(run())
+        assert seen[0].controller == "invoice"
+        assert seen[0].action == "show"
+        assert seen[0].json() == {"errors": ["Not found"]}
+        assert isinstance(seen[0].error, NotFoundError)
+    
+    def test_resolve_uses_identifier_index(self):
+        """Test resolve() looks up codes once through the identifier index."""
+        seen = []
+        
+        def handler(request):
+            seen.append(form(request))
+            return httpx.Response(200, json={
+                "status": "success",
+                "debtor": {"Identifier": "5", "DebtorCode": "DB10005"},
+            })
+        
+        async def run():
+            async with make_client(handler, identifiers=True) as client:
+                first = await client.debtors.resolve("DB10005")
+                code = await client.debtors.resolve_code(5)
+                return first, code
+        
+        assert asyncio.run(run()) == ("5", "DB10005")
+        assert len(seen) == 1
+        assert seen[0]["DebtorCode"] == "DB10005"
+
+
+class TestAsyncErrors:
+    """Test async error handling, retries and deadlines."""
+    
+    def test_http_error_mapping(self):
+        """Test HTTP error statuses map to WeFact exceptions."""
+        def handler(request):
+            return httpx.Response(404, json={"errors": ["Not found"]})
+        
+        async def run():
+            async with make_client(handler) as client:
+                await client.invoices.show(Identifier=1)
+        
+        with pytest.raises(NotFoundError):
+            asyncio.run(run())
+    
+    def test_wefact_error_payload(self):
+        """Test an error status in the payload raises ValidationError."""
+        def handler(request):
+            return httpx.Response(200, json={"status": "error", "errors": ["Invoice not found"]})
+        
+        async def run():
+            async with make_client(handler) as client:
+                await client.invoices.show(Identifier=1)
+        
+        with pytest.raises(ValidationError, match="Invoice not found"):
+            asyncio.run(run())
+    
+    def test_transport_error(self):
+        """Test transport failures raise ClientError."""
+        def handler(request):
+            raise httpx.ConnectError("Network error")
+        
+        async def run():
+            async with make_client(handler, retry=None) as client:
+                await client.invoices.list()
+        
+        with pytest.raises(ClientError, match="Network error"):
+            asyncio.run(run())
+    
+    def test_retries_transient_errors(self, mocker):
+        """Test transient server errors are retried."""
+        sleep = mocker.patch('wefact.async_request.asyncio.sleep')
+        responses = [
+            httpx.Response(502, json={"message": "Bad gateway"}),
+            httpx.Response(200, json={"status": "success", "invoices": []}),
+        ]
+        
+        def handler(request):
+            return responses.pop(0)
+        
+        async def run():
+            async with make_client(handler) as client:
+                return await client.invoices.list()
+        
+        assert asyncio.run(run())["status"] == "success"
+        assert sleep.call_count == 1
+    
+    def test_expired_deadline(self):
+        """Test an expired deadline fails before sending a request."""
+        from wefact import deadline
+        from wefact.exceptions import RequestTimeoutError
+        
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"status": "success"})
+        
+        async def run():
+            async with make_client(handler) as client:
+                with deadline(0):
+                    await client.invoices.list()
+        
+        with pytest.raises(RequestTimeoutError):
+            asyncio.run(run())
+        assert calls == []
+
+
+class TestAsyncListing:
+    """Test async listing helpers."""
+    
+    def test_list_all_paginates(self):
+        """Test list_all pages through results and fetches details."""
+        def handler(request):
+            params = form(request)
+            if params["action"] == "list":
+                offset = int(params["offset"])
+                ids = list(range(offset + 1, min(offset + 2, 3) + 1))
+                return httpx.Response(200, json={
+                    "status": "success",
+                    "products": [{"Identifier": i} for i in ids],
+                    "currentresults": len(ids),
+                })
+            return httpx.Response(200, json={"status": "success", "product": {"Identifier": params["Identifier"], "Detail": True}})
+        
+        async def run():
+            async with make_client(handler) as client:
+                return await client.products.list_all(per_page=2)
+        
+        results = asyncio.run(run())
+        assert [r["Identifier"] for r in results] == ["1", "2", "3"]
+        assert all(r["Detail"] for r in results)
+    
+    def test_list_all_concurrent_preserves_order(self):
+        """Test concurrent list_all keeps listing order and bounds workers."""
+        in_flight = []
+        peak = []
+        
+        async def handler(request):
+            params = form(request)
+            if params["action"] == "list":
+                return httpx.Response(200, json={
+                    "status": "success",
+                    "products": [{"Identifier": i} for i in range(1, 11)],
+                    "currentresults": 10,
+                })
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01 * (11 - int(params["Identifier"])) / 10)
+            in_flight.pop()
+            return httpx.Response(200, json={"status": "success", "product": {"Identifier": params["Identifier"]}})
+        
+        async def run():
+            async with make_client(handler) as client:
+                return await client.products.list_all(per_page=100, workers=4)
+        
+        results = asyncio.run(run())
+        assert [r["Identifier"] for r in results] == [str(i) for i in range(1, 11)]
+        assert 1 < max(peak) <= 4
+    
+    def test_iter_all_async_generator(self):
+        """Test iter_all is an async generator over all items."""
+        def handler(request):
+            params = form(request)
+            if params["action"] == "list":
+                offset = int(params["offset"])
+                ids = [offset + 1] if offset < 3 else []
+                return httpx.Response(200, json={
+                    "status": "success",
+                    "products": [{"Identifier": i} for i in ids],
+                    "currentresults": len(ids),
+                })
+            return httpx.Response(200, json={"status": "success", "product": {"Identifier": params["Identifier"]}})
+        
+        async def run():
+            async with make_client(handler) as client:
+                return [item["Identifier"] async for item in client.products.iter_all(per_page=1)]
+        
+        assert asyncio.run(run()) == ["1", "2", "3"]
+    
+    def test_iter_pages_prefetch(self):
+        """Test prefetched pages are yielded in order."""
+        async def handler(request):
+            params = form(request)
+            offset = int(params["offset"])
+            await asyncio.sleep(0.01)
+            ids = list(range(offset, min(offset + 10, 45)))
+            return httpx.Response(200, json={
+                "status": "success",
+                "products": [{"Identifier": i} for i in ids],
+                "currentresults": len(ids),
+                "totalresults": 45,
+            })
+        
+        async def run():
+            async with make_client(handler) as client:
+                return [page async for page in client.products.iter_pages(per_page=10, prefetch=3)]
+        
+        pages = asyncio.run(run())
+        assert [item["Identifier"] for page in pages for item in page] == list(range(45))
+    
+    def test_mirror_sync_async(self, tmp_path):
+        """Test Mirror.sync_async loads and refreshes a resource."""
+        from wefact.sync import Mirror
+        
+        items = [{"Identifier": str(i), "DebtorCode": f"DB{i}"} for i in range(3)]
+        shows = []
+        
+        def handler(request):
+            params = form(request)
+            if params["action"] == "show":
+                shows.append(params["Identifier"])
+                return httpx.Response(200, json={"status": "success", "debtor": items[int(params["Identifier"])]})
+            return httpx.Response(200, json={
+                "status": "success", "totalresults": 3, "currentresults": 3, "debtors": items,
+            })
+        
+        async def run(mirror):
+            async with make_client(handler) as client:
+                first = await mirror.sync_async(client.debtors, detail=True, workers=2)
+                items[1]["DebtorCode"] = "DB100"
+                second = await mirror.sync_async(client.debtors, detail=True)
+                return first, second
+        
+        with Mirror(tmp_path / "wefact.db") as mirror:
+            first, second = asyncio.run(run(mirror))
+            assert (first.inserted, second.updated, second.unchanged) == (3, 1, 2)
+            assert sorted(shows) == ["0", "1", "1", "2"]
+            assert mirror.find("debtor", DebtorCode="DB100")[0]["Identifier"] == "1"
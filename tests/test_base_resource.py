@@ -12,6 +12,13 @@ class TestBaseResource:
         resource = BaseResource("test_key")
         resource.controller_name = "invoice"
         assert resource.get_plural_resource_name() == "invoices"
+
+    def test_standalone_resource_context(self):
+        """Test a resource created on its own gets a private context."""
+        resource = BaseResource("test_key", timeout=(1, 2))
+        assert resource.context.api_key == "test_key"
+        assert resource.timeout == (1, 2)
+        assert BaseResource("test_key").context is not resource.context
     
     def test_list_all_single_page(self, mocker):
         """Test list_all with single page of results."""
@@ -72,28 +79,163 @@ class TestBaseResource:
         resource = BaseResource("test_key")
         resource.controller_name = "product"
         
-        # Create a response with just enough items to trigger rate limiting check
-        # Reduced from 300 to 10 for speed
-        mock_response = {
+        # One response serves the listing and every show() call
+        response = mocker.Mock(status_code=200)
+        response.json.return_value = {
+            "status": "success",
             "products": [{"Identifier": i} for i in range(1, 11)],
-            "currentresults": 10
+            "currentresults": 10,
+            "product": {"Identifier": 1},
         }
+        post = mocker.patch('wefact.request.requests.post', return_value=response)
+        sleep = mocker.patch('wefact.rate_limit.time.sleep')
+        
+        results = resource.list_all()
+        
+        assert len(results) == 10
+        assert post.call_count == 11
+        # The default burst of 5 is used up, the rest wait for refills
+        assert resource.rate_limiter.stats.acquired == 11
+        assert sleep.call_count == 6
+    
+    def test_list_all_concurrent_preserves_order(self, mocker):
+        """Test list_all with workers returns details in listing order."""
+        import random
+        import threading
+        import time
+        
+        resource = BaseResource("test_key")
+        resource.controller_name = "product"
         
+        mock_response = {
+            "products": [{"Identifier": i} for i in range(1, 21)],
+            "currentresults": 20
+        }
         mocker.patch.object(resource, 'list', return_value=mock_response)
         
-        # Mock show to track calls
-        show_calls = []
+        threads = set()
         def mock_show(**kwargs):
-            show_calls.append(kwargs["Identifier"])
-            return {"product": {"Identifier": kwargs["Identifier"]}}
+            threads.add(threading.get_ident())
+            time.sleep(random.uniform(0, 0.01))
+            return {"product": {"Identifier": kwargs["Identifier"], "Detail": True}}
         
         mocker.patch.object(resource, 'show', side_effect=mock_show)
         
-        # Mock time.sleep to track if it's called
-        mock_sleep = mocker.patch('time.sleep')
+        results = resource.list_all(per_page=100, workers=4)
         
-        results = resource.list_all()
+        assert [r["Identifier"] for r in results] == list(range(1, 21))
+        assert all(r["Detail"] for r in results)
+        assert len(threads) > 1
+
+    
+    def test_iter_pages_is_lazy(self, mocker):
+        """Test iter_pages requests the next page only when it is consumed."""
+        resource = BaseResource("test_key")
+        resource.controller_name = "product"
         
-        assert len(results) == 10
-        # Verify show was called for each item
-        assert len(show_calls) == 10
+        pages = [
+            {"products": [{"Identifier": 1}, {"Identifier": 2}], "currentresults": 2},
+            {"products": [{"Identifier": 3}], "currentresults": 1},
+        ]
+        mock_list = mocker.patch.object(resource, 'list', side_effect=pages)
+        
+        iterator = resource.iter_pages(per_page=2, status=2)
+        assert next(iterator) == pages[0]["products"]
+        assert mock_list.call_count == 1
+        mock_list.assert_called_with(limit=2, offset=0, status=2)
+        assert next(iterator) == pages[1]["products"]
+        mock_list.assert_called_with(limit=2, offset=2, status=2)
+        assert list(iterator) == []
+    
+    def test_iter_all_does_not_recurse(self, mocker):
+        """Test iter_all walks many pages without hitting the recursion limit."""
+        import sys
+        
+        resource = BaseResource("test_key")
+        resource.controller_name = "product"
+        
+        page_count = sys.getrecursionlimit() + 10
+        def mock_list(limit, offset):
+            if offset // limit >= page_count:
+                return {"products": [], "currentresults": 0}
+            return {"products": [{"Identifier": offset}], "currentresults": 1}
+        
+        mocker.patch.object(resource, 'list', side_effect=mock_list)
+        mocker.patch.object(resource, 'show', side_effect=lambda **kwargs: {
+            "product": {"Identifier": kwargs["Identifier"]}
+        })
+        
+        count = sum(1 for _ in resource.iter_all(per_page=1))
+        assert count == page_count
+    
+    @pytest.mark.parametrize("detail, expected_shows", [
+        (True, [1, 2, 3]),
+        (False, []),
+        (None, []),
+        (lambda item: item["Status"] == "4", [2]),
+        ({"InvoiceCode", "AmountIncl"}, [3]),
+        ("AmountIncl", [3]),
+    ])
+    def test_list_all_detail_policy(self, mocker, detail, expected_shows):
+        """Test list_all only calls show() for items selected by the detail policy."""
+        resource = BaseResource("test_key")
+        resource.controller_name = "invoice"
+        
+        summary = [
+            {"Identifier": 1, "InvoiceCode": "F1", "AmountIncl": "10", "Status": "2"},
+            {"Identifier": 2, "InvoiceCode": "F2", "AmountIncl": "20", "Status": "4"},
+            {"Identifier": 3, "InvoiceCode": "F3", "Status": "2"},
+        ]
+        mocker.patch.object(resource, 'list', return_value={"invoices": summary, "currentresults": 3})
+        mock_show = mocker.patch.object(resource, 'show', side_effect=lambda **kwargs: {
+            "invoice": {"Identifier": kwargs["Identifier"], "Detail": True}
+        })
+        
+        results = resource.list_all(detail=detail, workers=2)
+        
+        assert sorted(call.kwargs["Identifier"] for call in mock_show.call_args_list) == expected_shows
+        assert [r["Identifier"] for r in results] == [1, 2, 3]
+        assert [r.get("Detail", False) for r in results] == [i in expected_shows for i in (1, 2, 3)]
+    
+    def test_iter_pages_prefetch(self, mocker):
+        """Test prefetching requests upcoming pages concurrently and keeps order."""
+        import threading
+        import time
+        
+        resource = BaseResource("test_key")
+        resource.controller_name = "product"
+        
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+        def mock_list(limit, offset):
+            with lock:
+                in_flight.append(offset)
+                peak.append(len(in_flight))
+            time.sleep(0.02)
+            with lock:
+                in_flight.remove(offset)
+            ids = list(range(offset, min(offset + limit, 95)))
+            return {"products": [{"Identifier": i} for i in ids], "currentresults": len(ids), "totalresults": 95}
+        
+        mock = mocker.patch.object(resource, 'list', side_effect=mock_list)
+        
+        pages = list(resource.iter_pages(per_page=10, prefetch=4))
+        
+        assert [item["Identifier"] for page in pages for item in page] == list(range(95))
+        assert mock.call_count == 10
+        assert max(peak) > 1
+    
+    def test_list_all_prefetch_without_totalresults(self, mocker):
+        """Test prefetching falls back to serial paging when totals are unknown."""
+        resource = BaseResource("test_key")
+        resource.controller_name = "product"
+        
+        pages = [
+            {"products": [{"Identifier": 1}, {"Identifier": 2}], "currentresults": 2},
+            {"products": [{"Identifier": 3}], "currentresults": 1},
+        ]
+        mocker.patch.object(resource, 'list', side_effect=pages)
+        
+        results = resource.list_all(per_page=2, detail=False, prefetch=3)
+        assert [r["Identifier"] for r in results] == [1, 2, 3]
@@ -0,0 +1,231 @@
+"""Tests for the response cache."""
+
+import io
+from unittest.mock import Mock
+
+import pytest
+from wefact import WeFact
+from wefact.cache import MemoryBackend, ResponseCache, SQLiteBackend
+from wefact.enums import Action
+from wefact.exceptions import ServerError, ValidationError
+
+
+class Clock:
+    """Settable clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_client(mocker, cache, responses):
+    """Create a WeFact whose session returns `responses` and count the calls."""
+    client = WeFact(api_key="test_key", requests_per_minute=None, cache=cache)
+
+    def post(url, data, **kwargs):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = responses(data)
+        response.headers = {}
+        return response
+
+    return client, mocker.patch('wefact.request.requests.Session.post', side_effect=post)
+
+
+def product(data):
+    return {"status": "success", "product": {"Identifier": "1", "ProductName": "Hosting"}}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryBackend(maxsize=2)
+    else:
+        backend = SQLiteBackend(tmp_path / "cache.db", maxsize=2)
+    yield backend
+    backend.close()
+
+
+class TestBackends:
+    """Test the cache backends."""
+
+    def test_get_set(self, backend):
+        """Test stored values are returned until they expire."""
+        backend.set("a", "debtor", "1", expires=10)
+        assert backend.get("a", now=5) == "1"
+        assert backend.get("a", now=10) is None
+        assert backend.get("missing", now=0) is None
+
+    def test_lru_eviction(self, backend):
+        """Test the least recently used entry is evicted."""
+        assert backend.set("a", "debtor", "1", expires=10) == 0
+        backend.set("b", "debtor", "2", expires=10)
+        backend.get("a", now=0)
+        assert backend.set("c", "debtor", "3", expires=10) == 1
+        assert backend.get("b", now=0) is None
+        assert backend.get("a", now=0) == "1"
+        assert len(backend) == 2
+
+    def test_invalidate(self, backend):
+        """Test invalidating one controller or everything."""
+        backend.set("a", "debtor", "1", expires=10)
+        backend.set("b", "product", "2", expires=10)
+        assert backend.invalidate("debtor") == 1
+        assert backend.get("b", now=0) == "2"
+        assert backend.invalidate() == 1
+        assert len(backend) == 0
+
+    def test_sqlite_persists(self, tmp_path):
+        """Test entries survive reopening the database."""
+        SQLiteBackend(tmp_path / "cache.db").set("a", "debtor", "1", expires=10)
+        assert SQLiteBackend(tmp_path / "cache.db").get("a", now=0) == "1"
+
+
+    def test_backend_is_abstract(self):
+        """Test custom backends must implement the storage methods."""
+        from wefact.cache import CacheBackend
+
+        class Incomplete(CacheBackend):
+            def get(self, key, now):
+                return None
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+class TestResponseCacheKey:
+    """Test cache key normalization."""
+
+    def test_equal_calls_share_key(self):
+        """Test parameter order and integer identifiers do not matter."""
+        cache = ResponseCache()
+        first = cache.key("k", "product", Action.LIST, {"searchat": "ProductCode", "limit": 10})
+        second = cache.key("k", "product", "list", {"limit": "10", "searchat": "ProductCode"})
+        assert first == second
+        assert cache.key("k", "debtor", "show", {"Identifier": 1}) == cache.key("k", "debtor", "show", {"Identifier": "1"})
+
+    def test_key_is_scoped_per_account(self):
+        """Test API keys get separate entries, without storing the key."""
+        cache = ResponseCache()
+        key = cache.key("secret", "debtor", "show", {"Identifier": "1"})
+        assert "secret" not in key
+        assert key != cache.key("other", "debtor", "show", {"Identifier": "1"})
+
+    def test_uncached_calls(self):
+        """Test mutating actions, disabled controllers and uploads get no key."""
+        cache = ResponseCache(ttls={"invoice": 0})
+        assert cache.key("k", "debtor", "edit", {}) is None
+        assert cache.key("k", "invoice", "show", {}) is None
+        assert cache.key("k", "debtor", "show", {"Base64": io.BytesIO(b"x")}) is None
+
+
+class TestClientCache:
+    """Test caching in the request pipeline."""
+
+    def test_repeated_show_is_cached(self, mocker):
+        """Test an identical call is answered from the cache."""
+        client, post = make_client(mocker, True, product)
+        first = client.products.show(Identifier=1)
+        first["product"]["ProductName"] = "changed"
+        second = client.products.show(Identifier="1")
+        assert post.call_count == 1
+        assert second["product"]["ProductName"] == "Hosting"
+        assert client.cache.stats.hits == 1
+        assert client.cache.stats.misses == 1
+        assert client.cache.stats.hit_rate == 0.5
+
+    def test_mutating_actions_are_not_cached(self, mocker):
+        """Test only read-only actions are cached."""
+        client, post = make_client(mocker, True, product)
+        client.products.edit(Identifier=1, ProductName="A")
+        client.products.edit(Identifier=1, ProductName="A")
+        assert post.call_count == 2
+
+    def test_per_controller_ttl(self, mocker):
+        """Test entries expire after their controller's TTL."""
+        clock = Clock()
+        cache = ResponseCache(ttl=60, ttls={"product": 5}, clock=clock)
+        client, post = make_client(mocker, cache, product)
+        client.products.show(Identifier=1)
+        clock.now += 4
+        client.products.show(Identifier=1)
+        assert post.call_count == 1
+        clock.now += 1
+        client.products.show(Identifier=1)
+        assert post.call_count == 2
+
+    def test_errors_are_not_cached(self, mocker):
+        """Test failed calls are not stored."""
+        client, post = make_client(mocker, True, lambda data: {"status": "error", "errors": ["No"]})
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                client.products.show(Identifier=1)
+        assert post.call_count == 2
+        assert client.cache.stats.stores == 0
+
+    def test_cache_disabled_by_default(self, mocker):
+        """Test clients do not cache unless asked to."""
+        client, post = make_client(mocker, None, product)
+        client.products.show(Identifier=1)
+        client.products.show(Identifier=1)
+        assert post.call_count == 2
+        assert client.products.cache is None
+
+
+class TestInvalidation:
+    """Test mutating calls drop the cached responses they change."""
+
+    def test_affected_controllers(self):
+        """Test reads affect nothing and mutations their controller and related ones."""
+        cache = ResponseCache()
+        assert cache.affected("invoice", Action.SHOW) == ()
+        assert cache.affected("invoice", "download") == ()
+        assert cache.affected("invoice", "markaspaid") == ("invoice",)
+        assert cache.affected("group", "edit") == ("group", "debtor", "product")
+        assert cache.affected("transaction", "match") == ("transaction", "invoice", "creditinvoice")
+
+    def test_mutation_invalidates_controller(self, mocker):
+        """Test a successful mutation evicts the shows and lists of its controller only."""
+        client, post = make_client(mocker, True, product)
+        client.invoices.show(Identifier=1)
+        client.invoices.list()
+        client.products.show(Identifier=1)
+        client.invoices.mark_as_paid(Identifier=1)
+        client.invoices.show(Identifier=1)
+        client.invoices.list()
+        client.products.show(Identifier=1)
+        assert post.call_count == 6
+        assert client.cache.stats.invalidations == 2
+
+    def test_related_controllers_are_invalidated(self, mocker):
+        """Test editing a group evicts cached debtors."""
+        client, post = make_client(mocker, True, product)
+        client.debtors.show(Identifier=1)
+        client.groups.edit(Identifier=1, Debtors=[1])
+        client.debtors.show(Identifier=1)
+        assert post.call_count == 3
+
+    def test_failed_mutations(self, mocker):
+        """Test rejected mutations keep the cache, possibly applied ones invalidate it."""
+        client, post = make_client(mocker, True, product)
+        client.invoices.show(Identifier=1)
+        post.side_effect = [Mock(status_code=400, headers={}, json=Mock(return_value={"status": "error"}))]
+        with pytest.raises(ValidationError):
+            client.invoices.edit(Identifier=1)
+        assert client.cache.stats.invalidations == 0
+        post.side_effect = [Mock(status_code=502, headers={}, json=Mock(return_value={}))]
+        with pytest.raises(ServerError):
+            client.invoices.edit(Identifier=1)
+        assert client.cache.stats.invalidations == 1
+
+    def test_read_in_flight_is_not_stored(self):
+        """Test a response read before an invalidation is not cached after it."""
+        cache = ResponseCache()
+        key = cache.key("k", "invoice", "show", {"Identifier": "1"})
+        generation = cache.generation
+        cache.invalidate_after("invoice", "edit")
+        cache.set(key, "invoice", {"status": "success"}, generation)
+        assert cache.get(key) is None
+        cache.set(key, "invoice", {"status": "success"}, cache.generation)
+        assert cache.get(key) == {"status": "success"}
@@ -9,7 +9,7 @@ def client():
 
 def test_list_cost_categories(client, mocker):
     mock_response = {'costcategories': []}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -19,7 +19,7 @@ def test_list_cost_categories(client, mocker):
 
 def test_create_cost_category(client, mocker):
     mock_response = {'status': 'success', 'category': {'Identifier': 'CC1', 'Title': 'New Cost Category'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -29,7 +29,7 @@ def test_create_cost_category(client, mocker):
 
 def test_update_cost_category(client, mocker):
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -38,7 +38,7 @@ def test_update_cost_category(client, mocker):
 
 def test_show_cost_category(client, mocker):
     mock_response = {'status': 'success', 'category': {'Identifier': 'existing_category_id', 'Title': 'Title'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -47,7 +47,7 @@ def test_show_cost_category(client, mocker):
 
 def test_delete_cost_category(client, mocker):
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
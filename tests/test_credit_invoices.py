@@ -9,7 +9,7 @@ def test_list_credit_invoices(mocker):
         {'Identifier': 1, 'InvoiceCode': 'CI10001'},
         {'Identifier': 2, 'InvoiceCode': 'CI10002'}
     ]}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -19,7 +19,7 @@ def test_list_credit_invoices(mocker):
 def test_create_credit_invoice(mocker):
     client = WeFact(api_key='your_api_key')
     mock_response = {'status': 'success', 'credit_invoice': {'Identifier': 1, 'InvoiceCode': 'CI10001'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -30,7 +30,7 @@ def test_create_credit_invoice(mocker):
 def test_update_credit_invoice(mocker):
     client = WeFact(api_key='your_api_key')
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -40,7 +40,7 @@ def test_update_credit_invoice(mocker):
 def test_show_credit_invoice(mocker):
     client = WeFact(api_key='your_api_key')
     mock_response = {'status': 'success', 'credit_invoice': {'Identifier': 1, 'InvoiceCode': 'CI10001'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -50,7 +50,7 @@ def test_show_credit_invoice(mocker):
 def test_delete_credit_invoice(mocker):
     client = WeFact(api_key='your_api_key')
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -60,7 +60,7 @@ def test_delete_credit_invoice(mocker):
 def test_create_credit_invoice_error(mocker):
     client = WeFact(api_key='your_api_key')
     mock_response = {'status': 'error', 'errors': ['Invalid data']}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -14,7 +14,7 @@ def test_credit_invoice_part_payment(api_client, mocker):
             "AmountPaid": "50.00",
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -35,7 +35,7 @@ def test_credit_invoice_mark_as_paid(api_client, mocker):
             "Status": "paid",
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -55,7 +55,7 @@ def test_credit_invoice_line_add(api_client, mocker):
             "Identifier": "123",
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -76,7 +76,7 @@ def test_credit_invoice_line_delete(api_client, mocker):
             "Identifier": "123",
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -94,7 +94,7 @@ def test_credit_invoice_attachment_add(api_client, mocker):
         "action": "attachment_add",
         "status": "success"
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -115,7 +115,7 @@ def test_credit_invoice_attachment_delete(api_client, mocker):
         "action": "attachment_delete",
         "status": "success"
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -136,7 +136,7 @@ def test_credit_invoice_attachment_download(api_client, mocker):
         "status": "success",
         "Base64": "base64content"
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -10,7 +10,7 @@ def client():
 def test_creditor_attachments(client, mocker):
     mock_response = {"status": "success"}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type("R", (), {"status_code": 200, "json": staticmethod(lambda: mock_response)})(),
     )
     assert client.creditors.attachment_add(Identifier="CR1", FileName="x.txt", FileData="<base64>")["status"] == "success"
@@ -9,7 +9,7 @@ def client():
 
 def test_list_debtors(client, mocker):
     mock_response = {'debtors': [{'Identifier': 1, 'CompanyName': 'Test Company'}]}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -18,7 +18,7 @@ def test_list_debtors(client, mocker):
 
 def test_create_debtor(client, mocker):
     mock_response = {'status': 'success', 'debtor': {'Identifier': 1, 'CompanyName': 'New Company'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -27,7 +27,7 @@ def test_create_debtor(client, mocker):
 
 def test_update_debtor(client, mocker):
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -36,7 +36,7 @@ def test_update_debtor(client, mocker):
 
 def test_show_debtor(client, mocker):
     mock_response = {'debtor': {'Identifier': 1, 'CompanyName': 'Test Company'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -10,7 +10,7 @@ def client():
 def test_debtor_extra_client_contacts(client, mocker):
     mock_response = {"status": "success"}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type("R", (), {"status_code": 200, "json": staticmethod(lambda: mock_response)})(),
     )
     assert client.debtors.extra_client_contact_add(Identifier="DB1", Name="Jane")["status"] == "success"
@@ -21,7 +21,7 @@ def test_debtor_extra_client_contacts(client, mocker):
 def test_debtor_attachments(client, mocker):
     mock_response = {"status": "success"}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type("R", (), {"status_code": 200, "json": staticmethod(lambda: mock_response)})(),
     )
     assert client.debtors.attachment_add(Identifier="DB1", FileName="doc.pdf", FileData="<base64>")["status"] == "success"
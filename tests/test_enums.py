@@ -0,0 +1,74 @@
+"""Tests for enum lookup helpers."""
+
+import pytest
+from wefact.enums import (
+    CommunicationMethod,
+    InvoiceStatus,
+    PaymentMethod,
+    PricePeriod,
+    get_enum_name,
+    get_enum_names,
+    get_enum_value,
+    get_enum_values,
+)
+
+
+class TestGetEnumValue:
+    """Test get_enum_value function."""
+
+    @pytest.mark.parametrize("name_or_value", ["MONTHLY", "monthly", "MONTH", "m", PricePeriod.MONTHLY])
+    def test_names_values_and_aliases(self, name_or_value):
+        """Test values, case-insensitive names, aliases and members."""
+        assert get_enum_value(PricePeriod, name_or_value) == "m"
+
+    def test_values_match_before_names(self):
+        """Test an exact value wins over a partial name match."""
+        assert get_enum_value(PricePeriod, "") == ""
+        assert get_enum_value(PaymentMethod, "wire") == "wire"
+
+    def test_partial_name_match(self):
+        """Test the first member whose name contains the input is used."""
+        assert get_enum_value(PricePeriod, "M") == "m"
+        assert get_enum_value(PricePeriod, "yearl") == "h"
+        assert get_enum_value(PricePeriod, "yearl") == "h"
+
+    def test_invalid(self):
+        """Test unknown input raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid PricePeriod: x"):
+            get_enum_value(PricePeriod, "x")
+        with pytest.raises(ValueError):
+            get_enum_value(PricePeriod, ["m"])
+
+
+class TestGetEnumName:
+    """Test get_enum_name function."""
+
+    def test_canonical_name(self):
+        """Test the first defined name is returned for aliased values."""
+        assert get_enum_name(PricePeriod, "m") == "MONTHLY"
+        assert get_enum_name(InvoiceStatus, InvoiceStatus.DRAFT) == "CONCEPT"
+
+    def test_invalid(self):
+        """Test unknown values raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid PricePeriod value: MONTHLY"):
+            get_enum_name(PricePeriod, "MONTHLY")
+
+
+class TestBatchLookups:
+    """Test get_enum_values and get_enum_names functions."""
+
+    def test_get_enum_values(self):
+        """Test a column is mapped like single lookups."""
+        column = ["MONTHLY", "j", "year", "d"]
+        assert get_enum_values(PricePeriod, column) == [get_enum_value(PricePeriod, x) for x in column]
+
+    def test_get_enum_names(self):
+        """Test a column of values is mapped to names."""
+        assert get_enum_names(CommunicationMethod, iter(["email", "phone"])) == ["EMAIL", "PHONE"]
+
+    def test_invalid_raises_without_default(self):
+        """Test invalid items raise unless a default is given."""
+        with pytest.raises(ValueError):
+            get_enum_values(PricePeriod, ["m", "x"])
+        assert get_enum_values(PricePeriod, ["m", "x"], default=None) == ["m", None]
+        assert get_enum_names(InvoiceStatus, ["4", "99"], default="") == ["PAID", ""]
@@ -8,6 +8,7 @@ from wefact.exceptions import (
     ValidationError,
     ServerError,
     ClientError,
+    RateLimitError,
     from_response,
     raise_for_response,
     raise_for_wefact_payload,
@@ -145,6 +146,20 @@ class TestFromResponse:
         assert isinstance(error, ServerError)
         assert error.status == 500
     
+    def test_from_response_429(self):
+        """Test creating exception from 429 response with Retry-After."""
+        response = MockResponse(429, {"message": "Too many requests"}, headers={"Retry-After": "12"})
+        error = from_response(response)
+        assert isinstance(error, RateLimitError)
+        assert isinstance(error, ClientError)
+        assert error.retry_after == 12.0
+    
+    def test_from_response_retry_after_http_date(self):
+        """Test Retry-After given as an HTTP date."""
+        response = MockResponse(503, {"message": "Unavailable"}, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        error = from_response(response)
+        assert error.retry_after == 0.0
+    
     def test_from_response_with_errors_array(self):
         """Test creating exception from response with errors array."""
         response = MockResponse(400, {"errors": ["Error 1", "Error 2"]})
@@ -169,6 +184,25 @@ class TestFromResponse:
         error = from_response(response)
         assert error.request_id == "req-123"
 
+    def test_from_response_with_parsed_body(self):
+        """Test a pre-parsed body is used instead of decoding the response."""
+        response = MockResponse(404, {"message": "Not parsed"})
+        response.json = None
+        error = from_response(response, {"message": "Already parsed"})
+        assert isinstance(error, NotFoundError)
+        assert error.message == "Already parsed"
+
+    def test_from_response_reads_headers_in_place(self):
+        """Test headers are looked up without copying the mapping."""
+        class Headers(dict):
+            def __iter__(self):
+                raise AssertionError("headers copied")
+
+        response = MockResponse(429, {}, headers=Headers({"Retry-After": "3", "Request-Id": "r1"}))
+        error = from_response(response)
+        assert error.retry_after == 3.0
+        assert error.request_id == "r1"
+
 
 class TestRaiseForResponse:
     """Test raise_for_response function."""
@@ -0,0 +1,228 @@
+"""Tests for bulk PDF export."""
+
+import base64
+import io
+import json
+import zipfile
+from urllib.parse import parse_qs
+
+import pytest
+
+from wefact import WeFact
+from wefact.export import MANIFEST_NAME, document_name, export_pdfs
+from wefact_cli.export import main as export_main
+
+INVOICES = [
+    {"Identifier": str(i), "InvoiceCode": f"F2025-{i:04d}"} for i in range(1, 8)
+]
+
+
+def pdf(identifier):
+    return f"%PDF-1.4 invoice {identifier} ".encode() * 50
+
+
+class FakeResponse:
+    """Response to a list (parsed) or download (streamed) request."""
+
+    status_code = 200
+    headers = {}
+
+    def __init__(self, document):
+        self.body = json.dumps(document).replace("/", "\\/").encode()
+        self.text = self.body.decode()
+
+    def json(self):
+        return json.loads(self.body)
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), 64):
+            yield self.body[start:start + 64]
+
+    def close(self):
+        pass
+
+
+class FakeAPI:
+    """Serves invoice listings and downloads; some identifiers fail."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.corrupt = set()
+        self.interrupt = set()
+        self.downloads = []
+
+    def __call__(self, url, data=None, **kwargs):
+        form = {k: v[0] for k, v in parse_qs(data).items()}
+        if form["action"] == "list":
+            offset, limit = int(form.get("offset", 0)), int(form.get("limit", 1000))
+            page = INVOICES[offset:offset + limit]
+            return FakeResponse({
+                "status": "success", "totalresults": len(INVOICES),
+                "currentresults": len(page), "invoices": page,
+            })
+        identifier = form["Identifier"]
+        self.downloads.append(identifier)
+        if identifier in self.failing:
+            return FakeResponse({"status": "error", "errors": [f"Invoice {identifier} not found"]})
+        if identifier in self.interrupt:
+            raise KeyboardInterrupt
+        if identifier in self.corrupt:
+            return FakeResponse({"status": "success", "invoice": {"Filename": "x.pdf", "Base64": "QUJDA"}})
+        return FakeResponse({
+            "status": "success",
+            "invoice": {"Filename": f"{identifier}.pdf", "Base64": base64.b64encode(pdf(identifier)).decode()},
+        })
+
+
+@pytest.fixture
+def client():
+    with WeFact(api_key="test_key", requests_per_minute=None) as client:
+        yield client
+
+
+@pytest.fixture
+def api(mocker):
+    api = FakeAPI(failing={"3"})
+    mocker.patch("wefact.request.requests.Session.post", side_effect=api)
+    return api
+
+
+def test_document_name():
+    assert document_name({"Identifier": "1", "InvoiceCode": "F2025/01"}) == "F2025_01.pdf"
+    assert document_name({"Identifier": "9", "PriceQuoteCode": "OF0001"}) == "OF0001.pdf"
+    assert document_name({"Identifier": 9}) == "9.pdf"
+
+
+def test_export_to_directory_and_resume(tmp_path, client, api):
+    result = export_pdfs(client.invoices, tmp_path / "out", workers=3, status=4)
+
+    assert result.exported == 6
+    assert list(result.failed) == ["3"]
+    assert (tmp_path / "out" / "F2025-0001.pdf").read_bytes() == pdf("1")
+    assert not (tmp_path / "out" / "F2025-0003.pdf").exists()
+    manifest = (tmp_path / "out" / MANIFEST_NAME).read_text().splitlines()
+    assert len(manifest) == 6
+
+    # The next run only retries the failed document
+    api.failing.clear()
+    api.downloads.clear()
+    result = export_pdfs(client.invoices, tmp_path / "out", workers=3, status=4)
+    assert (result.exported, result.skipped, result.failed) == (1, 6, {})
+    assert api.downloads == ["3"]
+
+
+def test_deleted_file_is_exported_again(tmp_path, client, api):
+    export_pdfs(client.invoices, tmp_path, ["1", "2"])
+    (tmp_path / "1.pdf").unlink()
+    result = export_pdfs(client.invoices, tmp_path, ["1", "2"])
+    assert (result.exported, result.skipped) == (1, 1)
+
+
+def test_export_to_zip_and_resume(tmp_path, client, api):
+    archive_path = tmp_path / "invoices.zip"
+    result = export_pdfs(client.invoices, archive_path, workers=4)
+    assert result.exported == 6
+
+    api.failing.clear()
+    result = export_pdfs(client.invoices, archive_path, workers=4)
+    assert (result.exported, result.skipped) == (1, 6)
+
+    with zipfile.ZipFile(archive_path) as archive:
+        assert sorted(archive.namelist()) == [f"F2025-{i:04d}.pdf" for i in range(1, 8)]
+        assert archive.read("F2025-0003.pdf") == pdf("3")
+    # Only the archive and its manifest remain
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["invoices.zip", "invoices.zip.manifest.jsonl"]
+
+
+def test_export_zip_to_unseekable_stream(client, api):
+    class Unseekable(io.RawIOBase):
+        def __init__(self):
+            self.data = bytearray()
+
+        def writable(self):
+            return True
+
+        def write(self, chunk):
+            self.data += chunk
+            return len(chunk)
+
+    out = Unseekable()
+    result = export_pdfs(client.invoices, out, ["1", "2"], workers=2)
+
+    assert result.exported == 2
+    with zipfile.ZipFile(io.BytesIO(bytes(out.data))) as archive:
+        assert archive.read("2.pdf") == pdf("2")
+
+
+def test_incomplete_archive_is_not_overwritten(tmp_path, client, api):
+    archive_path = tmp_path / "invoices.zip"
+    archive_path.write_bytes(b"PK\x03\x04 cut short")
+    with pytest.raises(ValueError, match="not a complete ZIP archive"):
+        export_pdfs(client.invoices, archive_path, ["1"])
+
+
+
+def test_interrupted_zip_export_resumes(tmp_path, client, api):
+    archive_path = tmp_path / "invoices.zip"
+    partial = tmp_path / "invoices.zip.part"
+    api.interrupt.add("4")
+    with pytest.raises(KeyboardInterrupt):
+        export_pdfs(client.invoices, archive_path, ["1", "2", "4", "5"], workers=1)
+
+    # The archive is only moved into place once the export completes
+    assert not archive_path.exists()
+    with zipfile.ZipFile(partial) as archive:
+        done = archive.namelist()
+    assert "1.pdf" in done and "4.pdf" not in done
+
+    api.interrupt.clear()
+    result = export_pdfs(client.invoices, archive_path, ["1", "2", "4", "5"], workers=1)
+    assert (result.exported, result.skipped) == (4 - len(done), len(done))
+    assert not partial.exists()
+    with zipfile.ZipFile(archive_path) as archive:
+        assert sorted(archive.namelist()) == ["1.pdf", "2.pdf", "4.pdf", "5.pdf"]
+
+
+def test_unreadable_partial_archive_starts_over(tmp_path, client, api):
+    archive_path = tmp_path / "invoices.zip"
+    (tmp_path / "invoices.zip.part").write_bytes(b"PK\x03\x04 killed")
+    (tmp_path / "invoices.zip.manifest.jsonl").write_text('{"Identifier": "1", "name": "1.pdf"}\n')
+
+    result = export_pdfs(client.invoices, archive_path, ["1", "2"])
+
+    assert (result.exported, result.skipped) == (2, 0)
+    with zipfile.ZipFile(archive_path) as archive:
+        assert sorted(archive.namelist()) == ["1.pdf", "2.pdf"]
+
+
+def test_failed_document_does_not_stop_export(tmp_path, client, api):
+    api.corrupt.add("2")
+    # A directory in the way makes writing 4.pdf fail with an OSError
+    (tmp_path / "4.pdf").mkdir()
+    result = export_pdfs(client.invoices, tmp_path, ["1", "2", "4", "5"], workers=2)
+
+    assert result.exported == 2
+    assert sorted(result.failed) == ["2", "4"]
+    assert sorted(p.name for p in tmp_path.glob("*.pdf") if p.is_file()) == ["1.pdf", "5.pdf"]
+
+class TestExportCommand:
+    def test_export_ids(self, tmp_path, api, monkeypatch, capsys):
+        monkeypatch.setenv("WEFACT_API_KEY", "test_key")
+        ids_file = tmp_path / "ids.txt"
+        ids_file.write_text("2\n\n4\n")
+
+        status = export_main(["invoices", str(tmp_path / "out"), "--id", "1", "--ids-file", str(ids_file)])
+
+        assert status == 0
+        assert sorted(p.name for p in (tmp_path / "out").glob("*.pdf")) == ["1.pdf", "2.pdf", "4.pdf"]
+        assert "Exported 3" in capsys.readouterr().err
+
+    def test_failures_set_exit_status(self, tmp_path, api, capsys):
+        status = export_main(["invoices", str(tmp_path / "out.zip"), "--api-key", "k", "--filter", "status=4"])
+        assert status == 1
+        assert "Invoice 3 not found" in capsys.readouterr().err
+
+    def test_invalid_filter(self, tmp_path, capsys):
+        with pytest.raises(SystemExit):
+            export_main(["invoices", str(tmp_path), "--api-key", "k", "--filter", "status"])
+        assert "KEY=VALUE" in capsys.readouterr().err
@@ -9,7 +9,7 @@ def client():
 
 def test_list_groups(client, mocker):
     mock_response = {'groups': [{'Identifier': 1, 'GroupName': 'Test Group'}]}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -20,7 +20,7 @@ def test_list_groups(client, mocker):
 
 def test_create_group(client, mocker):
     mock_response = {'status': 'success', 'group': {'Identifier': 'G1', 'GroupName': 'Test Group'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -31,7 +31,7 @@ def test_create_group(client, mocker):
 
 def test_update_group(client, mocker):
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -41,7 +41,7 @@ def test_update_group(client, mocker):
 
 def test_show_group(client, mocker):
     mock_response = {'status': 'success', 'group': {'Identifier': 'group_id', 'GroupName': 'Group'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -52,7 +52,7 @@ def test_show_group(client, mocker):
 
 def test_delete_group(client, mocker):
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -0,0 +1,116 @@
+"""Tests for the code/Identifier index."""
+
+import json
+from unittest.mock import Mock
+from urllib.parse import parse_qs
+
+import pytest
+from wefact import WeFact
+from wefact.exceptions import ClientError
+from wefact.identifiers import IdentifierIndex
+
+DEBTORS = [
+    {"Identifier": "1", "DebtorCode": "DB10000"},
+    {"Identifier": "2", "DebtorCode": "DB10001"},
+]
+
+
+def api(data):
+    """Answer debtor list/show calls from DEBTORS."""
+    params = {k: v[0] for k, v in parse_qs(data).items()}
+    if params["action"] == "list":
+        offset = int(params.get("offset", 0))
+        page = DEBTORS[offset:offset + int(params.get("limit", 1000))]
+        return {"status": "success", "totalresults": len(DEBTORS), "currentresults": len(page), "debtors": page}
+    for debtor in DEBTORS:
+        if params.get("Identifier") == debtor["Identifier"] or params.get("DebtorCode") == debtor["DebtorCode"]:
+            return {"status": "success", "debtor": debtor}
+    return {"status": "error", "errors": ["Debtor not found"]}
+
+
+def make_client(mocker, identifiers=True):
+    """Create a WeFact answering from DEBTORS and count the calls."""
+    client = WeFact(api_key="test_key", requests_per_minute=None, identifiers=identifiers)
+
+    def post(url, data, **kwargs):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = api(data)
+        response.headers = {}
+        return response
+
+    return client, mocker.patch('wefact.request.requests.Session.post', side_effect=post)
+
+
+class TestIdentifierIndex:
+    """Test the index itself."""
+
+    def test_add_and_lookup(self):
+        """Test both directions, string normalization and code changes."""
+        index = IdentifierIndex()
+        index.add("debtor", 1, "DB10000")
+        assert index.identifier("debtor", "DB10000") == "1"
+        assert index.code("debtor", "1") == "DB10000"
+        index.add("debtor", 1, "DB20000")
+        assert index.identifier("debtor", "DB10000") is None
+        assert index.code("debtor", 1) == "DB20000"
+        index.discard("debtor", 1)
+        assert len(index) == 0
+
+    def test_save_and_load(self, tmp_path):
+        """Test the index survives a restart."""
+        path = tmp_path / "ids.json"
+        index = IdentifierIndex(path)
+        index.update("invoice", [{"Identifier": "7", "InvoiceCode": "INV10007"}])
+        index.save()
+        assert json.loads(path.read_text())["controllers"] == {"invoice": {"INV10007": "7"}}
+        assert IdentifierIndex(path).identifier("invoice", "INV10007") == "7"
+
+    def test_save_without_path(self):
+        """Test saving needs a path."""
+        with pytest.raises(ValueError):
+            IdentifierIndex().save()
+
+
+class TestClientIndex:
+    """Test the index attached to a client."""
+
+    def test_filled_from_list_pages(self, mocker):
+        """Test listing fills the index and resolve() then needs no request."""
+        client, post = make_client(mocker)
+        list(client.debtors.iter_pages(per_page=1))
+        calls = post.call_count
+        assert client.debtors.resolve("DB10001") == "2"
+        assert client.debtors.resolve_code(1) == "DB10000"
+        assert post.call_count == calls
+
+    def test_resolve_miss_uses_show(self, mocker):
+        """Test a miss is looked up once and then indexed."""
+        client, post = make_client(mocker)
+        assert client.debtors.resolve("DB10001") == "2"
+        assert client.debtors.resolve("DB10001") == "2"
+        assert client.debtors.resolve_code("2") == "DB10001"
+        assert post.call_count == 1
+
+    def test_resolve_without_index(self, mocker):
+        """Test resolve() works without an index, always asking the API."""
+        client, post = make_client(mocker, identifiers=None)
+        assert client.identifiers is None
+        assert client.debtors.resolve("DB10000") == "1"
+        assert client.debtors.resolve("DB10000") == "1"
+        assert post.call_count == 2
+
+    def test_refresh_prunes(self, mocker):
+        """Test a full refresh forgets items that are no longer listed."""
+        client, post = make_client(mocker)
+        client.identifiers.add("debtor", "99", "DB99999")
+        assert client.identifiers.refresh(client.debtors, prune=True) == 2
+        assert client.identifiers.identifier("debtor", "DB99999") is None
+        assert len(client.identifiers) == 2
+
+    def test_resource_without_codes(self, mocker):
+        """Test resources without business codes cannot resolve."""
+        client, post = make_client(mocker)
+        with pytest.raises(ClientError):
+            client.groups.resolve("G1")
+        post.assert_not_called()
@@ -0,0 +1,65 @@
+"""Tests for lazy imports and package import time."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import wefact
+import wefact.enums
+import wefact.resources
+
+
+def loaded_modules(code):
+    """Run `code` in a fresh interpreter and return the names in sys.modules."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport json, sys; print(json.dumps(list(sys.modules)))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+class TestImportTime:
+    """Test that `import wefact` defers heavy modules."""
+
+    def test_import_defers_dependencies(self):
+        """Test requests, httpx, sqlite3 and resource/enum modules are not loaded."""
+        modules = loaded_modules("import wefact")
+        assert "wefact" in modules
+        for name in ("requests", "urllib3", "httpx", "sqlite3", "wefact.request",
+                     "wefact.resources.invoice", "wefact.enums.variables"):
+            assert name not in modules
+
+    def test_sync_client_does_not_load_async_modules(self):
+        """Test the sync client imports only the resources it uses."""
+        modules = loaded_modules("from wefact import WeFact; WeFact(api_key='key').invoices")
+        assert "wefact.resources.invoice" in modules
+        assert "wefact.resources.quote" not in modules
+        assert "httpx" not in modules
+
+
+class TestLazyAttributes:
+    """Test lazily imported names behave like regular attributes."""
+
+    @pytest.mark.parametrize("package", [wefact, wefact.enums, wefact.resources])
+    def test_all_names_resolve(self, package):
+        """Test every name in __all__ can be imported and is listed by dir()."""
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+            assert name in dir(package)
+
+    @pytest.mark.parametrize("package", [wefact, wefact.enums, wefact.resources])
+    def test_unknown_name(self, package):
+        """Test unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            package.DoesNotExist
+
+    def test_request_module_exposes_requests(self):
+        """Test `wefact.request.requests` stays available as a patch target."""
+        import requests
+        from wefact import request
+
+        assert request.requests is requests
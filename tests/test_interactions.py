@@ -10,7 +10,7 @@ def client():
 def test_list_interactions(client, mocker):
     mock_response = {"interactions": []}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type(
             "R",
             (),
@@ -28,7 +28,7 @@ def test_list_interactions(client, mocker):
 def test_add_interaction(client, mocker):
     mock_response = {"status": "success", "interaction": {"Identifier": "I1"}}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type(
             "R",
             (),
@@ -46,7 +46,7 @@ def test_add_interaction(client, mocker):
 def test_edit_interaction(client, mocker):
     mock_response = {"status": "success"}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type(
             "R",
             (),
@@ -63,7 +63,7 @@ def test_edit_interaction(client, mocker):
 def test_show_interaction(client, mocker):
     mock_response = {"status": "success", "interaction": {"Identifier": "I1"}}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type(
             "R",
             (),
@@ -81,7 +81,7 @@ def test_show_interaction(client, mocker):
 def test_attachment_actions(client, mocker):
     mock_response = {"status": "success"}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type(
             "R",
             (),
@@ -9,7 +9,7 @@ def client():
 
 def test_list_invoices(client, mocker):
     mock_response = {'invoices': []}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -19,7 +19,7 @@ def test_list_invoices(client, mocker):
 
 def test_create_invoice(client, mocker):
     mock_response = {'status': 'success', 'invoice': {'Identifier': 'INV10000'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -33,7 +33,7 @@ def test_create_invoice(client, mocker):
 def test_show_invoice(client, mocker):
     invoice_id = 'INV10000'
     mock_response = {'status': 'success', 'invoice': {'Identifier': invoice_id}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -44,7 +44,7 @@ def test_show_invoice(client, mocker):
 def test_update_invoice(client, mocker):
     invoice_id = 'INV10000'
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -57,7 +57,7 @@ def test_update_invoice(client, mocker):
 def test_delete_invoice(client, mocker):
     invoice_id = 'INV10000'
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -68,7 +68,7 @@ def test_delete_invoice(client, mocker):
 def test_invoice_credit(client, mocker):
     """Test creating a credit invoice."""
     mock_response = {'status': 'success', 'invoice': {'Identifier': 'INV10001'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -79,7 +79,7 @@ def test_invoice_credit(client, mocker):
 def test_invoice_part_payment(client, mocker):
     """Test recording partial payment."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -90,7 +90,7 @@ def test_invoice_part_payment(client, mocker):
 def test_invoice_mark_as_paid(client, mocker):
     """Test marking invoice as paid."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -101,7 +101,7 @@ def test_invoice_mark_as_paid(client, mocker):
 def test_invoice_mark_as_unpaid(client, mocker):
     """Test marking invoice as unpaid."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -112,7 +112,7 @@ def test_invoice_mark_as_unpaid(client, mocker):
 def test_invoice_send_by_email(client, mocker):
     """Test sending invoice by email."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -123,7 +123,7 @@ def test_invoice_send_by_email(client, mocker):
 def test_invoice_send_reminder_by_email(client, mocker):
     """Test sending reminder email."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -134,7 +134,7 @@ def test_invoice_send_reminder_by_email(client, mocker):
 def test_invoice_send_summation_by_email(client, mocker):
     """Test sending summation email."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -145,7 +145,7 @@ def test_invoice_send_summation_by_email(client, mocker):
 def test_invoice_download(client, mocker):
     """Test downloading invoice PDF."""
     mock_response = {'status': 'success', 'invoice': {'Base64': 'base64data'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -156,7 +156,7 @@ def test_invoice_download(client, mocker):
 def test_invoice_block(client, mocker):
     """Test blocking invoice."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -167,7 +167,7 @@ def test_invoice_block(client, mocker):
 def test_invoice_unblock(client, mocker):
     """Test unblocking invoice."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -178,7 +178,7 @@ def test_invoice_unblock(client, mocker):
 def test_invoice_schedule(client, mocker):
     """Test scheduling invoice."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -189,7 +189,7 @@ def test_invoice_schedule(client, mocker):
 def test_invoice_cancel_schedule(client, mocker):
     """Test canceling invoice schedule."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -200,7 +200,7 @@ def test_invoice_cancel_schedule(client, mocker):
 def test_invoice_payment_process_pause(client, mocker):
     """Test pausing payment process."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -211,7 +211,7 @@ def test_invoice_payment_process_pause(client, mocker):
 def test_invoice_payment_process_reactivate(client, mocker):
     """Test reactivating payment process."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -222,7 +222,7 @@ def test_invoice_payment_process_reactivate(client, mocker):
 def test_invoice_sort_lines(client, mocker):
     """Test sorting invoice lines."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -233,7 +233,7 @@ def test_invoice_sort_lines(client, mocker):
 def test_invoice_line_add(client, mocker):
     """Test adding invoice lines."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -244,7 +244,7 @@ def test_invoice_line_add(client, mocker):
 def test_invoice_line_delete(client, mocker):
     """Test deleting invoice lines."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -255,7 +255,7 @@ def test_invoice_line_delete(client, mocker):
 def test_invoice_attachment_add(client, mocker):
     """Test adding attachment to invoice."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -266,7 +266,7 @@ def test_invoice_attachment_add(client, mocker):
 def test_invoice_attachment_delete(client, mocker):
     """Test deleting attachment from invoice."""
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -277,7 +277,7 @@ def test_invoice_attachment_delete(client, mocker):
 def test_invoice_attachment_download(client, mocker):
     """Test downloading attachment from invoice."""
     mock_response = {'status': 'success', 'Base64': 'base64data'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -9,7 +9,7 @@ def client():
 
 def test_list_products(client, mocker):
     mock_response = {'products': []}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -19,7 +19,7 @@ def test_list_products(client, mocker):
 
 def test_create_product(client, mocker):
     mock_response = {'status': 'success', 'product': {'Identifier': 'P0001', 'ProductName': 'Test Product'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -29,7 +29,7 @@ def test_create_product(client, mocker):
 
 def test_update_product(client, mocker):
     mock_response = {'status': 'success', 'product': {'Identifier': 'P0001', 'ProductName': 'Updated Product'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -39,7 +39,7 @@ def test_update_product(client, mocker):
 
 def test_show_product(client, mocker):
     mock_response = {'status': 'success', 'product': {'Identifier': 'P0001'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -49,7 +49,7 @@ def test_show_product(client, mocker):
 
 def test_delete_product(client, mocker):
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -10,7 +10,7 @@ def client():
 def test_list_quotes(client, mocker):
     mock_response = {"pricequotes": []}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type("R", (), {"status_code": 200, "json": staticmethod(lambda: mock_response)})(),
     )
     resp = client.quotes.list()
@@ -21,7 +21,7 @@ def test_list_quotes(client, mocker):
 def test_create_quote(client, mocker):
     mock_response = {"status": "success", "pricequote": {"Identifier": "Q0001"}}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type("R", (), {"status_code": 200, "json": staticmethod(lambda: mock_response)})(),
     )
     resp = client.quotes.create(DebtorCode="DB10000", PriceQuoteLines=[{"Description": "Setup", "PriceExcl": 50}])
@@ -32,7 +32,7 @@ def test_create_quote(client, mocker):
 def test_accept_quote(client, mocker):
     mock_response = {"status": "success"}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type("R", (), {"status_code": 200, "json": staticmethod(lambda: mock_response)})(),
     )
     resp = client.quotes.accept(Identifier="Q0001")
@@ -42,7 +42,7 @@ def test_accept_quote(client, mocker):
 def test_quote_attachments(client, mocker):
     mock_response = {"status": "success"}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type("R", (), {"status_code": 200, "json": staticmethod(lambda: mock_response)})(),
     )
     assert client.quotes.attachment_add(Identifier="Q0001", FileName="terms.pdf", FileData="<base64>")["status"] == "success"
@@ -10,7 +10,7 @@ def test_quote_send_by_email(api_client, mocker):
         "action": "send_by_email",
         "status": "success"
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -28,7 +28,7 @@ def test_quote_download(api_client, mocker):
         "status": "success",
         "Base64": "pdfbase64content"
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -49,7 +49,7 @@ def test_quote_schedule(api_client, mocker):
             "ScheduledAt": "2025-02-01 10:00:00"
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
     
     result = api_client.quotes.schedule(Identifier=123, ScheduledAt="2025-02-01 10:00:00")
     
@@ -68,7 +68,7 @@ def test_quote_cancel_schedule(api_client, mocker):
             "ScheduledAt": None
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
     
     result = api_client.quotes.cancel_schedule(Identifier=123)
     
@@ -87,7 +87,7 @@ def test_quote_accept(api_client, mocker):
             "Status": "accepted"
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
     
     result = api_client.quotes.accept(Identifier=123)
     
@@ -106,7 +106,7 @@ def test_quote_decline(api_client, mocker):
             "Status": "declined"
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
     
     result = api_client.quotes.decline(Identifier=123)
     
@@ -125,7 +125,7 @@ def test_quote_archive(api_client, mocker):
             "Archived": True
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
     
     result = api_client.quotes.archive(Identifier=123)
     
@@ -143,7 +143,7 @@ def test_quote_sort_lines(api_client, mocker):
             "Identifier": "123"
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
     
     lines = [{"Identifier": 456}, {"Identifier": 789}]
     result = api_client.quotes.sort_lines(Identifier=123, PriceQuoteLines=lines)
@@ -162,7 +162,7 @@ def test_quote_line_add(api_client, mocker):
             "Identifier": "123"
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
     
     lines = [{"Description": "Product A", "PriceExcl": 100.00}]
     result = api_client.quotes.price_quote_line_add(Identifier=123, PriceQuoteLines=lines)
@@ -181,7 +181,7 @@ def test_quote_line_delete(api_client, mocker):
             "Identifier": "123"
         }
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
     
     lines = [{"Identifier": 456}]
     result = api_client.quotes.price_quote_line_delete(Identifier=123, PriceQuoteLines=lines)
@@ -197,7 +197,7 @@ def test_quote_attachment_add(api_client, mocker):
         "action": "attachment_add",
         "status": "success"
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
     
     result = api_client.quotes.attachment_add(
         ReferenceIdentifier=123,
@@ -215,7 +215,7 @@ def test_quote_attachment_delete(api_client, mocker):
         "action": "attachment_delete",
         "status": "success"
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
     
     result = api_client.quotes.attachment_delete(
         ReferenceIdentifier=123,
@@ -233,7 +233,7 @@ def test_quote_attachment_download(api_client, mocker):
         "status": "success",
         "Base64": "base64content"
     }
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {'status_code': 200, 'json': staticmethod(lambda: mock_response)}))
     
     result = api_client.quotes.attachment_download(
         ReferenceIdentifier=123,
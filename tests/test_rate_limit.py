@@ -0,0 +1,254 @@
+"""Tests for the token bucket rate limiter."""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+from wefact import WeFact
+from wefact.rate_limit import FileLockBackend, StoreBackend, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    """Test TokenBucket behaviour."""
+    
+    def test_invalid_configuration(self):
+        """Test rate and burst are validated."""
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+        with pytest.raises(ValueError):
+            TokenBucket(1, burst=0)
+    
+    def test_burst_is_available_immediately(self):
+        """Test a full bucket serves `burst` requests without waiting."""
+        bucket = TokenBucket(5, burst=3, clock=FakeClock())
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    
+    def test_waits_are_spaced_by_rate(self):
+        """Test requests beyond the burst wait for refills in arrival order."""
+        bucket = TokenBucket(5, burst=1, clock=FakeClock())
+        waits = [bucket.reserve() for _ in range(4)]
+        assert waits == pytest.approx([0, 0.2, 0.4, 0.6])
+    
+    def test_refill_over_time(self):
+        """Test tokens refill with elapsed time, capped at burst."""
+        clock = FakeClock()
+        bucket = TokenBucket(5, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.now = 10.0
+        assert bucket.try_acquire()
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+    
+    def test_non_blocking_acquire(self):
+        """Test non-blocking acquire fails without taking tokens."""
+        bucket = TokenBucket(5, burst=1, clock=FakeClock())
+        assert bucket.acquire(blocking=False)
+        assert not bucket.acquire(blocking=False)
+        assert bucket.stats.rejected == 1
+    
+    def test_timeout(self, mocker):
+        """Test acquire refuses waits longer than timeout."""
+        sleep = mocker.patch('wefact.rate_limit.time.sleep')
+        bucket = TokenBucket(1, burst=1, clock=FakeClock())
+        assert bucket.acquire()
+        assert not bucket.acquire(timeout=0.5)
+        assert bucket.acquire(timeout=2)
+        sleep.assert_called_once_with(pytest.approx(1.0))
+    
+    def test_stats(self, mocker):
+        """Test metrics record acquisitions and time spent waiting."""
+        mocker.patch('wefact.rate_limit.time.sleep')
+        bucket = TokenBucket(2, burst=1, clock=FakeClock())
+        for _ in range(3):
+            bucket.acquire()
+        stats = bucket.stats
+        assert stats.acquired == 3
+        assert stats.waited == 2
+        assert stats.wait_time == pytest.approx(0.5 + 1.0)
+    
+    def test_per_minute(self):
+        """Test requests-per-minute construction."""
+        bucket = TokenBucket.per_minute(300, burst=5)
+        assert bucket.rate == 5
+        assert bucket.burst == 5
+    
+    def test_acquire_async(self):
+        """Test awaitable acquire."""
+        bucket = TokenBucket(1000, burst=1)
+        assert asyncio.run(bucket.acquire_async())
+        assert not asyncio.run(bucket.acquire_async(timeout=0))
+
+
+class TestClientRateLimiting:
+    """Test the limiter is shared and enforced by the client."""
+    
+    def test_default_limiter(self):
+        """Test the client limits to 300 requests per minute by default."""
+        client = WeFact(api_key="test_key")
+        assert client.rate_limiter.rate == 5
+        assert client.invoices.rate_limiter is client.rate_limiter
+        assert client.debtors.rate_limiter is client.rate_limiter
+    
+    def test_disable_limiter(self):
+        """Test requests_per_minute=None disables rate limiting."""
+        client = WeFact(api_key="test_key", requests_per_minute=None)
+        assert client.rate_limiter is None
+    
+    def test_shared_limiter(self):
+        """Test a limiter instance can be shared between clients."""
+        limiter = TokenBucket(10)
+        a = WeFact(api_key="a", rate_limiter=limiter)
+        b = WeFact(api_key="b", rate_limiter=limiter)
+        assert a.rate_limiter is b.rate_limiter is limiter
+    
+    def test_every_request_takes_a_token(self, mocker):
+        """Test _send_request acquires a token for every controller/action."""
+        client = WeFact(api_key="test_key", requests_per_minute=6000, burst=100)
+        response = Mock(status_code=200)
+        response.json.return_value = {"status": "success"}
+        mocker.patch('wefact.request.requests.Session.post', return_value=response)
+        
+        client.invoices.list()
+        client.debtors.show(Identifier=1)
+        client.transactions.match(Identifier=1)
+        
+        assert client.rate_limiter.stats.acquired == 3
+    
+    def test_standalone_resource_is_throttled(self, mocker):
+        """Test a resource created without a client gets the default budget."""
+        from wefact.resources import InvoiceResource
+        resource = InvoiceResource("test_key")
+        assert resource.rate_limiter.rate == pytest.approx(300 / 60)
+        assert resource.rate_limiter.burst == 5
+        
+        response = Mock(status_code=200)
+        response.json.return_value = {"status": "success"}
+        mocker.patch('wefact.request.requests.post', return_value=response)
+        sleep = mocker.patch('wefact.rate_limit.time.sleep')
+        
+        for _ in range(7):
+            resource.list()
+        
+        assert sleep.call_count == 2
+        assert resource.rate_limiter.stats.waited == 2
+    
+    def test_standalone_resource_without_limit(self, mocker):
+        """Test requests_per_minute=None disables a standalone resource's limiter."""
+        from wefact.resources import InvoiceResource
+        resource = InvoiceResource("test_key", requests_per_minute=None)
+        assert resource.rate_limiter is None
+        
+        response = Mock(status_code=200)
+        response.json.return_value = {"status": "success"}
+        mocker.patch('wefact.request.requests.post', return_value=response)
+        sleep = mocker.patch('wefact.rate_limit.time.sleep')
+        
+        for _ in range(7):
+            resource.list()
+        
+        sleep.assert_not_called()
+
+
+def _reserve_in_process(path, count, queue):
+    """Reserve `count` tokens from a file-backed bucket in a child process."""
+    from wefact.rate_limit import FileLockBackend, TokenBucket
+    bucket = TokenBucket(0.001, burst=5, backend=FileLockBackend(path))
+    queue.put(sum(bucket.try_acquire() for _ in range(count)))
+
+
+class DictStore:
+    """Local stand-in for a Redis-like store."""
+
+    def __init__(self):
+        import threading
+        self.data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value.encode()
+
+    def lock(self, name):
+        return self._lock
+
+
+class TestBackends:
+    """Test shared rate limiter backends."""
+    
+    def test_file_backend_shared_between_instances(self, tmp_path):
+        """Test two limiters on one file draw from the same budget."""
+        path = tmp_path / "bucket"
+        a = TokenBucket(0.001, burst=3, backend=FileLockBackend(path))
+        b = TokenBucket(0.001, burst=3, backend=FileLockBackend(path))
+        results = [a.try_acquire(), b.try_acquire(), a.try_acquire(), b.try_acquire()]
+        assert results == [True, True, True, False]
+    
+    def test_file_backend_across_processes(self, tmp_path):
+        """Test processes sharing a state file never exceed the burst together."""
+        import multiprocessing
+        
+        path = str(tmp_path / "bucket")
+        ctx = multiprocessing.get_context("spawn")
+        queue = ctx.Queue()
+        procs = [ctx.Process(target=_reserve_in_process, args=(path, 4, queue)) for _ in range(3)]
+        for proc in procs:
+            proc.start()
+        granted = sum(queue.get(timeout=30) for _ in procs)
+        for proc in procs:
+            proc.join()
+        assert granted == 5
+    
+    def test_store_backend(self):
+        """Test a Redis-like store backend shares one budget."""
+        store = DictStore()
+        a = TokenBucket(0.001, burst=2, backend=StoreBackend(store, "key"))
+        b = TokenBucket(0.001, burst=2, backend=StoreBackend(store, "key"))
+        assert a.try_acquire()
+        assert b.try_acquire()
+        assert not a.try_acquire()
+        assert b"key" not in store.data and "key" in store.data
+    
+    def test_client_backend(self, tmp_path):
+        """Test the client builds its limiter on the given backend."""
+        backend = FileLockBackend(tmp_path / "bucket")
+        client = WeFact(api_key="test_key", rate_limit_backend=backend)
+        assert client.rate_limiter.backend is backend
+        assert client.invoices.rate_limiter.backend is backend
+    
+    def test_backend_is_abstract(self):
+        """Test backends must implement reserve()."""
+        from wefact.rate_limit import RateLimitBackend
+        
+        class Incomplete(RateLimitBackend):
+            pass
+        
+        with pytest.raises(TypeError):
+            Incomplete()
+    
+    def test_acquire_async_reserves_off_the_event_loop(self):
+        """Test shared backends reserve in a worker thread when used from asyncio."""
+        import threading
+        
+        threads = []
+        
+        class RecordingStore(DictStore):
+            def get(self, key):
+                threads.append(threading.current_thread())
+                return super().get(key)
+        
+        bucket = TokenBucket(0.001, burst=1, backend=StoreBackend(RecordingStore(), "key"))
+        assert asyncio.run(bucket.acquire_async())
+        assert threads and threads[0] is not threading.main_thread()
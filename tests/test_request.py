@@ -3,7 +3,9 @@
 import pytest
 import requests
 from unittest.mock import Mock
-from wefact.request import flatten_params, RequestMixin
+from urllib.parse import urlencode
+from wefact.enums import Action
+from wefact.request import flatten_params, encode_params, create_session, RequestMixin
 from wefact.exceptions import ClientError, ValidationError, NotFoundError
 
 
@@ -74,10 +76,96 @@ class TestFlattenParams:
         result = flatten_params(params)
         assert result == []
 
+    def test_parent_key(self):
+        """Test flattening under an existing key path."""
+        result = flatten_params({"Number": 1, "Tags": ["a"]}, "InvoiceLines[0]")
+        assert result == [("InvoiceLines[0][Number]", "1"), ("InvoiceLines[0][Tags][0]", "a")]
+
+    def test_deeply_nested_does_not_recurse(self):
+        """Test that nesting deeper than the recursion limit is flattened."""
+        params = value = {}
+        for _ in range(5000):
+            value["a"] = {}
+            value = value["a"]
+        value["b"] = 1
+        result = flatten_params(params)
+        assert len(result) == 1
+        assert result[0][1] == "1"
+
+
+class TestEncodeParams:
+    """Test encode_params function."""
+
+    PAYLOADS = [
+        {},
+        {"api_key": "key", "controller": "invoice", "action": Action.SHOW, "Identifier": "12"},
+        {"Description": "Hosting & domain – 1 jaar", "PriceExcl": 12.5, "Paid": None, "Sent": True},
+        {"Debtor": {"CompanyName": "Acme B.V.", "Address": {"Street": "Main St"}}},
+        {
+            "InvoiceLines": [
+                {"Number": 1, "ProductCode": "P0001", "Tags": ["a b", "c"]},
+                ("x", {"y": "z"}),
+                {},
+            ],
+            "Empty": [],
+        },
+        {"": {"inner": 1}, 0: {"n": [1]}, "k": {"": 2, 3: "drie"}},
+    ]
+
+    @pytest.mark.parametrize("params", PAYLOADS)
+    def test_matches_urlencode_of_flatten_params(self, params):
+        """Test byte-identical output to urlencode(flatten_params(...))."""
+        assert encode_params(params) == urlencode(flatten_params(params))
+
+    def test_nested_keys_are_encoded(self):
+        """Test PHP-style bracketed keys in the encoded body."""
+        body = encode_params({"InvoiceLines": [{"Number": 1}], "Debtor": {"Name": "A B"}})
+        assert body == "InvoiceLines%5B0%5D%5BNumber%5D=1&Debtor%5BName%5D=A+B"
+
+    def test_enum_values(self):
+        """Test that enums are encoded by value."""
+        assert encode_params({"action": Action.LIST}) == "action=list"
+
 
 class TestRequestMixin:
     """Test RequestMixin class."""
     
+    @pytest.mark.parametrize("params", [
+        {},
+        {"Identifier": 12},
+        {"Tags": []},
+        {"InvoiceLines": [{"Number": 1, "Description": "A & B"}]},
+        {"action": "override", "Identifier": "1"},
+    ])
+    def test_encode_request_body(self, params):
+        """Test that the cached envelope prefix leaves the body unchanged."""
+        mixin = RequestMixin()
+        mixin.api_key = "key/+1"
+        expected_params = dict(params)
+        if isinstance(expected_params.get("Identifier"), int):
+            expected_params["Identifier"] = str(expected_params["Identifier"])
+        expected = urlencode(flatten_params({
+            "api_key": "key/+1", "controller": "invoice", "action": Action.SHOW, **expected_params,
+        }))
+        assert mixin._encode_request("invoice", Action.SHOW, params) == expected
+
+    def test_encode_request_per_api_key(self):
+        """Test that the envelope prefix carries each instance's API key."""
+        first, second = RequestMixin(), RequestMixin()
+        first.api_key, second.api_key = "one", "two"
+        assert first._encode_request("debtor", "show", {}).startswith("api_key=one&")
+        assert second._encode_request("debtor", "show", {}).startswith("api_key=two&")
+    
+    def test_envelope_cached_on_context(self):
+        """Test that envelope prefixes are cached on the client's context."""
+        from wefact import WeFact
+        with WeFact(api_key="one") as client:
+            assert client.invoices._encode_request("invoice", "show", {}).startswith("api_key=one&")
+            assert ("invoice", "show") in client.context.get("request_envelopes")
+            
+            client.api_key = "two"
+            assert client.invoices._encode_request("invoice", "show", {}).startswith("api_key=two&")
+
     def test_send_request_success(self, mocker):
         """Test successful API request."""
         mixin = RequestMixin()
@@ -200,3 +288,108 @@ class TestRequestMixin:
         
         with pytest.raises(ValidationError, match="Invoice not found"):
             mixin._send_request("invoice", "show", {"Identifier": "999"})
+    
+    def test_send_request_uses_session(self, mocker):
+        """Test requests go through the configured session when present."""
+        mixin = RequestMixin()
+        mixin.api_key = "test_key"
+        mixin.api_url = "https://api.test.com/"
+        mixin.session = create_session()
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"status": "success"}
+        
+        mock_post = mocker.patch.object(mixin.session, 'post', return_value=mock_response)
+        module_post = mocker.patch('requests.post')
+        
+        mixin._send_request("invoice", "list", {})
+        
+        mock_post.assert_called_once()
+        module_post.assert_not_called()
+
+
+class TestResponseProcessing:
+    """Test that responses are decoded once and shared with response hooks."""
+
+    def make_client(self, mocker, *responses):
+        from wefact import WeFact
+
+        client = WeFact(api_key="test_key", requests_per_minute=None)
+        mocker.patch('wefact.request.requests.Session.post', side_effect=list(responses))
+        mocker.patch('wefact.request.time.sleep')
+        return client
+
+    def response(self, status, data):
+        response = Mock()
+        response.status_code = status
+        response.json.return_value = data
+        response.headers = {}
+        return response
+
+    def test_success_parses_once(self, mocker):
+        """Test a successful response is parsed exactly once."""
+        response = self.response(200, {"status": "success", "invoice": {}})
+        client = self.make_client(mocker, response)
+        client.invoices.show(Identifier=1)
+        assert response.json.call_count == 1
+
+    @pytest.mark.parametrize("status, data", [
+        (404, {"errors": ["Not found"]}),
+        (200, {"status": "error", "errors": ["Invalid"]}),
+    ])
+    def test_error_parses_once(self, mocker, status, data):
+        """Test HTTP and WeFact errors are mapped from the single parse."""
+        response = self.response(status, data)
+        client = self.make_client(mocker, response)
+        with pytest.raises((NotFoundError, ValidationError)):
+            client.invoices.edit(Identifier=1)
+        assert response.json.call_count == 1
+
+    def test_null_body_parses_once(self, mocker):
+        """Test a JSON null body is memoized like any other body."""
+        from wefact.response import ApiResponse
+
+        response = self.response(200, None)
+        parsed = ApiResponse(response)
+        assert parsed.json() is None
+        assert parsed.json() is None
+        assert parsed.result() is None
+        assert response.json.call_count == 1
+
+    def test_invalid_json_error_is_memoized(self):
+        """Test a body that is not JSON is parsed once and its error re-raised."""
+        from wefact.response import ApiResponse
+
+        response = self.response(200, None)
+        response.json.side_effect = ValueError("Expecting value")
+        parsed = ApiResponse(response)
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parsed.json()
+        with pytest.raises(ValidationError, match="Invalid JSON"):
+            parsed.result()
+        assert response.json.call_count == 1
+
+    def test_response_hooks(self, mocker):
+        """Test hooks see every attempt with its parsed body and error."""
+        first = self.response(503, {"message": "Unavailable"})
+        second = self.response(200, {"status": "success", "invoices": []})
+        client = self.make_client(mocker, first, second)
+        seen = []
+
+        @client.context.add_response_hook
+        def hook(parsed):
+            seen.append((parsed.controller, parsed.action, parsed.status, parsed.json(), parsed.error))
+
+        assert client.invoices.list()["invoices"] == []
+        assert [entry[:3] for entry in seen] == [("invoice", "list", 503), ("invoice", "list", 200)]
+        assert seen[0][3] == {"message": "Unavailable"}
+        assert seen[0][4].status == 503
+        assert seen[1][4] is None
+        assert first.json.call_count == second.json.call_count == 1
+
+        client.context.remove_response_hook(hook)
+        mocker.patch('wefact.request.requests.Session.post', return_value=second)
+        client.invoices.list()
+        assert len(seen) == 2
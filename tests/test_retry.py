@@ -0,0 +1,145 @@
+"""Tests for retry policy and automatic retries."""
+
+import pytest
+import requests
+from unittest.mock import Mock
+from wefact import WeFact
+from wefact.enums import Action, InvoiceAction
+from wefact.exceptions import (
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    TransportError,
+    ValidationError,
+)
+from wefact.retry import SAFE_ACTIONS, RetryPolicy
+
+
+def make_response(status_code, json_data=None, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = json_data if json_data is not None else {"status": "success"}
+    response.headers = headers or {}
+    response.reason = None
+    return response
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy decisions."""
+    
+    def test_safe_actions_retry_server_errors(self):
+        """Test transient errors on safe actions are retryable."""
+        policy = RetryPolicy()
+        assert policy.is_retryable(Action.SHOW, ServerError("x", status=502))
+        assert policy.is_retryable("list", RateLimitError("x", status=429))
+        assert policy.is_retryable(InvoiceAction.DOWNLOAD, TransportError("reset"))
+    
+    def test_mutating_actions_are_opt_in(self):
+        """Test mutating actions are only retried when enabled."""
+        error = ServerError("x", status=503)
+        assert not RetryPolicy().is_retryable(InvoiceAction.MARK_AS_PAID, error)
+        assert RetryPolicy(retry_mutating=True).is_retryable(InvoiceAction.MARK_AS_PAID, error)
+    
+    def test_non_transient_errors(self):
+        """Test client errors and unlisted statuses are not retried."""
+        policy = RetryPolicy()
+        assert not policy.is_retryable("show", NotFoundError("x", status=404))
+        assert not policy.is_retryable("show", ValidationError("x", status=200))
+        assert not policy.is_retryable("show", ServerError("x", status=501))
+    
+    def test_max_attempts(self):
+        """Test should_retry stops after max_attempts."""
+        policy = RetryPolicy(max_attempts=2)
+        error = ServerError("x", status=500)
+        assert policy.should_retry("list", error, 1)
+        assert not policy.should_retry("list", error, 2)
+    
+    def test_backoff_exponential(self):
+        """Test delays double per attempt up to max_backoff."""
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+    
+    def test_backoff_jitter(self):
+        """Test jittered delays stay within the exponential bound."""
+        policy = RetryPolicy(backoff_factor=1)
+        assert all(0 <= policy.backoff(3) <= 4 for _ in range(50))
+    
+    def test_backoff_retry_after(self):
+        """Test Retry-After takes precedence over computed backoff."""
+        policy = RetryPolicy()
+        assert policy.backoff(1, RateLimitError("x", status=429, retry_after=7)) == 7
+    
+    def test_backoff_retry_after_is_capped(self):
+        """Test a long Retry-After is capped at max_backoff."""
+        policy = RetryPolicy(max_backoff=10)
+        assert policy.backoff(1, RateLimitError("x", status=429, retry_after=3600)) == 10
+    
+    def test_safe_actions_match_enums(self):
+        """Test SAFE_ACTIONS holds the read-only action values."""
+        assert SAFE_ACTIONS == {
+            "list", "show", "download", "attachmentdownload",
+            "costcategory_list", "costcategory_show",
+        }
+
+
+class TestClientRetries:
+    """Test retries performed by _send_request."""
+    
+    @pytest.fixture
+    def client(self):
+        return WeFact(api_key="test_key", requests_per_minute=None)
+    
+    @pytest.fixture
+    def sleep(self, mocker):
+        return mocker.patch('wefact.request.time.sleep')
+    
+    def test_retries_transient_server_error(self, client, sleep, mocker):
+        """Test a 502 on a safe action is retried until it succeeds."""
+        post = mocker.patch('wefact.request.requests.Session.post', side_effect=[
+            make_response(502, {"message": "Bad gateway"}),
+            make_response(200, {"status": "success", "invoices": []}),
+        ])
+        assert client.invoices.list()["status"] == "success"
+        assert post.call_count == 2
+        assert sleep.call_count == 1
+    
+    def test_gives_up_after_max_attempts(self, client, sleep, mocker):
+        """Test the last error is raised once attempts are exhausted."""
+        post = mocker.patch('wefact.request.requests.Session.post', return_value=make_response(503))
+        with pytest.raises(ServerError):
+            client.invoices.show(Identifier=1)
+        assert post.call_count == 3
+    
+    def test_mutating_action_not_retried(self, client, sleep, mocker):
+        """Test mutating actions fail immediately by default."""
+        post = mocker.patch('wefact.request.requests.Session.post', return_value=make_response(502))
+        with pytest.raises(ServerError):
+            client.invoices.mark_as_paid(Identifier=1)
+        assert post.call_count == 1
+        sleep.assert_not_called()
+    
+    def test_retry_after_header(self, client, sleep, mocker):
+        """Test 429 responses wait for Retry-After before retrying."""
+        mocker.patch('wefact.request.requests.Session.post', side_effect=[
+            make_response(429, {"message": "Too many requests"}, headers={"Retry-After": "3"}),
+            make_response(200),
+        ])
+        client.debtors.list()
+        sleep.assert_called_once_with(3.0)
+    
+    def test_connection_reset_retried(self, client, sleep, mocker):
+        """Test connection errors are retried as transport errors."""
+        post = mocker.patch('wefact.request.requests.Session.post', side_effect=[
+            requests.ConnectionError("Connection reset by peer"),
+            make_response(200),
+        ])
+        client.products.show(Identifier=1)
+        assert post.call_count == 2
+    
+    def test_retries_disabled(self, sleep, mocker):
+        """Test retry=None disables retries."""
+        client = WeFact(api_key="test_key", requests_per_minute=None, retry=None)
+        post = mocker.patch('wefact.request.requests.Session.post', side_effect=requests.ConnectionError("down"))
+        with pytest.raises(TransportError):
+            client.invoices.list()
+        assert post.call_count == 1
@@ -0,0 +1,424 @@
+"""Tests for streaming Base64 uploads and downloads."""
+
+import asyncio
+import base64
+import io
+import json
+import threading
+from urllib.parse import parse_qs, urlencode
+
+import pytest
+import requests
+
+from wefact import WeFact
+from wefact.exceptions import NotFoundError, ServerError, TransportError, ValidationError
+from wefact.request import RequestMixin, flatten_params
+from wefact.retry import RetryPolicy
+from wefact.streaming import Base64FieldParser, StreamingFormBody, is_file_source, iter_aligned_chunks
+
+
+class ShortReads(io.RawIOBase):
+    """Non-seekable binary stream returning at most 7 bytes per read."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        return self._data.read(min(size, 7) if size and size > 0 else 7)
+
+
+class OkResponse:
+    status_code = 200
+
+    @staticmethod
+    def json():
+        return {"status": "success"}
+
+
+@pytest.fixture
+def payload():
+    # Covers every Base64 character that needs percent-encoding (+, / and =)
+    return bytes(range(256)) * 40 + b"\xfb\xff"
+
+
+def make_mixin():
+    mixin = RequestMixin()
+    mixin.api_key = "test_key"
+    mixin.api_url = "https://api.test.com/"
+    return mixin
+
+
+class TestHelpers:
+    def test_is_file_source(self, tmp_path):
+        assert is_file_source(tmp_path / "scan.pdf")
+        assert is_file_source(io.BytesIO(b"data"))
+        assert not is_file_source("aGVsbG8=")
+        assert not is_file_source(b"aGVsbG8=")
+        assert not is_file_source(None)
+
+    def test_aligned_chunks_with_short_reads(self, payload):
+        chunks = list(iter_aligned_chunks(ShortReads(payload), 64))
+        assert b"".join(chunks) == payload
+        assert all(len(chunk) % 3 == 0 for chunk in chunks[:-1])
+
+    def test_text_streams_are_rejected(self):
+        with pytest.raises(TypeError, match="binary mode"):
+            list(iter_aligned_chunks(io.StringIO("text"), 64))
+
+
+class TestStreamingFormBody:
+    def expected(self, data):
+        params = {
+            "api_key": "test_key",
+            "controller": "invoice",
+            "action": "attachmentadd",
+            "ReferenceIdentifier": "1",
+            "Base64": base64.b64encode(data).decode(),
+        }
+        return urlencode(flatten_params(params)).encode()
+
+    def encode(self, source):
+        return make_mixin()._encode_request(
+            "invoice", "attachmentadd", {"ReferenceIdentifier": 1, "Base64": source}
+        )
+
+    def test_path_matches_in_memory_encoding(self, tmp_path, payload):
+        path = tmp_path / "scan.pdf"
+        path.write_bytes(payload)
+        body = self.encode(path)
+        assert isinstance(body, StreamingFormBody)
+        assert body.replayable
+        assert b"".join(body) == self.expected(payload)
+        assert body.content_length == len(self.expected(payload))
+        # Sent again on retry
+        assert b"".join(body) == self.expected(payload)
+
+    def test_small_chunks(self, payload):
+        body = StreamingFormBody("api_key=k", [("Base64", io.BytesIO(payload))], chunk_size=10)
+        expected = urlencode({"api_key": "k", "Base64": base64.b64encode(payload).decode()}).encode()
+        assert b"".join(body) == expected
+        assert len(body) == len(expected)
+
+    def test_seekable_stream_is_rewound(self, payload):
+        stream = io.BytesIO(b"skipped" + payload)
+        stream.seek(7)
+        body = self.encode(stream)
+        assert body.content_length == len(self.expected(payload))
+        assert b"".join(body) == self.expected(payload)
+
+    def test_non_seekable_stream(self, payload):
+        body = self.encode(ShortReads(payload))
+        assert not body.replayable
+        assert body.content_length is None
+        assert b"".join(body) == self.expected(payload)
+        with pytest.raises(ValueError, match="cannot be rewound"):
+            list(body)
+
+    def test_string_content_is_not_streamed(self):
+        assert isinstance(self.encode("aGVsbG8="), str)
+
+
+class TestUpload:
+    def test_attachment_add_streams_path(self, tmp_path, payload, mocker):
+        path = tmp_path / "scan.pdf"
+        path.write_bytes(payload)
+        post = mocker.patch("wefact.request.requests.Session.post", return_value=OkResponse())
+
+        with WeFact(api_key="test_key") as client:
+            client.invoices.attachment_add(ReferenceIdentifier=1, Filename="scan.pdf", Base64=path)
+
+        body = post.call_args.kwargs["data"]
+        assert isinstance(body, StreamingFormBody)
+        form = parse_qs(b"".join(body).decode())
+        assert form["Type"] == ["invoice"]
+        assert form["Filename"] == ["scan.pdf"]
+        assert base64.b64decode(form["Base64"][0]) == payload
+
+    def test_non_seekable_upload_is_sent_chunked_and_not_retried(self, payload, mocker):
+        post = mocker.patch("requests.post", side_effect=ServerError("Unavailable", status=503))
+        mixin = make_mixin()
+        mixin.retry_policy = RetryPolicy(retry_mutating=True, backoff_factor=0)
+
+        with pytest.raises(ServerError):
+            mixin._send_request("invoice", "attachmentadd", {"Base64": ShortReads(payload)})
+
+        assert post.call_count == 1
+        body = post.call_args.kwargs["data"]
+        assert not isinstance(body, StreamingFormBody)
+        assert b"".join(body).startswith(b"api_key=test_key&")
+
+    def test_async_upload(self, tmp_path, payload):
+        httpx = pytest.importorskip("httpx")
+        from wefact import AsyncWeFact
+
+        path = tmp_path / "scan.pdf"
+        path.write_bytes(payload)
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"status": "success"})
+
+        async def run():
+            client = AsyncWeFact(api_key="test_key", requests_per_minute=None)
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                await client.debtors.attachment_add(ReferenceIdentifier=1, Base64=path)
+
+        asyncio.run(run())
+        request = seen[0]
+        assert int(request.headers["Content-Length"]) == len(request.content)
+        form = parse_qs(request.content.decode())
+        assert base64.b64decode(form["Base64"][0]) == payload
+
+
+    def test_async_upload_reads_off_event_loop(self, payload):
+        httpx = pytest.importorskip("httpx")
+        from wefact import AsyncWeFact
+
+        class RecordingReads(io.BytesIO):
+            threads = set()
+
+            def read(self, size=-1):
+                self.threads.add(threading.current_thread())
+                return super().read(size)
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"status": "success"})
+
+        async def run():
+            client = AsyncWeFact(api_key="test_key", requests_per_minute=None)
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                await client.debtors.attachment_add(ReferenceIdentifier=1, Base64=RecordingReads(payload))
+
+        asyncio.run(run())
+        assert RecordingReads.threads
+        assert threading.main_thread() not in RecordingReads.threads
+        form = parse_qs(seen[0].content.decode())
+        assert base64.b64decode(form["Base64"][0]) == payload
+
+def download_body(pdf, escape_slashes=True):
+    """A WeFact invoice download response, as PHP's json_encode renders it."""
+    text = json.dumps({
+        "controller": "invoice",
+        "action": "download",
+        "status": "success",
+        "invoice": {
+            "Filename": "F2025-0001.pdf",
+            "Base64": base64.b64encode(pdf).decode(),
+            "MimeType": "application/pdf",
+        },
+    })
+    return text.replace("/", "\\/") if escape_slashes else text
+
+
+class StreamedResponse:
+    """requests-style streamed response delivering the body in small chunks."""
+
+    def __init__(self, body, status_code=200, fail_after=None):
+        self.body = body.encode() if isinstance(body, str) else body
+        self.status_code = status_code
+        self.fail_after = fail_after
+        self.headers = {}
+        self.text = self.body.decode()
+        self.closed = False
+
+    def json(self):
+        return json.loads(self.body)
+
+    def iter_content(self, chunk_size):
+        for index, start in enumerate(range(0, len(self.body), 100)):
+            if self.fail_after is not None and index >= self.fail_after:
+                raise requests.ConnectionError("Connection reset")
+            yield self.body[start:start + 100]
+
+    def close(self):
+        self.closed = True
+
+
+class TestBase64FieldParser:
+    def parse(self, text, step):
+        out = []
+        parser = Base64FieldParser(out.append)
+        data = text.encode()
+        for start in range(0, len(data), step):
+            parser.feed(data[start:start + step])
+        return b"".join(out), parser.close(), parser
+
+    @pytest.mark.parametrize("step", [1, 2, 5, 64, 10_000])
+    def test_decodes_split_escaped_value(self, payload, step):
+        pdf, metadata, parser = self.parse(download_body(payload), step)
+        assert pdf == payload
+        assert parser.found and parser.written == len(payload)
+        assert metadata["invoice"] == {"Filename": "F2025-0001.pdf", "Base64": "", "MimeType": "application/pdf"}
+
+    def test_unicode_escapes_and_whitespace(self, payload):
+        value = base64.b64encode(payload).decode().replace("/", "\\u002F")
+        text = '{"status": "success", "invoice" : { "Base64" : "' + value + '" }}'
+        pdf, _, _ = self.parse(text, 3)
+        assert pdf == payload
+
+    def test_field_name_inside_other_strings_is_ignored(self, payload):
+        text = '{"note": "\\"Base64\\":\\"", "Base64x": "QUJD", "x": {"Base64": "' \
+            + base64.b64encode(payload).decode() + '"}}'
+        pdf, metadata, _ = self.parse(text, 7)
+        assert pdf == payload
+        assert metadata["note"] == '"Base64":"'
+
+    def test_response_without_field(self):
+        pdf, metadata, parser = self.parse('{"status": "error", "errors": ["Not found"]}', 4)
+        assert pdf == b"" and not parser.found
+        assert metadata["errors"] == ["Not found"]
+
+    def test_truncated_response(self):
+        parser = Base64FieldParser(lambda chunk: None)
+        parser.feed(b'{"invoice": {"Base64": "QUJD')
+        with pytest.raises(ValueError, match="ended inside"):
+            parser.close()
+
+
+class TestDownloadTo:
+    def test_download_to_path(self, tmp_path, payload, mocker):
+        response = StreamedResponse(download_body(payload))
+        post = mocker.patch("wefact.request.requests.Session.post", return_value=response)
+        target = tmp_path / "invoice.pdf"
+
+        with WeFact(api_key="test_key") as client:
+            result = client.invoices.download_to(target, Identifier=1)
+
+        assert target.read_bytes() == payload
+        assert result["invoice"] == {"Filename": "F2025-0001.pdf", "MimeType": "application/pdf"}
+        assert post.call_args.kwargs["stream"] is True
+        assert "action=download" in post.call_args.kwargs["data"]
+        assert response.closed
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_download_to_stream(self, payload, mocker):
+        mocker.patch("wefact.request.requests.Session.post", return_value=StreamedResponse(download_body(payload)))
+        out = io.BytesIO()
+
+        with WeFact(api_key="test_key") as client:
+            client.quotes.download_to(out, Identifier=1)
+
+        assert out.getvalue() == payload
+
+    def test_interrupted_download_is_retried(self, tmp_path, payload, mocker):
+        mocker.patch("wefact.request.requests.Session.post", side_effect=[
+            StreamedResponse(download_body(payload), fail_after=3),
+            StreamedResponse(download_body(payload)),
+        ])
+        mocker.patch("wefact.request.time.sleep")
+        target = tmp_path / "invoice.pdf"
+
+        with WeFact(api_key="test_key") as client:
+            client.invoices.download_to(target, Identifier=1)
+
+        assert target.read_bytes() == payload
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_seekable_stream_is_rewound_on_retry(self, payload, mocker):
+        mocker.patch("wefact.request.requests.Session.post", side_effect=[
+            StreamedResponse(download_body(payload), fail_after=3),
+            StreamedResponse(download_body(payload)),
+        ])
+        mocker.patch("wefact.request.time.sleep")
+        out = io.BytesIO(b"keep")
+        out.seek(4)
+
+        with WeFact(api_key="test_key") as client:
+            client.invoices.download_to(out, Identifier=1)
+
+        assert out.getvalue() == b"keep" + payload
+
+    def test_failed_download_leaves_no_file(self, tmp_path, payload, mocker):
+        mocker.patch(
+            "wefact.request.requests.Session.post",
+            return_value=StreamedResponse(download_body(payload), fail_after=3),
+        )
+        target = tmp_path / "invoice.pdf"
+
+        with WeFact(api_key="test_key", retry=None) as client:
+            with pytest.raises(TransportError):
+                client.invoices.download_to(target, Identifier=1)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_error_payload(self, tmp_path, mocker):
+        body = json.dumps({"status": "error", "errors": ["Invoice not found"]})
+        mocker.patch("wefact.request.requests.Session.post", return_value=StreamedResponse(body))
+
+        with WeFact(api_key="test_key") as client:
+            with pytest.raises(ValidationError, match="Invoice not found"):
+                client.invoices.download_to(tmp_path / "invoice.pdf", Identifier=1)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_http_error(self, tmp_path, mocker):
+        body = json.dumps({"message": "Not found"})
+        mocker.patch("wefact.request.requests.Session.post", return_value=StreamedResponse(body, status_code=404))
+
+        with WeFact(api_key="test_key") as client:
+            with pytest.raises(NotFoundError):
+                client.invoices.download_to(tmp_path / "invoice.pdf", Identifier=1)
+
+    def test_response_hook_reading_content(self, tmp_path, payload, mocker):
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(download_body(payload).encode())
+        mocker.patch("wefact.request.requests.Session.post", return_value=response)
+        seen = []
+
+        with WeFact(api_key="test_key") as client:
+            client.context.add_response_hook(lambda parsed: seen.append(parsed.content))
+            client.invoices.download_to(tmp_path / "invoice.pdf", Identifier=1)
+
+        # The streamed body was consumed by the decoder
+        assert seen == [None]
+        assert (tmp_path / "invoice.pdf").read_bytes() == payload
+
+    def test_async_response_hook_reading_content(self, tmp_path, payload):
+        httpx = pytest.importorskip("httpx")
+        from wefact import AsyncWeFact
+
+        async def body():
+            yield download_body(payload).encode()
+
+        def handler(request):
+            return httpx.Response(200, content=body())
+
+        seen = []
+
+        async def run():
+            client = AsyncWeFact(api_key="test_key", requests_per_minute=None)
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            client.context.add_response_hook(lambda parsed: seen.append(parsed.content))
+            async with client:
+                await client.invoices.download_to(tmp_path / "invoice.pdf", Identifier=1)
+
+        asyncio.run(run())
+        assert seen == [None]
+        assert (tmp_path / "invoice.pdf").read_bytes() == payload
+
+    def test_async_download_to(self, tmp_path, payload):
+        httpx = pytest.importorskip("httpx")
+        from wefact import AsyncWeFact
+
+        def handler(request):
+            return httpx.Response(200, content=download_body(payload).encode())
+
+        async def run():
+            client = AsyncWeFact(api_key="test_key", requests_per_minute=None)
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                return await client.invoices.download_to(tmp_path / "invoice.pdf", Identifier=1)
+
+        result = asyncio.run(run())
+        assert (tmp_path / "invoice.pdf").read_bytes() == payload
+        assert "Base64" not in result["invoice"]
@@ -9,7 +9,7 @@ def client():
 
 def test_list_subscriptions(client, mocker):
     mock_response = {'subscriptions': []}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -20,7 +20,7 @@ def test_list_subscriptions(client, mocker):
 
 def test_create_subscription(client, mocker):
     mock_response = {'status': 'success', 'subscription': {'Identifier': 'SUB10000'}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -31,7 +31,7 @@ def test_create_subscription(client, mocker):
 
 def test_update_subscription(client, mocker):
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -48,7 +48,7 @@ def test_update_subscription(client, mocker):
 def test_show_subscription(client, mocker):
     subscription_id = 'SUB10000'
     mock_response = {'status': 'success', 'subscription': {'Identifier': subscription_id}}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -59,7 +59,7 @@ def test_show_subscription(client, mocker):
 
 def test_terminate_subscription(client, mocker):
     mock_response = {'status': 'success'}
-    mocker.patch('wefact.request.requests.post', return_value=type('R', (), {
+    mocker.patch('wefact.request.requests.Session.post', return_value=type('R', (), {
         'status_code': 200,
         'json': staticmethod(lambda: mock_response)
     })())
@@ -0,0 +1,196 @@
+"""Tests for the local SQLite mirror."""
+
+from unittest.mock import Mock
+from urllib.parse import parse_qs
+
+import pytest
+from wefact import WeFact
+from wefact.sync import Mirror
+
+
+class FakeInvoices:
+    """Invoice list/show API backed by a dict, counting the calls per action."""
+
+    def __init__(self):
+        self.items = {
+            str(i): {
+                "Identifier": str(i),
+                "InvoiceCode": f"INV{10000 + i}",
+                "DebtorCode": "DB10000",
+                "Status": "2" if i % 2 else "4",
+                "Date": f"2025-01-{i:02d}",
+                "AmountIncl": f"{i * 10}.50",
+                "Modified": f"2025-02-01 10:00:0{i}",
+            }
+            for i in range(1, 6)
+        }
+        self.calls = {"list": 0, "show": 0}
+        self.filters = []
+
+    def __call__(self, url, data, **kwargs):
+        params = {k: v[0] for k, v in parse_qs(data).items()}
+        self.calls[params["action"]] += 1
+        if params["action"] == "list":
+            since = params.get("modified[from]")
+            self.filters.append(since)
+            items = [item for item in self.items.values() if since is None or item["Modified"] >= since]
+            offset, limit = int(params.get("offset", 0)), int(params.get("limit", 1000))
+            page = items[offset:offset + limit]
+            body = {"status": "success", "totalresults": len(items), "currentresults": len(page), "invoices": page}
+        else:
+            body = {"status": "success", "invoice": {**self.items[params["Identifier"]], "InvoiceLines": []}}
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = body
+        response.headers = {}
+        return response
+
+
+@pytest.fixture
+def api(mocker):
+    api = FakeInvoices()
+    mocker.patch('wefact.request.requests.Session.post', side_effect=api)
+    return api
+
+
+@pytest.fixture
+def client():
+    return WeFact(api_key="test_key", requests_per_minute=None)
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    with Mirror(tmp_path / "wefact.db") as mirror:
+        yield mirror
+
+
+class TestMirror:
+    """Test mirroring and incremental refreshes."""
+
+    def test_full_load(self, api, client, mirror):
+        """Test every listed item is stored with typed columns."""
+        result = mirror.sync(client.invoices, per_page=2)
+        assert (result.listed, result.inserted, result.details) == (5, 5, 0)
+        assert api.calls == {"list": 3, "show": 0}
+        assert mirror.get("invoice", 3)["InvoiceCode"] == "INV10003"
+        row = mirror.query("SELECT Status, AmountIncl, Date FROM invoices WHERE Identifier = 3")[0]
+        assert (row["Status"], row["AmountIncl"], row["Date"]) == (2, 30.5, "2025-01-03")
+        assert mirror.last_synced("invoice") is not None
+
+    def test_find(self, api, client, mirror):
+        """Test querying typed columns."""
+        mirror.sync(client.invoices)
+        sent = mirror.find("invoice", Status=2, order_by="-Date")
+        assert [item["Identifier"] for item in sent] == ["5", "3", "1"]
+        assert len(mirror.find("invoice", DebtorCode="DB10000", limit=2)) == 2
+        with pytest.raises(ValueError):
+            mirror.find("invoice", Bogus=1)
+        with pytest.raises(ValueError):
+            mirror.find("unknown")
+
+    def test_incremental_refresh(self, api, client, mirror):
+        """Test only changed items are written and removed items deleted."""
+        mirror.sync(client.invoices)
+        api.items["2"]["Status"] = "3"
+        del api.items["5"]
+        result = mirror.sync(client.invoices, full=True)
+        assert (result.unchanged, result.updated, result.inserted, result.deleted) == (3, 1, 0, 1)
+        assert mirror.find("invoice", Status=3)[0]["Identifier"] == "2"
+        assert mirror.get("invoice", 5) is None
+
+    def test_details_only_for_changed_items(self, api, client, mirror):
+        """Test show() is called for new and changed items only."""
+        mirror.sync(client.invoices, detail=True, workers=2)
+        assert api.calls["show"] == 5
+        assert mirror.get("invoice", 1)["InvoiceLines"] == []
+        api.items["1"]["AmountIncl"] = "99.00"
+        result = mirror.sync(client.invoices, detail=True, full=True)
+        assert api.calls["show"] == 6
+        assert (result.details, result.unchanged) == (1, 4)
+
+    def test_filtered_sync_does_not_prune(self, api, client, mirror):
+        """Test a filtered sync keeps items outside the filter."""
+        mirror.sync(client.invoices)
+        del api.items["1"]
+        result = mirror.sync(client.invoices, status=2)
+        assert api.filters[-1] is None
+        assert result.deleted == 0
+        assert mirror.get("invoice", 1) is not None
+
+    def test_sync_all(self, api, client, mirror):
+        """Test mirroring several controllers by name."""
+        results = mirror.sync_all(client, ["invoice"])
+        assert results["invoice"].inserted == 5
+
+
+class TestWatermark:
+    """Test incremental syncs listing only modified items."""
+
+    def test_incremental_sync_lists_changes(self, api, client, mirror):
+        """Test a sync lists from the watermark and advances it."""
+        mirror.sync(client.invoices, detail=True)
+        assert mirror.watermark("invoice") == "2025-02-01 10:00:05"
+        api.items["2"].update(Status="3", Modified="2025-02-02 08:00:00")
+        del api.items["4"]
+        result = mirror.sync(client.invoices, detail=True)
+        # Listed from five minutes before the watermark; unchanged items are skipped
+        assert api.filters[-1] == "2025-02-01 09:55:05"
+        assert (result.listed, result.updated, result.unchanged, result.deleted) == (4, 1, 3, 0)
+        assert api.calls["show"] == 6
+        assert mirror.watermark("invoice") == "2025-02-02 08:00:00"
+        assert mirror.get("invoice", 4) is not None
+        assert mirror.sync(client.invoices, full=True).deleted == 1
+
+    def test_watermark_is_persisted(self, api, client, tmp_path):
+        """Test a reopened mirror continues from its watermark."""
+        with Mirror(tmp_path / "wefact.db") as mirror:
+            mirror.sync(client.invoices)
+        with Mirror(tmp_path / "wefact.db") as mirror:
+            result = mirror.sync(client.invoices)
+        assert result.since == "2025-02-01 10:00:05"
+        assert (result.listed, result.unchanged, result.updated) == (5, 5, 0)
+
+    def test_filtered_sync_keeps_watermark(self, api, client, mirror):
+        """Test a filtered sync neither uses nor advances the watermark."""
+        mirror.sync(client.invoices)
+        api.items["1"]["Modified"] = "2025-03-01 00:00:00"
+        mirror.sync(client.invoices, status=2)
+        assert mirror.watermark("invoice") == "2025-02-01 10:00:05"
+
+    def test_overlap_catches_changes_behind_the_watermark(self, api, client, mirror):
+        """Test an item modified while the previous listing ran is still refreshed."""
+        mirror.sync(client.invoices)
+        # Changed mid-listing: its marker is older than the recorded watermark
+        api.items["3"].update(Status="3", Modified="2025-02-01 10:00:04")
+        result = mirror.sync(client.invoices)
+        assert (result.updated, result.unchanged) == (1, 4)
+        assert mirror.get("invoice", 3)["Status"] == "3"
+        assert mirror.watermark("invoice") == "2025-02-01 10:00:05"
+
+    def test_without_overlap(self, api, client, tmp_path):
+        """Test overlap=0 lists from the watermark itself (inclusive)."""
+        with Mirror(tmp_path / "wefact.db", overlap=0) as mirror:
+            mirror.sync(client.invoices)
+            result = mirror.sync(client.invoices)
+        assert api.filters[-1] == "2025-02-01 10:00:05"
+        assert (result.listed, result.unchanged) == (1, 1)
+
+class TestIterModified:
+    """Test incremental listing on resources."""
+
+    def test_lists_since_watermark(self, api, client):
+        """Test the modified filter and details only for changed markers."""
+        known = {"4": "2025-02-01 10:00:04", "5": "older"}
+        items = list(client.invoices.iter_modified("2025-02-01 10:00:04", known=known))
+        assert api.filters == ["2025-02-01 10:00:04"]
+        assert [item["Identifier"] for item in items] == ["4", "5"]
+        assert api.calls["show"] == 1
+        assert "InvoiceLines" in items[1] and "InvoiceLines" not in items[0]
+
+    def test_datetime_watermark(self, api, client):
+        """Test datetimes are formatted for the API."""
+        from datetime import datetime
+
+        list(client.invoices.iter_modified(datetime(2025, 2, 1, 10, 0, 3), detail=False))
+        assert api.filters == ["2025-02-01 10:00:03"]
+        assert api.calls["show"] == 0
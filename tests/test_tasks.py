@@ -10,7 +10,7 @@ def client():
 def test_task_change_status(client, mocker):
     mock_response = {"status": "success"}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type("R", (), {"status_code": 200, "json": staticmethod(lambda: mock_response)})(),
     )
     resp = client.tasks.change_status(Identifier="T1", Status="completed")
@@ -27,7 +27,7 @@ essential_attachment_payload = {
 def test_task_attachments(client, mocker):
     mock_response = {"status": "success"}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type("R", (), {"status_code": 200, "json": staticmethod(lambda: mock_response)})(),
     )
     assert client.tasks.attachment_add(**essential_attachment_payload)["status"] == "success"
@@ -0,0 +1,197 @@
+"""Tests for request timeouts and per-call deadlines."""
+
+import time
+
+import pytest
+import requests
+from unittest.mock import Mock
+from wefact import WeFact, deadline
+from wefact.exceptions import RequestTimeoutError, ServerError, TransportError
+from wefact.rate_limit import TokenBucket
+from wefact.resources.base import BaseResource
+from wefact.timeouts import current_deadline
+
+
+def make_response(status_code=200, json_data=None):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = json_data if json_data is not None else {"status": "success"}
+    response.headers = {}
+    response.iter_content.return_value = [b'{"status": "success"}']
+    response.reason = None
+    return response
+
+
+class TestDeadlineContext:
+    """Test the deadline() context manager."""
+    
+    def test_sets_and_resets(self):
+        """Test the deadline only applies inside the block."""
+        assert current_deadline() is None
+        with deadline(5):
+            assert current_deadline() == pytest.approx(time.monotonic() + 5, abs=0.1)
+        assert current_deadline() is None
+    
+    def test_nested_deadline_never_extends(self):
+        """Test an inner deadline cannot outlive the outer one."""
+        with deadline(1):
+            outer = current_deadline()
+            with deadline(10):
+                assert current_deadline() == outer
+            with deadline(0.5):
+                assert current_deadline() < outer
+
+
+class TestClientTimeouts:
+    """Test timeouts applied by the client."""
+    
+    def test_default_timeouts(self, mocker):
+        """Test requests are sent with the client's connect/read timeouts."""
+        client = WeFact(api_key="test_key", requests_per_minute=None)
+        post = mocker.patch('wefact.request.requests.Session.post', return_value=make_response())
+        client.invoices.list()
+        assert post.call_args.kwargs["timeout"] == (10.0, 60.0)
+    
+    def test_custom_timeouts(self, mocker):
+        """Test connect/read timeouts are configurable."""
+        client = WeFact(api_key="test_key", requests_per_minute=None, connect_timeout=2, read_timeout=None)
+        post = mocker.patch('wefact.request.requests.Session.post', return_value=make_response())
+        client.invoices.list()
+        assert post.call_args.kwargs["timeout"] == (2, None)
+    
+    def test_read_timeout_raises_timeout_error(self, mocker):
+        """Test transport timeouts raise RequestTimeoutError."""
+        client = WeFact(api_key="test_key", requests_per_minute=None, retry=None)
+        mocker.patch('wefact.request.requests.Session.post', side_effect=requests.ReadTimeout("timed out"))
+        with pytest.raises(RequestTimeoutError) as exc_info:
+            client.invoices.list()
+        assert isinstance(exc_info.value, TransportError)
+    
+    def test_deadline_caps_timeouts(self, mocker):
+        """Test a deadline shorter than the timeouts caps them."""
+        client = WeFact(api_key="test_key", requests_per_minute=None)
+        post = mocker.patch('wefact.request.requests.Session.post', return_value=make_response())
+        with deadline(1):
+            client.invoices.list()
+        connect, read = post.call_args.kwargs["timeout"]
+        assert 0 < connect <= 1 and 0 < read <= 1
+    
+    def test_deadline_covers_rate_limit_wait(self, mocker):
+        """Test the deadline fails fast instead of waiting for the rate limiter."""
+        client = WeFact(api_key="test_key", rate_limiter=TokenBucket(0.01, burst=1))
+        post = mocker.patch('wefact.request.requests.Session.post', return_value=make_response())
+        client.invoices.list()
+        start = time.monotonic()
+        with pytest.raises(RequestTimeoutError):
+            with deadline(0.2):
+                client.invoices.list()
+        assert time.monotonic() - start < 1
+        assert post.call_count == 1
+    
+    def test_deadline_covers_retries(self, mocker):
+        """Test no retry is attempted when its backoff would overrun the deadline."""
+        client = WeFact(api_key="test_key", requests_per_minute=None)
+        sleep = mocker.patch('wefact.request.time.sleep')
+        mocker.patch('wefact.retry.random.uniform', return_value=5)
+        post = mocker.patch('wefact.request.requests.Session.post', return_value=make_response(503))
+        with pytest.raises(ServerError):
+            with deadline(1):
+                client.invoices.list()
+        assert post.call_count == 1
+        sleep.assert_not_called()
+    
+    def test_expired_deadline(self, mocker):
+        """Test no request is sent once the deadline has passed."""
+        client = WeFact(api_key="test_key", requests_per_minute=None)
+        post = mocker.patch('wefact.request.requests.Session.post', return_value=make_response())
+        with pytest.raises(RequestTimeoutError):
+            with deadline(0):
+                client.invoices.list()
+        post.assert_not_called()
+    
+    def test_deadline_reaches_worker_threads(self, mocker):
+        """Test concurrent list_all workers see the caller's deadline."""
+        resource = BaseResource("test_key")
+        resource.controller_name = "product"
+        mocker.patch.object(resource, 'list', return_value={
+            "products": [{"Identifier": i} for i in range(4)], "currentresults": 4
+        })
+        seen = []
+        def mock_show(**kwargs):
+            seen.append(current_deadline())
+            return {"product": {"Identifier": kwargs["Identifier"]}}
+        mocker.patch.object(resource, 'show', side_effect=mock_show)
+        
+        with deadline(30):
+            expected = current_deadline()
+            resource.list_all(per_page=10, workers=2)
+        assert seen == [expected] * 4
+
+
+@pytest.fixture
+def slow_server():
+    """Local server trickling a JSON body: 8 bytes every 0.1 s for about 2 s."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    body = b'{"status": "success", "invoices": []}'.ljust(160)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            try:
+                for start in range(0, len(body), 8):
+                    self.wfile.write(body[start:start + 8])
+                    self.wfile.flush()
+                    time.sleep(0.1)
+            except OSError:
+                pass  # The client gave up
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+class TestSlowResponseBody:
+    """Test the deadline bounds reading a response that trickles in."""
+    
+    def test_slow_body(self, slow_server):
+        """Test a body arriving in small, timely pieces still hits the deadline."""
+        client = WeFact(api_key="test_key", api_url=slow_server, requests_per_minute=None, retry=None)
+        started = time.monotonic()
+        with pytest.raises(RequestTimeoutError):
+            with deadline(0.5):
+                client.invoices.list()
+        assert time.monotonic() - started < 1.5
+    
+    def test_slow_body_without_deadline(self, slow_server):
+        """Test the trickled body is read completely when no deadline is set."""
+        client = WeFact(api_key="test_key", api_url=slow_server, requests_per_minute=None)
+        assert client.invoices.list()["invoices"] == []
+    
+    def test_slow_body_async(self, slow_server):
+        """Test the async client cancels an attempt still reading at the deadline."""
+        import asyncio
+        
+        pytest.importorskip("httpx")
+        from wefact import AsyncWeFact
+        
+        async def run():
+            async with AsyncWeFact(api_key="test_key", api_url=slow_server, requests_per_minute=None, retry=None) as client:
+                with deadline(0.5):
+                    await client.invoices.list()
+        
+        started = time.monotonic()
+        with pytest.raises(RequestTimeoutError):
+            asyncio.run(run())
+        assert time.monotonic() - started < 1.5
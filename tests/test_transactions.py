@@ -10,7 +10,7 @@ def client():
 def test_transaction_match_ignore(client, mocker):
     mock_response = {"status": "success"}
     mocker.patch(
-        "wefact.request.requests.post",
+        "wefact.request.requests.Session.post",
         return_value=type("R", (), {"status_code": 200, "json": staticmethod(lambda: mock_response)})(),
     )
     assert client.transactions.match(Identifier="TR1")["status"] == "success"
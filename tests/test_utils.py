@@ -1,14 +1,23 @@
 """Tests for utility functions."""
 
+import base64
+import binascii
+import io
+
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
 import tempfile
+from wefact.config import DEFAULT_BASE64_CHUNK_SIZE
 from wefact.utils import (
     convert_to_base64,
+    decode_base64_stream,
     decode_base64_to_file,
+    encode_base64_stream,
     format_date_for_api,
     format_datetime_for_api,
+    iter_base64_decode,
+    iter_base64_encode,
 )
 
 
@@ -49,6 +58,18 @@ def test_decode_base64_to_file(tmp_path):
     assert output_file.read_bytes() == test_content
 
 
+
+def test_decode_base64_to_file_keeps_existing_file_on_error(tmp_path):
+    """Test a decode error leaves an existing file and no partial file behind."""
+    output_file = tmp_path / "output.pdf"
+    output_file.write_bytes(b"previous download")
+    
+    with pytest.raises(binascii.Error):
+        decode_base64_to_file(base64.b64encode(b"x" * 99).decode() + "A", output_file)
+    
+    assert output_file.read_bytes() == b"previous download"
+    assert list(tmp_path.iterdir()) == [output_file]
+
 def test_format_date_for_api_with_datetime():
     """Test formatting datetime object to date string."""
     test_date = datetime(2025, 11, 7, 14, 30, 45)
@@ -92,3 +113,80 @@ def test_format_date_for_scheduled_invoice():
     assert scheduled_date[4] == "-"
     assert scheduled_date[7] == "-"
 
+
+
+@pytest.fixture
+def binary_payload():
+    # Every byte value, with a length that is not a multiple of 3
+    return bytes(range(256)) * 50 + b"\x00\xff"
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000, DEFAULT_BASE64_CHUNK_SIZE])
+def test_encode_base64_stream_matches_b64encode(tmp_path, binary_payload, use_mmap, chunk_size):
+    """Test chunked encoding of a file, with and without mmap."""
+    source = tmp_path / "scan.pdf"
+    source.write_bytes(binary_payload)
+    output = tmp_path / "scan.b64"
+
+    written = encode_base64_stream(source, output, chunk_size=chunk_size, use_mmap=use_mmap)
+
+    expected = base64.b64encode(binary_payload)
+    assert output.read_bytes() == expected
+    assert written == len(expected)
+
+
+def test_encode_base64_stream_to_text_stream(binary_payload):
+    """Test encoding a binary stream into a text stream."""
+    out = io.StringIO()
+    encode_base64_stream(io.BytesIO(binary_payload), out, chunk_size=10)
+    assert out.getvalue() == base64.b64encode(binary_payload).decode()
+
+
+def test_iter_base64_encode_empty_file(tmp_path):
+    """Test that empty files (which cannot be memory-mapped) encode to nothing."""
+    source = tmp_path / "empty"
+    source.write_bytes(b"")
+    assert list(iter_base64_encode(source, use_mmap=True)) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_decode_base64_stream_matches_b64decode(tmp_path, binary_payload, chunk_size):
+    """Test chunked decoding of text with line breaks into a file."""
+    encoded = base64.encodebytes(binary_payload).decode()  # 76-char lines
+    output = tmp_path / "scan.pdf"
+
+    written = decode_base64_stream(encoded, output, chunk_size=chunk_size)
+
+    assert output.read_bytes() == binary_payload
+    assert written == len(binary_payload)
+
+
+def test_decode_base64_stream_sources(tmp_path, binary_payload):
+    """Test decoding from a path, bytes and text/binary file objects."""
+    encoded = base64.b64encode(binary_payload)
+    path = tmp_path / "scan.b64"
+    path.write_bytes(encoded)
+
+    for source in (path, encoded, io.BytesIO(encoded), io.StringIO(encoded.decode())):
+        out = io.BytesIO()
+        decode_base64_stream(source, out, chunk_size=64)
+        assert out.getvalue() == binary_payload
+
+
+@pytest.mark.parametrize("text", ["YQ==YWJj", "YQ=\n=", "Y=Q=", "YWJjZA", "YWJjZ", "YW=Jj"])
+def test_iter_base64_decode_padding_like_b64decode(text):
+    """Test padding and error handling identical to base64.b64decode."""
+    try:
+        expected = base64.b64decode(text)
+    except binascii.Error:
+        with pytest.raises(binascii.Error):
+            b"".join(iter_base64_decode(text, chunk_size=2))
+    else:
+        assert b"".join(iter_base64_decode(text, chunk_size=2)) == expected
+
+
+def test_decode_base64_stream_rejects_text_destination():
+    """Test that decoded bytes cannot be written to a text stream."""
+    with pytest.raises(TypeError, match="binary mode"):
+        decode_base64_stream("YWJj", io.StringIO())
@@ -94,3 +94,67 @@ class TestWeFact:
         client = WeFact(api_key="test_key")
         assert hasattr(client.transactions, 'list')
         assert hasattr(client.transactions, 'create')
+    
+    def test_resources_share_session(self):
+        """Test all resources share the client's pooled session."""
+        client = WeFact(api_key="test_key")
+        assert client.invoices.session is client.session
+        assert client.debtors.session is client.session
+    
+    def test_pool_configuration(self):
+        """Test connection pool settings are applied to the session adapter."""
+        client = WeFact(api_key="test_key", pool_connections=2, pool_maxsize=20, pool_block=True)
+        adapter = client.session.get_adapter(client.api_url)
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 20
+        assert adapter._pool_block is True
+    
+    def test_keep_alive_disabled(self):
+        """Test disabling keep-alive sends Connection: close."""
+        client = WeFact(api_key="test_key", keep_alive=False)
+        assert client.session.headers["Connection"] == "close"
+    
+    def test_context_manager_closes_session(self, mocker):
+        """Test the client closes its session when used as a context manager."""
+        with WeFact(api_key="test_key") as client:
+            mock_close = mocker.patch.object(client.session, "close")
+        mock_close.assert_called_once()
+
+    def test_resources_are_cached(self):
+        """Test each resource is created once and reused."""
+        client = WeFact(api_key="test_key")
+        assert client.invoices is client.invoices
+        assert client.invoices is not client.quotes
+        assert WeFact(api_key="test_key").invoices is not client.invoices
+
+    def test_resources_created_once_across_threads(self, mocker):
+        """Test concurrent first access creates a single resource."""
+        from concurrent.futures import ThreadPoolExecutor
+        from wefact.resources import InvoiceResource
+
+        client = WeFact(api_key="test_key")
+        init = mocker.spy(InvoiceResource, "__init__")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            resources = list(executor.map(lambda _: client.invoices, range(64)))
+        assert init.call_count == 1
+        assert all(resource is resources[0] for resource in resources)
+
+    def test_resources_share_context(self):
+        """Test transport settings changed on the client reach cached resources."""
+        client = WeFact(api_key="test_key")
+        invoices = client.invoices
+        assert invoices.context is client.context
+        client.retry_policy = None
+        client.timeout = (1, 2)
+        assert invoices.retry_policy is None
+        assert invoices.timeout == (1, 2)
+
+    def test_context_get_or_create(self):
+        """Test shared per-client objects are created once."""
+        client = WeFact(api_key="test_key")
+        calls = []
+        first = client.context.get_or_create("metrics", lambda: calls.append(1) or {})
+        second = client.invoices.context.get_or_create("metrics", lambda: calls.append(1) or {})
+        assert first is second
+        assert calls == [1]
+        assert client.context.get("missing") is None
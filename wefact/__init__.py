@@ -1,19 +1,58 @@
 # This file initializes the WeFact package and can include package-level documentation.
+#
+# Public names are imported from their modules on first access (PEP 562), so
+# ``import wefact`` stays cheap for short-lived scripts; requests is loaded
+# when the first client is created.
 
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_imports
 from .version import __version__
-from .wefact import WeFact
-from .utils import (
-    convert_to_base64,
-    decode_base64_to_file,
-    format_date_for_api,
-    format_datetime_for_api,
-)
+
+if TYPE_CHECKING:
+    from .wefact import WeFact
+    from .async_wefact import AsyncWeFact
+    from .timeouts import deadline
+    from .export import export_pdfs
+    from .utils import (
+        convert_to_base64,
+        decode_base64_stream,
+        decode_base64_to_file,
+        encode_base64_stream,
+        format_date_for_api,
+        format_datetime_for_api,
+    )
+
+# Public name -> module defining it
+_LAZY_IMPORTS = {
+    'WeFact': 'wefact',
+    'AsyncWeFact': 'async_wefact',
+    'deadline': 'timeouts',
+    'export_pdfs': 'export',
+    **dict.fromkeys((
+        'convert_to_base64',
+        'decode_base64_stream',
+        'decode_base64_to_file',
+        'encode_base64_stream',
+        'format_date_for_api',
+        'format_datetime_for_api',
+    ), 'utils'),
+}
+
+
+__getattr__, __dir__ = lazy_imports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     '__version__',
     'WeFact',
+    'AsyncWeFact',
+    'deadline',
+    'export_pdfs',
     'convert_to_base64',
+    'decode_base64_stream',
     'decode_base64_to_file',
+    'encode_base64_stream',
     'format_date_for_api',
     'format_datetime_for_api',
-]
\ No newline at end of file
+]
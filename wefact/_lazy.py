@@ -0,0 +1,39 @@
+"""Lazy imports of public names for package ``__init__`` modules (PEP 562)."""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+def lazy_imports(
+    package: str,
+    namespace: Dict[str, Any],
+    imports: Mapping[str, str],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module ``__getattr__`` and ``__dir__`` of a package.
+
+    A name is imported from its submodule on first access and stored in the
+    package namespace, so later lookups do not go through ``__getattr__``.
+
+    Args:
+        package: ``__name__`` of the package
+        namespace: ``globals()`` of the package
+        imports: Public name -> submodule (relative to the package) defining it
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_imports(__name__, globals(), _LAZY_IMPORTS)
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module = imports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(import_module(f".{module}", package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(namespace.get('__all__', ())))
+
+    return __getattr__, __dir__
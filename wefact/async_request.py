@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from .config import DEFAULT_DOWNLOAD_CHUNK_SIZE
+from .exceptions import (
+    ClientError,
+    RequestTimeoutError,
+    ServerError,
+    TransportError,
+    ValidationError,
+    WeFactAPIError,
+)
+from .request import RequestBody, RequestMixin, _download_result
+from .response import ApiResponse
+from .streaming import Base64FieldParser, DownloadDestination, DownloadTarget, StreamingFormBody
+from .timeouts import current_deadline, remaining_time
+
+
+def require_httpx() -> None:
+    """Raise a helpful ImportError when the optional httpx dependency is missing."""
+    if httpx is None:
+        raise ImportError(
+            "The async client requires httpx. "
+            "Install it with: pip install wefact-python[async]"
+        )
+
+
+class AsyncRequestMixin(RequestMixin):
+    """
+    Awaitable counterpart of RequestMixin.
+
+    Shares parameter validation, form encoding and response/error handling
+    with the sync client; only the transport is asynchronous (httpx).
+    """
+
+    session: Optional["httpx.AsyncClient"] = None
+
+    async def _send_request(self, controller: str, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        require_httpx()
+        cache_slot, cached = self._cache_lookup(controller, action, params)
+        if cached is not None:
+            return cached
+
+        encoded_data = self._encode_request(controller, action, params)
+
+        async def send(body: RequestBody, expires: Optional[float]) -> Dict[str, Any]:
+            return await self._post(body, expires, controller, action)
+
+        try:
+            data = await self._send_with_retries(action, encoded_data, send)
+        except (ServerError, TransportError):
+            # The call may have been applied before it failed
+            self._cache_invalidate(controller, action)
+            raise
+        self._cache_invalidate(controller, action)
+        self._cache_store(cache_slot, controller, data)
+        return data
+
+    async def _download_to(
+        self,
+        controller: str,
+        action: str,
+        params: Dict[str, Any],
+        destination: DownloadDestination,
+    ) -> Dict[str, Any]:
+        """Send a download request and stream its Base64 content into destination."""
+        require_httpx()
+        encoded_data = self._encode_request(controller, action, params)
+        with DownloadTarget(destination) as target:
+            async def send(body: RequestBody, expires: Optional[float]) -> Dict[str, Any]:
+                return await self._post_download(body, expires, target, controller, action)
+
+            return await self._send_with_retries(action, encoded_data, send, target)
+
+    async def _send_with_retries(
+        self,
+        action: str,
+        encoded_data: RequestBody,
+        send: Callable[[RequestBody, Optional[float]], Awaitable[Dict[str, Any]]],
+        target: Optional[DownloadTarget] = None,
+    ) -> Dict[str, Any]:
+        """Await ``send`` until it succeeds or the retry policy gives up."""
+        expires = current_deadline()
+
+        attempt = 1
+        while True:
+            try:
+                return await _within_deadline(send(encoded_data, expires), expires)
+            except WeFactAPIError as e:
+                policy = self._retry_policy_for(encoded_data, target)
+                if policy is None or not policy.should_retry(action, e, attempt):
+                    raise
+                delay = policy.backoff(attempt, e)
+                if expires is not None and time.monotonic() + delay >= expires:
+                    # No time left for another attempt
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _post(
+        self,
+        encoded_data: RequestBody,
+        expires: Optional[float] = None,
+        controller: Optional[str] = None,
+        action: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send one request attempt and process its response."""
+        async with self._stream_post(encoded_data, expires) as response:
+            with _transport_errors():
+                await response.aread()
+
+        return self._process_response(response, controller, action)
+
+    async def _post_download(
+        self,
+        encoded_data: RequestBody,
+        expires: Optional[float],
+        target: DownloadTarget,
+        controller: Optional[str] = None,
+        action: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send one download attempt, decoding the Base64 field while it is received."""
+        async with self._stream_post(encoded_data, expires) as response:
+            with self._observe(ApiResponse(response, controller, action)) as parsed:
+                if not parsed.ok:
+                    with _transport_errors():
+                        await response.aread()
+                    parsed.raise_for_status()
+
+                parser = Base64FieldParser(target.open())
+                try:
+                    with _transport_errors():
+                        async for chunk in response.aiter_bytes(DEFAULT_DOWNLOAD_CHUNK_SIZE):
+                            parser.feed(chunk)
+                    parsed.set_json(parser.close())
+                except ValueError as e:
+                    raise ValidationError('Invalid JSON response') from e
+
+                return _download_result(parsed, parser)
+
+    @asynccontextmanager
+    async def _stream_post(self, encoded_data: RequestBody, expires: Optional[float]) -> AsyncIterator[Any]:
+        """POST a request body through the rate limiter and yield the unread response."""
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        content: Any = encoded_data
+        if isinstance(encoded_data, StreamingFormBody):
+            # Sent chunked unless the length is known; measuring it encodes the files
+            length = await asyncio.to_thread(getattr, encoded_data, 'content_length')
+            if length is not None:
+                headers['Content-Length'] = str(length)
+            content = encoded_data.aiter_chunks()
+
+        # Wait for the client-wide request budget, without overrunning the deadline
+        if self.rate_limiter is not None:
+            if not await self.rate_limiter.acquire_async(timeout=remaining_time(expires)):
+                raise RequestTimeoutError('Deadline exceeded while waiting for the rate limiter')
+
+        request_timeout = self._request_timeout(expires)
+        if request_timeout is None:
+            timeout = httpx.Timeout(None)
+        else:
+            connect, read = request_timeout
+            timeout = httpx.Timeout(read, connect=connect)
+
+        async with AsyncExitStack() as stack:
+            client = self.session
+            if client is None:
+                client = await stack.enter_async_context(httpx.AsyncClient())
+            with _transport_errors():
+                response = await stack.enter_async_context(client.stream(
+                    'POST', self.api_url, content=content, headers=headers, timeout=timeout
+                ))
+            yield response
+
+
+async def _within_deadline(attempt: Awaitable[Dict[str, Any]], expires: Optional[float]) -> Dict[str, Any]:
+    """Await one attempt, cancelling it when the deadline passes (also while reading the response)."""
+    timeout = asyncio.timeout(remaining_time(expires))
+    try:
+        async with timeout:
+            return await attempt
+    except TimeoutError:
+        if timeout.expired():
+            raise RequestTimeoutError('Deadline exceeded') from None
+        raise
+
+
+@contextmanager
+def _transport_errors() -> Iterator[None]:
+    """Map httpx exceptions to client exceptions."""
+    try:
+        yield
+    except httpx.TimeoutException as e:
+        raise RequestTimeoutError(str(e)) from e
+    except httpx.TransportError as e:
+        # Connection refused/reset: may succeed when retried
+        raise TransportError(str(e)) from e
+    except httpx.HTTPError as e:
+        # Network/transport error
+        raise ClientError(str(e)) from e
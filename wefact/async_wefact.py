@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Optional, Union
+
+from . import resources
+from .async_request import httpx, require_httpx
+from .config import (
+    DEFAULT_API_URL,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+)
+from .context import ClientContext, ContextAttribute
+from .rate_limit import RateLimitBackend, TokenBucket
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
+
+if TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .identifiers import IdentifierIndex
+    from .resources import (
+        AsyncInvoiceResource,
+        AsyncCreditInvoiceResource,
+        AsyncDebtorResource,
+        AsyncProductResource,
+        AsyncCreditorResource,
+        AsyncGroupResource,
+        AsyncSubscriptionResource,
+        AsyncSettingsResource,
+        AsyncCostCategoryResource,
+        AsyncInteractionResource,
+        AsyncQuoteResource,
+        AsyncTaskResource,
+        AsyncTransactionResource,
+    )
+
+
+class AsyncWeFact:
+    """
+    Asyncio WeFact API client (requires the optional ``httpx`` dependency).
+
+    Mirrors WeFact: the same resources and actions, but every call returns an
+    awaitable. All resources share one ``httpx.AsyncClient``, so many
+    in-flight requests can be multiplexed on a single event loop:
+
+        async with AsyncWeFact(api_key="...") as client:
+            invoices = await client.invoices.list()
+
+    Args:
+        api_key: WeFact API key
+        api_url: API base URL
+        max_connections: Maximum number of concurrent connections
+        max_keepalive_connections: Maximum number of idle connections kept alive
+        keep_alive: Reuse connections between requests
+        requests_per_minute: Client-wide request budget enforced before every
+            request. ``None`` disables client-side rate limiting.
+        burst: Number of requests that may be sent back-to-back
+        rate_limiter: Use this limiter instead of creating one, e.g. to share
+            a budget between several clients
+        rate_limit_backend: Where the default limiter keeps its state, e.g. a
+            FileLockBackend to share the budget between processes
+        retry: Retry policy for transient failures. By default only safe
+            (read-only) actions are retried; ``None`` disables retries.
+        connect_timeout: Seconds to wait for a connection to the API
+        read_timeout: Seconds to wait for response data. Pass None for both
+            timeouts to wait indefinitely. Use ``wefact.deadline()`` to bound
+            the total time of a call including retries and rate limit waits.
+        cache: Cache responses of read-only calls (list/show). True uses an
+            in-memory wefact.cache.ResponseCache with default settings; pass
+            a ResponseCache to configure TTLs, size or an on-disk backend.
+        identifiers: Keep a code/Identifier index (wefact.identifiers.
+            IdentifierIndex) filled from responses, used by the resources'
+            ``resolve()`` / ``resolve_code()``. True keeps it in memory, a
+            path loads it from (and ``save()``s it to) a JSON file.
+
+    Resources are created on first access and then reused, so
+    ``client.invoices`` always returns the same object. They share the
+    client's ``context`` (a ClientContext): changing ``session``,
+    ``rate_limiter``, ``retry_policy`` or ``timeout`` on the client applies
+    to all of its resources.
+    """
+
+    api_key = ContextAttribute()
+    api_url = ContextAttribute()
+    session = ContextAttribute()
+    rate_limiter = ContextAttribute()
+    retry_policy = ContextAttribute()
+    timeout = ContextAttribute()
+    cache = ContextAttribute()
+
+    @property
+    def identifiers(self) -> Optional[IdentifierIndex]:
+        """Code/Identifier index of this client, if enabled."""
+        return self.context.identifiers
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = DEFAULT_API_URL,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keep_alive: bool = True,
+        requests_per_minute: Optional[float] = DEFAULT_REQUESTS_PER_MINUTE,
+        burst: float = DEFAULT_RATE_LIMIT_BURST,
+        rate_limiter: Optional[TokenBucket] = None,
+        rate_limit_backend: Optional[RateLimitBackend] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+        cache: Union[bool, ResponseCache, None] = None,
+        identifiers: Union[bool, str, os.PathLike, IdentifierIndex, None] = None,
+    ):
+        require_httpx()
+        if not isinstance(api_key, str):
+            raise TypeError(
+                f"api_key must be a string, got {type(api_key).__name__}. "
+                "Did you forget quotes? Use: AsyncWeFact(api_key='your_key_here')"
+            )
+        if not api_key or not api_key.strip():
+            raise ValueError("api_key cannot be empty")
+
+        self.context = ClientContext(api_key, api_url)
+        self.session = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections if keep_alive else 0,
+            ),
+        )
+
+        if rate_limiter is None and requests_per_minute is not None:
+            rate_limiter = TokenBucket.per_minute(
+                requests_per_minute, burst, backend=rate_limit_backend
+            )
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry
+        self.timeout = (connect_timeout, read_timeout)
+        if cache is True:
+            from .cache import ResponseCache
+
+            cache = ResponseCache()
+        self.cache = cache or None
+        if identifiers is not None and identifiers is not False:
+            from .identifiers import IdentifierIndex
+
+            if not isinstance(identifiers, IdentifierIndex):
+                identifiers = IdentifierIndex(None if identifiers is True else identifiers)
+            identifiers.attach(self.context)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and release pooled connections."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncWeFact":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    @property
+    def invoices(self) -> AsyncInvoiceResource:
+        return self.context.resource(resources.AsyncInvoiceResource)
+
+    @property
+    def credit_invoices(self) -> AsyncCreditInvoiceResource:
+        return self.context.resource(resources.AsyncCreditInvoiceResource)
+
+    @property
+    def debtors(self) -> AsyncDebtorResource:
+        return self.context.resource(resources.AsyncDebtorResource)
+
+    @property
+    def products(self) -> AsyncProductResource:
+        return self.context.resource(resources.AsyncProductResource)
+
+    @property
+    def creditors(self) -> AsyncCreditorResource:
+        return self.context.resource(resources.AsyncCreditorResource)
+
+    @property
+    def groups(self) -> AsyncGroupResource:
+        return self.context.resource(resources.AsyncGroupResource)
+
+    @property
+    def subscriptions(self) -> AsyncSubscriptionResource:
+        return self.context.resource(resources.AsyncSubscriptionResource)
+
+    @property
+    def settings(self) -> AsyncSettingsResource:
+        return self.context.resource(resources.AsyncSettingsResource)
+
+    @property
+    def cost_categories(self) -> AsyncCostCategoryResource:
+        return self.context.resource(resources.AsyncCostCategoryResource)
+
+    @property
+    def interactions(self) -> AsyncInteractionResource:
+        return self.context.resource(resources.AsyncInteractionResource)
+
+    @property
+    def quotes(self) -> AsyncQuoteResource:
+        return self.context.resource(resources.AsyncQuoteResource)
+
+    @property
+    def tasks(self) -> AsyncTaskResource:
+        return self.context.resource(resources.AsyncTaskResource)
+
+    @property
+    def transactions(self) -> AsyncTransactionResource:
+        return self.context.resource(resources.AsyncTransactionResource)
@@ -0,0 +1,419 @@
+"""Opt-in response cache for read-only WeFact API calls."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple, Union
+
+from .request import encode_params
+from .retry import SAFE_ACTIONS
+from .streaming import is_file_source
+
+__all__ = [
+    "CACHED_ACTIONS",
+    "RELATED_CONTROLLERS",
+    "CacheStats",
+    "CacheBackend",
+    "MemoryBackend",
+    "SQLiteBackend",
+    "ResponseCache",
+]
+
+# Read-only actions whose responses are cached by default. Downloads are
+# left out: their Base64 payloads are large and rarely requested twice.
+CACHED_ACTIONS: FrozenSet[str] = frozenset({
+    "list",
+    "show",
+    "costcategory_list",
+    "costcategory_show",
+})
+
+# Other controllers whose responses a successful mutating call may change,
+# keyed by controller or "controller.action". The called controller itself
+# is always invalidated, e.g. invoice.markaspaid drops the cached invoice
+# lists and shows.
+RELATED_CONTROLLERS: Mapping[str, Tuple[str, ...]] = {
+    # Group memberships are shown on groups as well as on their members
+    "debtor": ("group",),
+    "product": ("group",),
+    "group": ("debtor", "product"),
+    # Accepting a quote can create an invoice
+    "pricequote.accept": ("invoice",),
+    # Matching a bank transaction pays invoices and purchase invoices
+    "transaction.match": ("invoice", "creditinvoice"),
+}
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Snapshot of response cache metrics.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that had to call the API.
+        stores: Responses written to the cache.
+        evictions: Entries dropped to stay within the size bound.
+        invalidations: Entries removed by invalidate().
+        size: Number of entries currently stored (including expired ones
+            not yet purged).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheBackend(ABC):
+    """
+    Storage for cached responses.
+
+    Entries are JSON strings stored under a key with the controller they
+    belong to and an expiry time. Backends evict least recently used entries
+    beyond their size bound. Implementations must be thread-safe.
+    """
+
+    @abstractmethod
+    def get(self, key: str, now: float) -> Optional[str]:
+        """Return the stored value, or None when missing or expired at ``now``."""
+
+    @abstractmethod
+    def set(self, key: str, controller: str, value: str, expires: float) -> int:
+        """Store a value until ``expires``. Returns the number of entries evicted."""
+
+    @abstractmethod
+    def invalidate(self, controller: Optional[str] = None) -> int:
+        """Remove the entries of a controller (all entries if None). Returns the count."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet removed."""
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+
+class MemoryBackend(CacheBackend):
+    """In-process LRU cache shared by all threads of this process."""
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, controller: str, value: str, expires: float) -> int:
+        with self._lock:
+            self._entries[key] = (controller, value, expires)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def invalidate(self, controller: Optional[str] = None) -> int:
+        with self._lock:
+            if controller is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            keys = [key for key, entry in self._entries.items() if entry[0] == controller]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    LRU cache in an SQLite database file.
+
+    Survives restarts and can be shared by processes on one host (the
+    database uses WAL journaling). Expiry times are wall-clock timestamps,
+    so use it with the default ``time.time`` clock of ResponseCache.
+
+    Args:
+        path: Database file; ``":memory:"`` for a private in-memory database
+        maxsize: Maximum number of entries kept
+    """
+
+    def __init__(self, path: Union[str, Path], maxsize: int = 10000):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.path = str(path)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS response_cache (
+                key TEXT PRIMARY KEY,
+                controller TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires REAL NOT NULL,
+                used INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS response_cache_controller ON response_cache (controller);
+            CREATE INDEX IF NOT EXISTS response_cache_used ON response_cache (used);
+            """
+        )
+
+    def get(self, key: str, now: float) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._db.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                return None
+            self._db.execute(
+                "UPDATE response_cache SET used = (SELECT MAX(used) + 1 FROM response_cache) WHERE key = ?",
+                (key,),
+            )
+            return row[0]
+
+    def set(self, key: str, controller: str, value: str, expires: float) -> int:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO response_cache (key, controller, value, expires, used) "
+                "VALUES (?, ?, ?, ?, (SELECT COALESCE(MAX(used), 0) + 1 FROM response_cache))",
+                (key, controller, value, expires),
+            )
+            evicted = self._db.execute(
+                "DELETE FROM response_cache WHERE key IN ("
+                "SELECT key FROM response_cache ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            ).rowcount
+            return max(evicted, 0)
+
+    def invalidate(self, controller: Optional[str] = None) -> int:
+        with self._lock:
+            if controller is None:
+                cursor = self._db.execute("DELETE FROM response_cache")
+            else:
+                cursor = self._db.execute("DELETE FROM response_cache WHERE controller = ?", (controller,))
+            return max(cursor.rowcount, 0)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def _normalized(value: Any) -> Any:
+    """Params with dict keys in a fixed order, so equal calls share a cache key."""
+    if isinstance(value, Mapping):
+        return {key: _normalized(value[key]) for key in sorted(value, key=str)}
+    if isinstance(value, (list, tuple)):
+        return [_normalized(item) for item in value]
+    return value
+
+
+class ResponseCache:
+    """
+    Cache for responses of read-only API calls.
+
+    Enable it on a client with ``WeFact(api_key, cache=True)`` or pass a
+    configured instance. Responses of the actions in ``actions`` (list and
+    show by default) are stored under a key built from the API account,
+    controller, action and the call's parameters in a normalized order; a
+    repeated call with equal parameters is answered without a request until
+    its TTL expires. Every hit returns a fresh copy, so callers may modify
+    results.
+
+    Any other action is treated as a mutation: once it succeeds (or fails in
+    a way that may have applied it, such as a timeout or 5xx response), the
+    cached responses of its controller and the controllers listed for it in
+    ``related`` are dropped. A read that was in flight while they were
+    dropped is not stored, so later reads never see the state from before
+    the mutation.
+
+    Args:
+        backend: Storage (default: a MemoryBackend holding ``maxsize`` entries)
+        ttl: Seconds a response stays valid
+        ttls: Per-controller TTLs overriding ``ttl``; 0 disables caching for
+            a controller, e.g. ``{"invoice": 10, "settings": 3600}``
+        maxsize: Size bound of the default backend
+        actions: Actions whose responses are cached
+        related: Controllers invalidated along with a mutated controller
+            (see RELATED_CONTROLLERS)
+        clock: Wall-clock time source, overridable for testing
+
+    Example:
+        >>> cache = ResponseCache(SQLiteBackend("wefact-cache.db"), ttls={"product": 3600})
+        >>> client = WeFact(api_key="...", cache=cache)
+        >>> client.products.show(ProductCode="P0001")  # API call
+        >>> client.products.show(ProductCode="P0001")  # From the cache
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        ttl: float = 60.0,
+        ttls: Optional[Mapping[str, float]] = None,
+        maxsize: int = 1024,
+        actions: FrozenSet[str] = CACHED_ACTIONS,
+        related: Mapping[str, Tuple[str, ...]] = RELATED_CONTROLLERS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.backend = backend if backend is not None else MemoryBackend(maxsize)
+        self.ttl = ttl
+        self.ttls: Dict[str, float] = dict(ttls or {})
+        self.actions = frozenset(actions)
+        self.related = dict(related)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._invalidations = 0
+        # Invalidation counter, and its value at the last invalidation of
+        # each controller (None: all controllers)
+        self._generation = 0
+        self._invalidated: Dict[Optional[str], int] = {}
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current metrics snapshot."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self.backend),
+            )
+
+    def ttl_for(self, controller: str) -> float:
+        """TTL in seconds for responses of ``controller``."""
+        return self.ttls.get(controller, self.ttl)
+
+    def key(self, api_key: str, controller: str, action: Any, params: Mapping[str, Any]) -> Optional[str]:
+        """
+        Cache key of a call, or None when the call is not cached.
+
+        Calls are not cached when the action is not in ``actions``, the
+        controller's TTL is 0 or a parameter is a file to upload.
+        """
+        action = getattr(action, "value", action)
+        if action not in self.actions or self.ttl_for(controller) <= 0:
+            return None
+        if any(is_file_source(value) for value in params.values()):
+            return None
+        # Keys are scoped per account without storing the API key itself
+        account = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        return f"{account}:{controller}:{action}:{encode_params(_normalized(params))}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached response, or None on a miss."""
+        value = self.backend.get(key, self._clock())
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return json.loads(value)
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter; pass its value from before a request to set()."""
+        return self._generation
+
+    def set(self, key: str, controller: str, data: Dict[str, Any], generation: Optional[int] = None) -> None:
+        """
+        Cache a response of ``controller`` for its TTL.
+
+        Args:
+            key: Key returned by key()
+            controller: Controller of the call
+            data: Parsed response
+            generation: ``generation`` read before the request was sent; the
+                response is dropped when the controller was invalidated since
+        """
+        if generation is not None and self._invalidated_since(controller, generation):
+            return
+        value = json.dumps(data, separators=(",", ":"))
+        evicted = self.backend.set(key, controller, value, self._clock() + self.ttl_for(controller))
+        with self._lock:
+            self._stores += 1
+            self._evictions += evicted
+
+    def _invalidated_since(self, controller: str, generation: int) -> bool:
+        with self._lock:
+            last = max(self._invalidated.get(controller, 0), self._invalidated.get(None, 0))
+        return last > generation
+
+    def invalidate(self, controller: Optional[str] = None) -> int:
+        """Drop the cached responses of ``controller`` (all if None). Returns the count."""
+        with self._lock:
+            self._generation += 1
+            self._invalidated[controller] = self._generation
+        count = self.backend.invalidate(controller)
+        with self._lock:
+            self._invalidations += count
+        return count
+
+    def affected(self, controller: str, action: Any) -> Tuple[str, ...]:
+        """Controllers whose cached responses ``action`` may change (none for reads)."""
+        action = getattr(action, "value", action)
+        if action in self.actions or action in SAFE_ACTIONS:
+            return ()
+        controllers = [controller]
+        for related in self.related.get(controller, ()) + self.related.get(f"{controller}.{action}", ()):
+            if related not in controllers:
+                controllers.append(related)
+        return tuple(controllers)
+
+    def invalidate_after(self, controller: str, action: Any) -> int:
+        """Drop the cached responses made stale by a mutating call. Returns the count."""
+        return sum(self.invalidate(affected) for affected in self.affected(controller, action))
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self.invalidate()
+
+    def close(self) -> None:
+        """Close the backend."""
+        self.backend.close()
@@ -1,3 +1,28 @@
 # File: /wefact-python/wefact-python/src/wefact/config.py
 
-DEFAULT_API_URL = "https://api.mijnwefact.nl/v2/"
\ No newline at end of file
+DEFAULT_API_URL = "https://api.mijnwefact.nl/v2/"
+
+# Connection pool defaults (see requests.adapters.HTTPAdapter)
+DEFAULT_POOL_CONNECTIONS = 10  # Number of per-host pools to keep
+DEFAULT_POOL_MAXSIZE = 10  # Maximum connections kept open per host
+
+# Async client (httpx) connection limits
+DEFAULT_MAX_CONNECTIONS = 100  # Maximum concurrent connections
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20  # Idle connections kept alive
+
+# WeFact API rate limit
+DEFAULT_REQUESTS_PER_MINUTE = 300
+DEFAULT_RATE_LIMIT_BURST = 5  # Requests that may be sent back-to-back
+
+# Request timeouts (seconds)
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 60.0
+
+# Attachment uploads: raw bytes Base64-encoded per chunk (a multiple of 3)
+DEFAULT_UPLOAD_CHUNK_SIZE = 3 * 64 * 1024
+
+# Streaming Base64 helpers (wefact.utils): raw bytes encoded per chunk
+DEFAULT_BASE64_CHUNK_SIZE = 3 * 256 * 1024
+
+# Streamed downloads: bytes of the response read at a time
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 64 * 1024
@@ -0,0 +1,125 @@
+"""Per-client state shared by all resources of a WeFact client."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Tuple, Type, TypeVar
+
+from .config import DEFAULT_API_URL
+from .request import Timeout
+
+if TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .identifiers import IdentifierIndex
+    from .response import ResponseHook
+
+T = TypeVar("T")
+
+
+@dataclass(eq=False)
+class ClientContext:
+    """
+    Transport settings and shared objects of one client.
+
+    A client creates a single context and every resource it hands out refers
+    to it, so replacing e.g. the session or rate limiter on the client is seen
+    by all of its resources. Components that keep per-client state (pooling,
+    response caches, metrics) register it with ``get_or_create()`` so it is
+    created once and shared by all resources and threads, and can observe
+    every response through ``add_response_hook()``.
+
+    Args:
+        api_key: WeFact API key
+        api_url: API base URL
+        session: HTTP session (``requests.Session`` or ``httpx.AsyncClient``)
+        rate_limiter: Client-wide request budget, or None
+        retry_policy: Retry policy for transient failures, or None
+        timeout: Connect/read timeout of each request
+        cache: Cache for responses of read-only calls, or None
+        identifiers: Code/Identifier index used by ``resolve()``, or None
+        response_hooks: Callables observing every response, see
+            add_response_hook()
+    """
+
+    api_key: str
+    api_url: str = DEFAULT_API_URL
+    session: Any = None
+    rate_limiter: Any = None
+    retry_policy: Any = None
+    timeout: Optional[Timeout] = None
+    cache: Optional[ResponseCache] = None
+    identifiers: Optional[IdentifierIndex] = None
+    response_hooks: Tuple[ResponseHook, ...] = ()
+    _shared: Dict[Hashable, Any] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Return the object registered under ``key``, creating it on first use.
+
+        Thread-safe: ``factory`` runs at most once per key, even when several
+        threads ask for the same key at the same time.
+
+        Args:
+            key: Name (or class) identifying the shared object
+            factory: Called without arguments to create the object
+
+        Returns:
+            The shared object
+        """
+        try:
+            return self._shared[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._shared:
+                self._shared[key] = factory()
+            return self._shared[key]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the object registered under ``key``, or ``default``."""
+        return self._shared.get(key, default)
+
+    def add_response_hook(self, hook: ResponseHook) -> ResponseHook:
+        """
+        Call ``hook`` with the ApiResponse of every request attempt.
+
+        The hook gets the already parsed response (see wefact.response), after
+        success handling and error mapping; ``response.error`` holds the
+        exception raised for it, if any. Exceptions raised by the hook
+        propagate to the caller. Returns the hook, so this can be used as a
+        decorator.
+        """
+        with self._lock:
+            self.response_hooks = (*self.response_hooks, hook)
+        return hook
+
+    def remove_response_hook(self, hook: ResponseHook) -> None:
+        """Stop calling a hook added with add_response_hook()."""
+        with self._lock:
+            hooks = list(self.response_hooks)
+            hooks.remove(hook)
+            self.response_hooks = tuple(hooks)
+
+    def resource(self, resource_cls: Type[T]) -> T:
+        """Return this context's instance of ``resource_cls``, creating it once."""
+        return self.get_or_create(
+            resource_cls,
+            lambda: resource_cls(self.api_key, self.api_url, context=self),
+        )
+
+
+class ContextAttribute:
+    """Attribute stored on the ``context`` of the owning object."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        return getattr(obj.context, self.name)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        setattr(obj.context, self.name, value)
@@ -1,32 +1,85 @@
-from .actions import Action
-from .invoice_actions import InvoiceAction
-from .credit_invoice_actions import CreditInvoiceAction
-from .cost_category_actions import CostCategoryAction
-from .quote_actions import QuoteAction
-from .debtor_actions import DebtorAction
-from .task_actions import TaskAction
-from .transaction_actions import TransactionAction
-from .variables import (
-    PricePeriod,
-    SendMethod,
-    PaymentMethod,
-    InvoiceStatus,
-    CreditInvoiceStatus,
-    QuoteStatus,
-    SubscriptionStatus,
-    TaskStatus,
-    CommunicationMethod,
-    EntityType,
-    Currency,
-    BoolInt,
-    YesNo,
-    VatCalculation,
-    Gender,
-    InvoiceSubStatus,
-    PeriodicType,
-    get_enum_value,
-    get_enum_name,
-)
+"""
+WeFact API enums: controller actions and the values of API variables.
+
+Names are imported from their submodule on first access.
+"""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_imports
+
+if TYPE_CHECKING:
+    from .actions import Action
+    from .invoice_actions import InvoiceAction
+    from .credit_invoice_actions import CreditInvoiceAction
+    from .cost_category_actions import CostCategoryAction
+    from .quote_actions import QuoteAction
+    from .debtor_actions import DebtorAction
+    from .task_actions import TaskAction
+    from .transaction_actions import TransactionAction
+    from .variables import (
+        PricePeriod,
+        SendMethod,
+        PaymentMethod,
+        InvoiceStatus,
+        CreditInvoiceStatus,
+        QuoteStatus,
+        SubscriptionStatus,
+        TaskStatus,
+        CommunicationMethod,
+        EntityType,
+        Currency,
+        BoolInt,
+        YesNo,
+        VatCalculation,
+        Gender,
+        InvoiceSubStatus,
+        PeriodicType,
+        get_enum_value,
+        get_enum_name,
+        get_enum_values,
+        get_enum_names,
+    )
+
+# Public name -> submodule defining it
+_LAZY_IMPORTS = {
+    'Action': 'actions',
+    'InvoiceAction': 'invoice_actions',
+    'CreditInvoiceAction': 'credit_invoice_actions',
+    'CostCategoryAction': 'cost_category_actions',
+    'QuoteAction': 'quote_actions',
+    'DebtorAction': 'debtor_actions',
+    'TaskAction': 'task_actions',
+    'TransactionAction': 'transaction_actions',
+    **dict.fromkeys((
+        'PricePeriod',
+        'SendMethod',
+        'PaymentMethod',
+        'InvoiceStatus',
+        'CreditInvoiceStatus',
+        'QuoteStatus',
+        'SubscriptionStatus',
+        'TaskStatus',
+        'CommunicationMethod',
+        'EntityType',
+        'Currency',
+        'BoolInt',
+        'YesNo',
+        'VatCalculation',
+        'Gender',
+        'InvoiceSubStatus',
+        'PeriodicType',
+        'get_enum_value',
+        'get_enum_name',
+        'get_enum_values',
+        'get_enum_names',
+    ), 'variables'),
+}
+
+
+__getattr__, __dir__ = lazy_imports(__name__, globals(), _LAZY_IMPORTS)
+
+
 __all__ = [
     'Action',
     'InvoiceAction',
@@ -36,7 +89,6 @@ __all__ = [
     'DebtorAction',
     'TaskAction',
     'TransactionAction',
-    'TransactionAction',
     'PricePeriod',
     'SendMethod',
     'PaymentMethod',
@@ -56,4 +108,6 @@ __all__ = [
     'PeriodicType',
     'get_enum_value',
     'get_enum_name',
+    'get_enum_values',
+    'get_enum_names',
 ]
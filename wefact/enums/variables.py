@@ -8,6 +8,7 @@ Based on: https://developer.wefact.com/variable-list
 """
 
 from enum import Enum
+from functools import lru_cache
 
 
 class PricePeriod(str, Enum):
@@ -238,6 +239,71 @@ class PeriodicType(str, Enum):
 
 
 # Helper functions to convert between enum names and values
+
+_MISSING = object()
+
+# Partial name matches remembered per enum; bounds memory for arbitrary input
+_MAX_PARTIAL_MATCHES = 1024
+
+
+class _EnumIndex:
+    """Lookup tables of one enum class, built on first use."""
+
+    __slots__ = ('enum_class', 'values', 'names', 'value_names', 'partial')
+
+    def __init__(self, enum_class):
+        members = list(enum_class)
+        self.enum_class = enum_class
+        # First member wins, as with a scan in definition order
+        self.values = {}
+        self.value_names = {}
+        for item in members:
+            self.values.setdefault(item.value, item.value)
+            self.value_names.setdefault(item.value, item.name)
+        # Includes aliases, like enum_class[name]
+        self.names = {name: item.value for name, item in enum_class.__members__.items()}
+        # Upper-cased query -> value of the first member whose name contains it
+        self.partial = {}
+
+    def value(self, name_or_value):
+        key = _lookup_key(name_or_value)
+        try:
+            return self.values[key]
+        except (KeyError, TypeError):
+            pass
+
+        name_upper = str(name_or_value).upper()
+        value = self.names.get(name_upper, _MISSING)
+        if value is _MISSING:
+            value = self.partial.get(name_upper, _MISSING)
+        if value is _MISSING:
+            value = next((item.value for item in self.enum_class if name_upper in item.name), None)
+            if len(self.partial) < _MAX_PARTIAL_MATCHES:
+                self.partial[name_upper] = value
+        if value is None:
+            raise ValueError(f"Invalid {self.enum_class.__name__}: {name_or_value}")
+        return value
+
+    def name(self, value):
+        try:
+            return self.value_names[_lookup_key(value)]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid {self.enum_class.__name__} value: {value}") from None
+
+
+def _lookup_key(value):
+    """Dictionary key matching ``item.value == value`` for a str enum member."""
+    # Members of str enums compare as their value but hash as their name
+    if isinstance(value, Enum) and isinstance(value, str):
+        return str.__str__(value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _enum_index(enum_class):
+    return _EnumIndex(enum_class)
+
+
 def get_enum_value(enum_class, name_or_value):
     """
     Get enum value from name or value (case-insensitive)
@@ -247,22 +313,7 @@ def get_enum_value(enum_class, name_or_value):
         get_enum_value(PricePeriod, 'month')    # Returns 'm'
         get_enum_value(PricePeriod, 'm')        # Returns 'm'
     """
-    name_upper = str(name_or_value).upper()
-    
-    # Check if it's already a valid value
-    for item in enum_class:
-        if item.value == name_or_value:
-            return item.value
-    
-    # Check if it's a name
-    try:
-        return enum_class[name_upper].value
-    except KeyError:
-        # Check for partial matches in names
-        for item in enum_class:
-            if name_upper in item.name:
-                return item.value
-        raise ValueError(f"Invalid {enum_class.__name__}: {name_or_value}")
+    return _enum_index(enum_class).value(name_or_value)
 
 
 def get_enum_name(enum_class, value):
@@ -272,7 +323,49 @@ def get_enum_name(enum_class, value):
     Usage:
         get_enum_name(PricePeriod, 'm')  # Returns 'MONTHLY'
     """
-    for item in enum_class:
-        if item.value == value:
-            return item.name
-    raise ValueError(f"Invalid {enum_class.__name__} value: {value}")
+    return _enum_index(enum_class).name(value)
+
+
+def get_enum_values(enum_class, names_or_values, default=_MISSING):
+    """
+    Get enum values for a column of names or values, see get_enum_value()
+    
+    Usage:
+        get_enum_values(PricePeriod, ['MONTHLY', 'j', 'year'])  # Returns ['m', 'j', 'j']
+        get_enum_values(PricePeriod, ['m', '?'], default=None)  # Returns ['m', None]
+    
+    Args:
+        enum_class: Enum to look the items up in
+        names_or_values: Iterable of names or values
+        default: Result for invalid items. Invalid items raise ValueError
+            when no default is given.
+    """
+    return _lookup_all(_enum_index(enum_class).value, names_or_values, default)
+
+
+def get_enum_names(enum_class, values, default=_MISSING):
+    """
+    Get enum names for a column of values, see get_enum_name()
+    
+    Usage:
+        get_enum_names(InvoiceStatus, ['0', '4'])  # Returns ['CONCEPT', 'PAID']
+    
+    Args:
+        enum_class: Enum to look the values up in
+        values: Iterable of values
+        default: Result for unknown values. Unknown values raise ValueError
+            when no default is given.
+    """
+    return _lookup_all(_enum_index(enum_class).name, values, default)
+
+
+def _lookup_all(lookup, items, default):
+    if default is _MISSING:
+        return list(map(lookup, items))
+    results = []
+    for item in items:
+        try:
+            results.append(lookup(item))
+        except ValueError:
+            results.append(default)
+    return results
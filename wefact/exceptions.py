@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple, Type
 
 __all__ = [
@@ -9,6 +11,9 @@ __all__ = [
     "ValidationError",
     "ServerError",
     "ClientError",
+    "RateLimitError",
+    "TransportError",
+    "RequestTimeoutError",
     "from_response",
     "raise_for_response",
     "raise_for_wefact_payload",
@@ -27,6 +32,7 @@ class WeFactAPIError(Exception):
         details: Additional error details/payload (dict, list, or raw body).
         request_id: Correlation ID from response headers if provided by the API.
         response: Original response object (requests/httpx) for debugging.
+        retry_after: Seconds to wait before retrying, from a Retry-After header.
     """
 
     def __init__(
@@ -38,6 +44,7 @@ class WeFactAPIError(Exception):
         details: Any = None,
         request_id: Optional[str] = None,
         response: Any = None,
+        retry_after: Optional[float] = None,
     ) -> None:
         super().__init__(message)
         self.message = message
@@ -46,6 +53,7 @@ class WeFactAPIError(Exception):
         self.details = details
         self.request_id = request_id
         self.response = response
+        self.retry_after = retry_after
 
     def __str__(self) -> str:
         parts = []
@@ -85,6 +93,21 @@ class ClientError(WeFactAPIError):
     pass
 
 
+class RateLimitError(ClientError):
+    """Exception raised when the API throttles requests (429 responses)."""
+    pass
+
+
+class TransportError(ClientError):
+    """Exception raised for network/transport failures (connection errors, resets)."""
+    pass
+
+
+class RequestTimeoutError(TransportError):
+    """Exception raised when a connect/read timeout or a call deadline expires."""
+    pass
+
+
 def _pick_exception_class(status: Optional[int]) -> Type[WeFactAPIError]:
     """Map HTTP status to a specific exception class."""
     if status is None:
@@ -93,6 +116,8 @@ def _pick_exception_class(status: Optional[int]) -> Type[WeFactAPIError]:
         return AuthenticationError
     if status == 404:
         return NotFoundError
+    if status == 429:
+        return RateLimitError
     if status in (400, 422):
         return ValidationError
     if 400 <= status < 500:
@@ -143,40 +168,64 @@ def _extract_error_fields(
     return message, code, details
 
 
-def from_response(response: Any) -> WeFactAPIError:
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# Marks a body that was not passed in and still has to be parsed
+_UNSET: Any = object()
+
+
+def _header(headers: Any, *names: str) -> Optional[str]:
+    """First header present under one of ``names``, without copying the headers."""
+    for name in names:
+        try:
+            value = headers.get(name)
+        except Exception:
+            return None
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def from_response(response: Any, body: Any = _UNSET) -> WeFactAPIError:
     """Create a WeFactAPIError (or subclass) from an HTTP response.
 
     Works with 'requests' or 'httpx' responses (duck-typed). Does not raise.
+    Pass the already parsed JSON (or text) ``body`` to avoid decoding the
+    response again.
     """
     status = getattr(response, "status_code", None)
 
     # Attempt to parse body as JSON; fallback to text
-    parsed_body: Any = None
-    body_text: Optional[str] = None
-
-    try:
-        parsed_body = response.json()  # type: ignore[attr-defined]
-    except Exception:
-        body_text = getattr(response, "text", None)
-        parsed_body = body_text if body_text is not None else None
+    if body is _UNSET:
+        try:
+            body = response.json()  # type: ignore[attr-defined]
+        except Exception:
+            body = getattr(response, "text", None)
 
     reason = getattr(response, "reason", None)
     default_message = f"HTTP {status}" + (f" {reason}" if reason else "")
 
-    message, code, details = _extract_error_fields(parsed_body, default_message)
+    message, code, details = _extract_error_fields(body, default_message)
 
     # Try to capture a request/correlation id header if present
-    headers: Dict[str, str] = {}
-    try:
-        headers = dict(getattr(response, "headers", {}) or {})
-    except Exception:
-        headers = {}
-    request_id = (
-        headers.get("X-Request-Id")
-        or headers.get("X-Request-ID")
-        or headers.get("Request-Id")
-        or headers.get("Request-ID")
-    )
+    headers = getattr(response, "headers", None) or {}
+    request_id = _header(headers, "X-Request-Id", "X-Request-ID", "Request-Id", "Request-ID")
+    retry_after = _parse_retry_after(_header(headers, "Retry-After", "retry-after"))
 
     exc_cls = _pick_exception_class(status)
     return exc_cls(
@@ -186,18 +235,20 @@ def from_response(response: Any) -> WeFactAPIError:
         details=details,
         request_id=request_id,
         response=response,
+        retry_after=retry_after,
     )
 
 
-def raise_for_response(response: Any) -> None:
+def raise_for_response(response: Any, body: Any = _UNSET) -> None:
     """Raise a mapped WeFactAPIError if the response indicates an HTTP error.
 
-    No-op if the status is in the 2xx range.
+    No-op if the status is in the 2xx range. ``body`` is passed on to
+    from_response().
     """
     status = getattr(response, "status_code", None)
     if status is not None and 200 <= int(status) < 300:
         return
-    raise from_response(response)
+    raise from_response(response, body)
 
 
 def raise_for_wefact_payload(response: Any, data: Optional[Dict[str, Any]] = None) -> None:
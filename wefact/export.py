@@ -0,0 +1,251 @@
+"""Bulk export of invoice and quote PDFs."""
+
+from __future__ import annotations
+
+import binascii
+import json
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Set, Tuple, Union
+
+from .exceptions import WeFactAPIError
+from .resources.base import BaseResource
+from .timeouts import in_current_context
+
+# Where an export is written: a directory, a .zip path, or a binary stream (ZIP)
+ExportDestination = Union[str, os.PathLike, IO[bytes]]
+
+# Default name of the resume manifest inside an export directory
+MANIFEST_NAME = '.wefact-export.jsonl'
+
+# Fields naming a document, in order of preference
+_NAME_FIELDS = ('InvoiceCode', 'PriceQuoteCode', 'Identifier')
+
+_UNSAFE_NAME = re.compile(r'[^\w.-]+')
+
+
+@dataclass
+class ExportResult:
+    """Outcome of export_pdfs()."""
+
+    exported: int = 0
+    skipped: int = 0  # Already exported by an earlier (interrupted) run
+    failed: Dict[str, str] = field(default_factory=dict)  # Identifier -> error message
+
+
+def export_pdfs(
+    resource: BaseResource,
+    destination: ExportDestination,
+    identifiers: Optional[Iterable[Union[str, int]]] = None,
+    *,
+    workers: int = 4,
+    manifest: Optional[Union[str, os.PathLike]] = None,
+    **filters,
+) -> ExportResult:
+    """
+    Download the PDFs of many invoices or quotes concurrently.
+
+    Documents are listed with iter_all() (summary fields only) unless
+    identifiers are given, and downloaded by ``workers`` threads with
+    download_to(), paced by the client's rate limiter and retried by its
+    retry policy. Each PDF is decoded while it is received, so memory use
+    does not depend on document size.
+
+    A directory receives one ``<code>.pdf`` file per document. A ``.zip``
+    path or a binary stream receives a ZIP archive that is written as
+    documents complete. Completed documents are appended to a manifest
+    (JSON lines), and an interrupted export skips them when run again.
+
+    A ``.zip`` path is built in ``<archive>.part`` and renamed when the
+    export finishes. An export stopped by an exception (e.g. Ctrl+C) closes
+    the partial archive and resumes it on the next run. A process killed
+    before it could close the archive leaves an unreadable ``.part``; the
+    next run discards it and exports every document again. Streams cannot
+    be resumed.
+
+    Args:
+        resource: ``client.invoices`` or ``client.quotes``
+        destination: Directory, path ending in ``.zip``, or binary stream
+        identifiers: Identifiers to export instead of listing all documents
+        workers: Number of concurrent downloads
+        manifest: Path of the resume manifest. Defaults to
+            ``.wefact-export.jsonl`` in the directory, or
+            ``<archive>.manifest.jsonl`` next to a ``.zip``; streams have
+            none unless one is given
+        **filters: List filters used when no identifiers are given
+            (e.g. status, searchat/searchfor)
+
+    Returns:
+        Counts of exported and skipped documents, and per-document failures.
+        Failed documents are not in the manifest and are tried again on the
+        next run.
+
+    Example:
+        >>> export_pdfs(client.invoices, "invoices-2025-01.zip", workers=8)
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        destination = Path(destination)
+        is_archive = destination.suffix.lower() == '.zip'
+        if manifest is None:
+            manifest = (
+                destination.with_name(destination.name + '.manifest.jsonl')
+                if is_archive else destination / MANIFEST_NAME
+            )
+    else:
+        is_archive = True
+
+    if identifiers is not None:
+        documents: Iterable[Dict[str, Any]] = ({'Identifier': str(i)} for i in identifiers)
+    else:
+        documents = resource.iter_all(detail=False, prefetch=1, **filters)
+
+    manifest_path = Path(manifest) if manifest is not None else None
+    completed = _read_manifest(manifest_path)
+    result = ExportResult()
+
+    with ExitStack() as stack:
+        if is_archive:
+            archive = stack.enter_context(_open_archive(destination))
+            exported = set(archive.namelist())
+            staging = Path(stack.enter_context(tempfile.TemporaryDirectory(
+                prefix='wefact-export-',
+                dir=destination.parent if isinstance(destination, Path) else None,
+            )))
+        else:
+            destination.mkdir(parents=True, exist_ok=True)
+            archive = None
+            staging = destination
+
+        log = stack.enter_context(open(manifest_path, 'a')) if manifest_path else None
+
+        def is_done(identifier: str, name: str) -> bool:
+            if identifier not in completed:
+                return False
+            return name in exported if archive is not None else (destination / name).exists()
+
+        def download(identifier: str, name: str) -> None:
+            resource.download_to(staging / name, Identifier=identifier)
+
+        def finish(identifier: str, name: str, future: Future) -> None:
+            try:
+                future.result()
+            except (WeFactAPIError, OSError, binascii.Error) as e:
+                # One unreadable or unwritable document does not stop the export
+                result.failed[identifier] = str(e)
+                return
+            if archive is not None:
+                _add_to_archive(archive, staging / name, name)
+            if log is not None:
+                log.write(json.dumps({'Identifier': identifier, 'name': name}) + '\n')
+                log.flush()
+            result.exported += 1
+
+        pending: Dict[Future, Tuple[str, str]] = {}
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+        # Worker threads keep the caller's deadline
+        download_in_context = in_current_context(download)
+        try:
+            for identifier, name in _named(documents):
+                if is_done(identifier, name):
+                    result.skipped += 1
+                    continue
+                pending[executor.submit(download_in_context, identifier, name)] = (identifier, name)
+                # Keep a bounded number of downloads in flight
+                if len(pending) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finish(*pending.pop(future), future)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(*pending.pop(future), future)
+        except BaseException:
+            # Stop quickly, e.g. on Ctrl+C; completed documents stay recorded
+            for future in pending:
+                future.cancel()
+            raise
+
+    return result
+
+
+def document_name(item: Dict[str, Any]) -> str:
+    """File name of a document: its invoice/quote code, or else its Identifier."""
+    for name_field in _NAME_FIELDS:
+        value = item.get(name_field)
+        if value:
+            return _UNSAFE_NAME.sub('_', str(value)) + '.pdf'
+    raise ValueError('Document has no Identifier')
+
+
+def _named(documents: Iterable[Dict[str, Any]]) -> Iterator[Tuple[str, str]]:
+    """Yield (Identifier, file name) pairs, making names unique."""
+    seen: Set[str] = set()
+    for item in documents:
+        identifier = str(item['Identifier'])
+        name = document_name(item)
+        if name in seen:
+            name = f"{name[:-4]}-{identifier}.pdf"
+        seen.add(name)
+        yield identifier, name
+
+
+def _read_manifest(path: Optional[Path]) -> Set[str]:
+    """Identifiers recorded as exported by earlier runs."""
+    if path is None or not path.exists():
+        return set()
+    completed = set()
+    with open(path) as f:
+        for line in f:
+            try:
+                completed.add(str(json.loads(line)['Identifier']))
+            except (ValueError, KeyError, TypeError):
+                # A line cut short by an interruption
+                continue
+    return completed
+
+
+@contextmanager
+def _open_archive(destination: Union[Path, IO[bytes]]) -> Iterator[zipfile.ZipFile]:
+    """
+    Open the ZIP archive, appending to one left by an interrupted export.
+
+    Path archives are written to ``<archive>.part`` and moved into place
+    once the export completes, so the destination is always a readable
+    archive.
+    """
+    if not isinstance(destination, Path):
+        with zipfile.ZipFile(destination, 'w') as archive:
+            yield archive
+        return
+
+    partial = destination.with_name(destination.name + '.part')
+    if partial.exists() and not zipfile.is_zipfile(partial):
+        # Killed before the central directory was written: start over
+        partial.unlink()
+    if not partial.exists() and destination.exists() and destination.stat().st_size > 0:
+        if not zipfile.is_zipfile(destination):
+            raise ValueError(
+                f'{destination} exists but is not a complete ZIP archive; '
+                'remove it (and its manifest) to start the export again'
+            )
+        # Add new documents to the archive of an earlier export
+        os.replace(destination, partial)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+
+    with zipfile.ZipFile(partial, 'a' if partial.exists() else 'w') as archive:
+        yield archive
+    os.replace(partial, destination)
+
+
+def _add_to_archive(archive: zipfile.ZipFile, path: Path, name: str) -> None:
+    """Copy a downloaded PDF into the archive and remove it (PDFs are stored, not recompressed)."""
+    with open(path, 'rb') as source, archive.open(name, 'w', force_zip64=True) as target:
+        shutil.copyfileobj(source, target, 1024 * 1024)
+    path.unlink()
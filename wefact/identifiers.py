@@ -0,0 +1,208 @@
+"""Index mapping business codes (DebtorCode, InvoiceCode, ...) to Identifiers."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Optional, Union
+
+if TYPE_CHECKING:
+    from .context import ClientContext
+    from .response import ApiResponse
+
+__all__ = ["CODE_FIELDS", "IdentifierIndex"]
+
+# Controller -> field holding the business code of its items
+CODE_FIELDS: Mapping[str, str] = {
+    "debtor": "DebtorCode",
+    "invoice": "InvoiceCode",
+    "product": "ProductCode",
+    "creditor": "CreditorCode",
+    "pricequote": "PriceQuoteCode",
+}
+
+# Version of the on-disk format written by save()
+_FORMAT_VERSION = 1
+
+
+class IdentifierIndex:
+    """
+    Bidirectional index of business codes and numeric Identifiers.
+
+    Attached to a client (``WeFact(api_key, identifiers=True)``), the index
+    learns the code and Identifier of every debtor, invoice, product,
+    creditor and quote in successful responses, including each page of a
+    listing, without extra requests. ``client.debtors.resolve("DB10000")``
+    and ``resolve_code()`` then answer from the index and only call the API
+    on a miss.
+
+    Entries are keyed by Identifier, so an edited code replaces the old one.
+    Deleted items are not removed automatically (the API does not echo what
+    was deleted); resolving them gives an Identifier the API no longer knows.
+
+    Args:
+        path: JSON file to load the index from (when it exists) and save() to
+        code_fields: Controllers to index and the field holding their code
+
+    Example:
+        >>> client = WeFact(api_key="...", identifiers="wefact-ids.json")
+        >>> client.identifiers.refresh(client.debtors)  # One pass over the listing
+        >>> client.debtors.resolve("DB10000")           # No request
+        '1'
+        >>> client.identifiers.save()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike, None] = None,
+        *,
+        code_fields: Mapping[str, str] = CODE_FIELDS,
+    ):
+        self.path = Path(path) if path is not None else None
+        self.code_fields = dict(code_fields)
+        self._lock = threading.Lock()
+        # controller -> code -> Identifier, and the reverse
+        self._identifiers: Dict[str, Dict[str, str]] = {c: {} for c in self.code_fields}
+        self._codes: Dict[str, Dict[str, str]] = {c: {} for c in self.code_fields}
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    def __len__(self) -> int:
+        return sum(len(codes) for codes in self._codes.values())
+
+    def identifier(self, controller: str, code: str) -> Optional[str]:
+        """Identifier of the item of ``controller`` with ``code``, if known."""
+        return self._identifiers.get(controller, {}).get(str(code))
+
+    def code(self, controller: str, identifier: Any) -> Optional[str]:
+        """Code of the item of ``controller`` with ``identifier``, if known."""
+        return self._codes.get(controller, {}).get(str(identifier))
+
+    def add(self, controller: str, identifier: Any, code: Any) -> None:
+        """Record that the item ``identifier`` of ``controller`` has ``code``."""
+        identifier, code = str(identifier), str(code)
+        with self._lock:
+            identifiers = self._identifiers.setdefault(controller, {})
+            codes = self._codes.setdefault(controller, {})
+            old_code = codes.get(identifier)
+            if old_code == code:
+                return
+            if old_code is not None:
+                identifiers.pop(old_code, None)
+            old_identifier = identifiers.get(code)
+            if old_identifier is not None:
+                codes.pop(old_identifier, None)
+            identifiers[code] = identifier
+            codes[identifier] = code
+
+    def discard(self, controller: str, identifier: Any) -> None:
+        """Forget the item ``identifier`` of ``controller``, e.g. after deleting it."""
+        with self._lock:
+            code = self._codes.get(controller, {}).pop(str(identifier), None)
+            if code is not None:
+                self._identifiers[controller].pop(code, None)
+
+    def update(self, controller: str, items: Iterable[Mapping[str, Any]]) -> int:
+        """Add the listed or shown ``items`` of ``controller``. Returns the number indexed."""
+        code_field = self.code_fields.get(controller)
+        if code_field is None:
+            return 0
+        count = 0
+        for item in items:
+            identifier = item.get("Identifier")
+            code = item.get(code_field)
+            if identifier not in (None, "") and code not in (None, ""):
+                self.add(controller, identifier, code)
+                count += 1
+        return count
+
+    def observe(self, response: ApiResponse) -> None:
+        """Response hook indexing the items in a successful response."""
+        controller = response.controller
+        if response.error is not None or controller not in self.code_fields:
+            return
+        data = response.json()
+        if not isinstance(data, dict):
+            return
+        item = data.get(controller)
+        if isinstance(item, dict):
+            self.update(controller, (item,))
+        items = data.get(f"{controller}s")
+        if isinstance(items, list):
+            self.update(controller, (item for item in items if isinstance(item, dict)))
+
+    def attach(self, context: ClientContext) -> "IdentifierIndex":
+        """Use this index for a client's context and fill it from its responses."""
+        context.identifiers = self
+        context.add_response_hook(self.observe)
+        return self
+
+    def refresh(self, resource: Any, per_page: int = 1000, prune: bool = False, **params) -> int:
+        """
+        Index every listed item of ``resource`` (summary pages only, no show()).
+
+        Args:
+            resource: Resource to list, e.g. ``client.invoices``
+            per_page: Number of items requested per page
+            prune: Forget items of the controller that were not listed; only
+                use it for a refresh without filters
+            **params: List filters, e.g. ``modified`` ranges
+
+        Returns:
+            Number of items indexed
+        """
+        controller = resource.controller_name
+        seen = set()
+        for page in resource.iter_pages(per_page=per_page, **params):
+            self.update(controller, page)
+            seen.update(str(item.get("Identifier")) for item in page)
+        if prune:
+            self._prune(controller, seen)
+        return len(seen)
+
+    async def refresh_async(self, resource: Any, per_page: int = 1000, prune: bool = False, **params) -> int:
+        """Awaitable refresh() for resources of an AsyncWeFact client."""
+        controller = resource.controller_name
+        seen = set()
+        async for page in resource.iter_pages(per_page=per_page, **params):
+            self.update(controller, page)
+            seen.update(str(item.get("Identifier")) for item in page)
+        if prune:
+            self._prune(controller, seen)
+        return len(seen)
+
+    def _prune(self, controller: str, keep: Iterable[str]) -> None:
+        keep = set(keep)
+        for identifier in [i for i in self._codes.get(controller, {}) if i not in keep]:
+            self.discard(controller, identifier)
+
+    def save(self, path: Union[str, os.PathLike, None] = None) -> None:
+        """
+        Write the index to ``path`` (default: the path it was created with).
+
+        The file is replaced atomically, so a reader never sees a partial index.
+        """
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("No path to save the identifier index to")
+        with self._lock:
+            data = {
+                "version": _FORMAT_VERSION,
+                "controllers": {c: dict(ids) for c, ids in self._identifiers.items() if ids},
+            }
+        partial = path.with_name(path.name + ".part")
+        with open(partial, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(partial, path)
+
+    def load(self, path: Union[str, os.PathLike]) -> None:
+        """Add the entries saved in ``path`` to the index."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported identifier index format in {path}")
+        for controller, identifiers in data["controllers"].items():
+            for code, identifier in identifiers.items():
+                self.add(controller, identifier, code)
@@ -0,0 +1,326 @@
+"""Client-side rate limiting for WeFact API requests."""
+
+from __future__ import annotations
+
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, Union
+
+__all__ = [
+    "RateLimiterStats",
+    "RateLimitBackend",
+    "LocalBackend",
+    "FileLockBackend",
+    "StoreBackend",
+    "TokenBucket",
+]
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """
+    Snapshot of rate limiter metrics.
+
+    Attributes:
+        acquired: Number of successful acquisitions.
+        rejected: Number of acquisitions refused (non-blocking or timed out).
+        waited: Number of acquisitions that had to wait for tokens.
+        wait_time: Total time spent waiting for tokens (seconds).
+    """
+
+    acquired: int = 0
+    rejected: int = 0
+    waited: int = 0
+    wait_time: float = 0.0
+
+
+def take_tokens(
+    state: Optional[Tuple[float, float]],
+    now: float,
+    tokens: float,
+    rate: float,
+    burst: float,
+    max_wait: Optional[float],
+) -> Tuple[Tuple[float, float], Optional[float]]:
+    """
+    Apply a token reservation to a bucket state.
+
+    Args:
+        state: ``(tokens, updated)`` as last stored, or None for a new bucket
+        now: Current time on the backend's clock
+        tokens: Number of tokens to take
+        rate: Refill rate in tokens per second
+        burst: Bucket capacity
+        max_wait: Refuse reservations that need a longer wait (None: no limit)
+
+    Returns:
+        ``(new_state, wait)`` where wait is None when the reservation was refused.
+        The new state must be stored in both cases (it includes the refill).
+    """
+    available, updated = state if state is not None else (burst, now)
+    available = min(burst, available + max(0.0, now - updated) * rate)
+
+    deficit = tokens - available
+    wait = deficit / rate if deficit > 0 else 0.0
+    if max_wait is not None and wait > max_wait:
+        return (available, now), None
+    return (available - tokens, now), wait
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage for token bucket state.
+
+    Backends decide where the bucket lives: in this process (LocalBackend),
+    in a file shared by processes on one host (FileLockBackend) or in an
+    external store shared by several hosts (StoreBackend). Implementations
+    must apply take_tokens() atomically.
+    """
+
+    @abstractmethod
+    def reserve(self, tokens: float, rate: float, burst: float, max_wait: Optional[float]) -> Optional[float]:
+        """Atomically reserve tokens. Returns the wait in seconds, or None if refused."""
+
+
+class LocalBackend(RateLimitBackend):
+    """In-process bucket state, shared by all threads of this process."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._state: Optional[Tuple[float, float]] = None
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float, rate: float, burst: float, max_wait: Optional[float]) -> Optional[float]:
+        with self._lock:
+            self._state, wait = take_tokens(self._state, self._clock(), tokens, rate, burst, max_wait)
+            return wait
+
+
+class FileLockBackend(RateLimitBackend):
+    """
+    Bucket state in a file, shared by all processes on one host.
+
+    The state is read and updated under an exclusive ``flock``, so e.g. all
+    gunicorn workers and cron jobs using the same file draw from one budget.
+    Available on POSIX systems.
+
+    Args:
+        path: State file; created when missing. Use the same path in every
+            process that shares the API key.
+    """
+
+    _format = struct.Struct("<dd")
+
+    def __init__(self, path: Union[str, Path]):
+        try:
+            import fcntl
+        except ImportError as e:  # pragma: no cover - non-POSIX platforms
+            raise RuntimeError("FileLockBackend requires a POSIX system (fcntl)") from e
+        self._fcntl = fcntl
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+
+    def _file(self) -> int:
+        # Reopen after fork so each process locks its own open file description
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    def reserve(self, tokens: float, rate: float, burst: float, max_wait: Optional[float]) -> Optional[float]:
+        with self._lock:
+            fd = self._file()
+            self._fcntl.flock(fd, self._fcntl.LOCK_EX)
+            try:
+                raw = os.pread(fd, self._format.size, 0)
+                state = self._format.unpack(raw) if len(raw) == self._format.size else None
+                state, wait = take_tokens(state, time.time(), tokens, rate, burst, max_wait)
+                os.pwrite(fd, self._format.pack(*state), 0)
+                return wait
+            finally:
+                self._fcntl.flock(fd, self._fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Close the state file."""
+        if self._fd is not None and self._pid == os.getpid():
+            os.close(self._fd)
+        self._fd = None
+
+
+class StoreBackend(RateLimitBackend):
+    """
+    Bucket state in a shared key-value store, e.g. Redis.
+
+    The store must provide ``get(key)``, ``set(key, value)`` and a
+    ``lock(name)`` context manager, which a ``redis.Redis`` client does.
+    Store clocks are not used: hosts sharing a bucket need synchronised
+    wall clocks (NTP).
+
+    Args:
+        store: Key-value store client
+        key: Key holding the bucket state. Use one key per API key.
+
+    Example:
+        >>> import redis
+        >>> backend = StoreBackend(redis.Redis(), "wefact:ratelimit")
+        >>> limiter = TokenBucket.per_minute(300, burst=5, backend=backend)
+    """
+
+    def __init__(self, store: Any, key: str = "wefact:ratelimit"):
+        self.store = store
+        self.key = key
+
+    def reserve(self, tokens: float, rate: float, burst: float, max_wait: Optional[float]) -> Optional[float]:
+        with self.store.lock(f"{self.key}:lock"):
+            raw = self.store.get(self.key)
+            if isinstance(raw, bytes):
+                raw = raw.decode()
+            state = tuple(map(float, raw.split(":"))) if raw else None
+            state, wait = take_tokens(state, time.time(), tokens, rate, burst, max_wait)
+            self.store.set(self.key, f"{state[0]!r}:{state[1]!r}")
+            return wait
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    The bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per
+    second. Every request takes one token. Waiting callers reserve their
+    tokens up front, so they are served in arrival order without busy-waiting.
+
+    Where the bucket state lives is decided by the backend: by default it is
+    local to the process; FileLockBackend and StoreBackend share one budget
+    between processes and hosts.
+
+    Args:
+        rate: Refill rate in tokens (requests) per second
+        burst: Bucket capacity, i.e. how many requests may be sent back-to-back
+        backend: State backend (default: a LocalBackend)
+        clock: Monotonic clock for the default backend, overridable for testing
+
+    Example:
+        >>> limiter = TokenBucket.per_minute(300, burst=5)
+        >>> limiter.acquire()          # Blocks until a token is available
+        True
+        >>> limiter.try_acquire()      # Returns False instead of blocking
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1,
+        *,
+        backend: Optional[RateLimitBackend] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.backend = backend if backend is not None else LocalBackend(clock)
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._rejected = 0
+        self._waited = 0
+        self._wait_time = 0.0
+
+    @classmethod
+    def per_minute(
+        cls,
+        requests_per_minute: float,
+        burst: float = 1,
+        *,
+        backend: Optional[RateLimitBackend] = None,
+    ) -> "TokenBucket":
+        """Create a bucket from a requests-per-minute budget."""
+        return cls(requests_per_minute / 60.0, burst, backend=backend)
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """Current metrics snapshot."""
+        with self._lock:
+            return RateLimiterStats(
+                acquired=self._acquired,
+                rejected=self._rejected,
+                waited=self._waited,
+                wait_time=self._wait_time,
+            )
+
+    def reserve(self, tokens: float = 1, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve tokens and return how long the caller must wait before using them.
+
+        Args:
+            tokens: Number of tokens to take
+            max_wait: Refuse the reservation when it would need a longer wait.
+                ``None`` accepts any wait.
+
+        Returns:
+            Seconds to wait (0 when tokens are available now), or None when
+            the reservation was refused.
+        """
+        wait = self.backend.reserve(tokens, self.rate, self.burst, max_wait)
+        with self._lock:
+            if wait is None:
+                self._rejected += 1
+                return None
+
+            self._acquired += 1
+            if wait > 0:
+                self._waited += 1
+                self._wait_time += wait
+            return wait
+
+    def acquire(self, tokens: float = 1, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens, waiting for them if needed.
+
+        Args:
+            tokens: Number of tokens to take
+            blocking: When False, return immediately if no tokens are available
+            timeout: Maximum time to wait (seconds) when blocking
+
+        Returns:
+            True when the tokens were taken, False otherwise
+        """
+        wait = self.reserve(tokens, timeout if blocking else 0.0)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take tokens only if they are available right now."""
+        return self.acquire(tokens, blocking=False)
+
+    async def acquire_async(self, tokens: float = 1, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Awaitable version of acquire() that sleeps on the event loop.
+
+        Shared backends lock a file or call a store, so their reservation
+        runs in a worker thread instead of blocking the event loop.
+        """
+        # Imported here: asyncio is only needed by async clients
+        import asyncio
+
+        max_wait = timeout if blocking else 0.0
+        if isinstance(self.backend, LocalBackend):
+            wait = self.reserve(tokens, max_wait)
+        else:
+            wait = await asyncio.to_thread(self.reserve, tokens, max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
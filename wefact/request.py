@@ -1,15 +1,99 @@
 from __future__ import annotations
 
-import requests
-from typing import Any, Dict, List
-from urllib.parse import urlencode
+import time
+from contextlib import contextmanager
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote_plus
 
+from .config import DEFAULT_DOWNLOAD_CHUNK_SIZE, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+from .rate_limit import TokenBucket
+from .retry import RetryPolicy
+from .streaming import (
+    Base64FieldParser,
+    DownloadDestination,
+    DownloadTarget,
+    StreamingFormBody,
+    is_file_source,
+)
+from .timeouts import current_deadline, remaining_time
 from .exceptions import (
     ClientError,
+    RequestTimeoutError,
+    ServerError,
+    TransportError,
     ValidationError,
-    raise_for_response,
+    WeFactAPIError,
     raise_for_wefact_payload,
 )
+from .response import ApiResponse, ResponseHook
+
+if TYPE_CHECKING:
+    import requests
+
+    from .cache import ResponseCache
+    from .context import ClientContext
+
+# (connect, read) timeouts in seconds; None waits indefinitely
+Timeout = Tuple[Optional[float], Optional[float]]
+
+# Encoded request body; file uploads are streamed
+RequestBody = Union[str, StreamingFormBody]
+
+# Parameter holding file content, which may be given as a path or binary stream
+STREAMED_PARAM = 'Base64'
+
+
+
+def _import_requests() -> Any:
+    """
+    Import requests on first use.
+
+    requests (with urllib3 and certifi) accounts for most of the time it
+    takes to import this package, so it is only loaded once a session is
+    created or a request is sent.
+    """
+    global requests
+    import requests
+    return requests
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``wefact.request.requests`` available, e.g. for mock.patch targets
+    if name == 'requests':
+        return _import_requests()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _to_string(val: Any) -> Any:
+    """Convert value to string, handling enums properly."""
+    if isinstance(val, Enum):
+        return val.value
+    return str(val)
+
+
+def _quote(text: str) -> str:
+    """quote_plus() for text, skipping the call for plain alphanumeric text."""
+    if text.isalnum() and text.isascii():
+        return text
+    return quote_plus(text)
+
+
+def _encode_value(val: Any) -> str:
+    """Encode a scalar exactly like urlencode(flatten_params(...)) would."""
+    if type(val) is str:
+        return _quote(val)
+    val = _to_string(val)
+    if isinstance(val, bytes):
+        return quote_plus(val)
+    return _quote(val if isinstance(val, str) else str(val))
+
+
+def _encode_top_key(key: Any) -> str:
+    """Encode a top-level key exactly like urlencode() would."""
+    if isinstance(key, bytes):
+        return quote_plus(key)
+    return _quote(key if isinstance(key, str) else str(key))
 
 
 def flatten_params(params: Dict[str, Any], parent_key: str = '') -> List[tuple]:
@@ -21,45 +105,157 @@ def flatten_params(params: Dict[str, Any], parent_key: str = '') -> List[tuple]:
     
     Args:
         params: Dictionary that may contain nested dicts/lists
-        parent_key: Used for recursion to build the key path
+        parent_key: Key path the flattened keys are nested under
         
     Returns:
         List of (key, value) tuples suitable for urlencode with doseq=True
     """
-    from enum import Enum
-    
-    def to_string(val):
-        """Convert value to string, handling enums properly."""
-        if isinstance(val, Enum):
-            return val.value
-        return str(val)
-    
     items = []
-    
-    for key, value in params.items():
-        new_key = f"{parent_key}[{key}]" if parent_key else key
-        
-        if isinstance(value, dict):
-            # Recursively flatten nested dictionaries
-            items.extend(flatten_params(value, new_key))
-        elif isinstance(value, (list, tuple)):
-            # Handle lists/arrays
-            for idx, item in enumerate(value):
-                if isinstance(item, dict):
-                    # List of dicts: InvoiceLines[0][Number]=1
-                    items.extend(flatten_params(item, f"{new_key}[{idx}]"))
-                else:
-                    # Simple list: Tags[0]=tag1, Tags[1]=tag2
-                    items.append((f"{new_key}[{idx}]", to_string(item)))
+    # Depth-first walk with an explicit stack of (key path, items, is_list)
+    stack = [(parent_key, iter(params.items()), False)]
+    while stack:
+        path, entries, is_list = stack[-1]
+        for key, value in entries:
+            if is_list:
+                # Lists are always indexed: Tags[0]=tag1, InvoiceLines[0][Number]=1
+                new_key = f"{path}[{key}]"
+                if isinstance(value, dict):
+                    stack.append((new_key, iter(value.items()), False))
+                    break
+                items.append((new_key, _to_string(value)))
+                continue
+
+            new_key = f"{path}[{key}]" if path else key
+            if isinstance(value, dict):
+                stack.append((new_key, iter(value.items()), False))
+                break
+            if isinstance(value, (list, tuple)):
+                stack.append((new_key, enumerate(value), True))
+                break
+            items.append((new_key, _to_string(value)))
         else:
-            # Simple scalar value
-            items.append((new_key, to_string(value)))
+            stack.pop()
     
     return items
 
+
+def encode_params(params: Dict[str, Any]) -> str:
+    """
+    Form-encode (nested) parameters in a single pass.
+
+    Produces exactly ``urlencode(flatten_params(params))`` without building
+    the intermediate list of pairs: key paths are kept percent-encoded while
+    walking the structure, so every key segment is quoted only once.
+
+    Args:
+        params: Dictionary that may contain nested dicts/lists
+
+    Returns:
+        The ``application/x-www-form-urlencoded`` request body
+    """
+    for value in params.values():
+        if isinstance(value, (dict, list, tuple)):
+            break
+    else:
+        # Fast path: flat payload of scalars (list/show/delete calls)
+        return '&'.join([
+            f"{_encode_top_key(key)}={_encode_value(value)}"
+            for key, value in params.items()
+        ])
+
+    parts = []
+    # Same walk as flatten_params(), carrying the truthiness of the raw key
+    # path (it decides whether a dict nests its keys) next to its encoding
+    stack = [(False, '', iter(params.items()), False)]
+    while stack:
+        nested, path, entries, is_list = stack[-1]
+        for key, value in entries:
+            if is_list:
+                new_key = f"{path}%5B{key}%5D"
+                if isinstance(value, dict):
+                    stack.append((True, new_key, iter(value.items()), False))
+                    break
+                parts.append(f"{new_key}={_encode_value(value)}")
+                continue
+
+            if nested:
+                new_key = f"{path}%5B{_quote(format(key))}%5D"
+                truthy = True
+            else:
+                new_key = _encode_top_key(key)
+                truthy = bool(key)
+            if isinstance(value, dict):
+                stack.append((truthy, new_key, iter(value.items()), False))
+                break
+            if isinstance(value, (list, tuple)):
+                stack.append((truthy, new_key, enumerate(value), True))
+                break
+            parts.append(f"{new_key}={_encode_value(value)}")
+        else:
+            stack.pop()
+
+    return '&'.join(parts)
+
+
+# Keys of the request envelope, sent before the call's own parameters
+_ENVELOPE_KEYS = frozenset(('api_key', 'controller', 'action'))
+
+# Context key of the encoded envelope prefixes, per (controller, action)
+_ENVELOPE_CACHE = 'request_envelopes'
+
+
+def _encode_envelope(api_key: str, controller: str, action: str) -> str:
+    """Encoded ``api_key=..&controller=..&action=..`` prefix."""
+    return encode_params({'api_key': api_key, 'controller': controller, 'action': action})
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """
+    Create a pooled HTTP session for talking to the WeFact API.
+
+    The underlying urllib3 pool is thread-safe, so a single session can be
+    shared by all resources of a client and by multiple threads.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum number of connections kept open per host
+        pool_block: Block when all connections of a host are in use instead
+            of opening (and discarding) an extra connection
+        keep_alive: Reuse connections between requests. When False every
+            request sends ``Connection: close``
+
+    Returns:
+        A configured ``requests.Session``
+    """
+    requests = _import_requests()
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    return session
+
+
 class RequestMixin:
     api_key: str
     api_url: str
+    session: Optional[requests.Session] = None
+    rate_limiter: Optional[TokenBucket] = None
+    retry_policy: Optional[RetryPolicy] = None
+    timeout: Optional[Timeout] = None
+    cache: Optional[ResponseCache] = None
+    response_hooks: Tuple[ResponseHook, ...] = ()
+    context: Optional[ClientContext] = None
 
     def _validate_params(self, params: Dict[str, Any]) -> None:
         """Validate and normalize common parameters."""
@@ -69,42 +265,307 @@ class RequestMixin:
             if key in params and isinstance(params[key], int):
                 params[key] = str(params[key])
 
-    def _send_request(self, controller: str, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _encode_request(self, controller: str, action: str, params: Dict[str, Any]) -> RequestBody:
+        """Build the form-encoded request body for a controller/action call."""
         # Validate parameters before sending
         self._validate_params(params)
+
+        if is_file_source(params.get(STREAMED_PARAM)):
+            # Base64-encode the file while sending instead of holding it in memory
+            params = dict(params)
+            source = params.pop(STREAMED_PARAM)
+            head = self._encode_request(controller, action, params)
+            return StreamingFormBody(head, [(STREAMED_PARAM, source)])
         
+        if _ENVELOPE_KEYS.isdisjoint(params):
+            # Only the call's own parameters change between requests
+            prefix = self._envelope(controller, action)
+            # Flatten nested structures for proper form encoding
+            # (e.g., InvoiceLines[0][Number]=1&InvoiceLines[0][ProductCode]=P0001)
+            encoded = encode_params(params)
+            return f"{prefix}&{encoded}" if encoded else prefix
+
+        # Parameters overriding the envelope keep their position in the body
         payload = {
             'api_key': self.api_key,
             'controller': controller,
             'action': action,
             **params,
         }
-        
-        # Flatten nested structures for proper form encoding
-        # (e.g., InvoiceLines[0][Number]=1&InvoiceLines[0][ProductCode]=P0001)
-        flattened = flatten_params(payload)
-        encoded_data = urlencode(flattened)
-        
-        try:
-            response = requests.post(
-                self.api_url, 
-                data=encoded_data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
-            )
-        except requests.RequestException as e:
-            # Network/transport error
-            raise ClientError(str(e)) from e
-
-        # Raise on HTTP-level errors
-        if not (200 <= int(getattr(response, 'status_code', 0)) < 300):
-            raise_for_response(response)
-
-        # Parse JSON
+        return encode_params(payload)
+
+    def _envelope(self, controller: str, action: str) -> str:
+        """Encoded envelope prefix of a call target, cached on the client's context."""
+        if self.context is None:
+            return _encode_envelope(self.api_key, controller, action)
+        envelopes = self.context.get_or_create(_ENVELOPE_CACHE, dict)
+        api_key, prefix = envelopes.get((controller, action), (None, None))
+        if api_key != self.api_key:
+            # Not encoded yet, or the client's API key was replaced since
+            prefix = _encode_envelope(self.api_key, controller, action)
+            envelopes[controller, action] = (self.api_key, prefix)
+        return prefix
+
+    def _process_response(
+        self, response: Any, controller: Optional[str] = None, action: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Map HTTP and WeFact errors to exceptions and return the parsed body."""
+        parsed = ApiResponse(response, controller, action)
+        with self._observe(parsed):
+            return parsed.result()
+
+    @contextmanager
+    def _observe(self, parsed: ApiResponse) -> Iterator[ApiResponse]:
+        """Record the error raised while processing a response and run the response hooks."""
         try:
-            data = response.json()
-        except ValueError as e:
-            raise ValidationError('Invalid JSON response') from e
+            yield parsed
+        except WeFactAPIError as e:
+            parsed.error = e
+            raise
+        finally:
+            for hook in self.response_hooks:
+                hook(parsed)
+
+    def _send_request(self, controller: str, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        cache_slot, cached = self._cache_lookup(controller, action, params)
+        if cached is not None:
+            return cached
+
+        encoded_data = self._encode_request(controller, action, params)
 
-        # Align with WeFact: status=='error' indicates an application-level error
-        raise_for_wefact_payload(response, data)
+        def send(body: RequestBody, expires: Optional[float]) -> Dict[str, Any]:
+            return self._post(body, expires, controller, action)
+
+        try:
+            data = self._send_with_retries(action, encoded_data, send)
+        except (ServerError, TransportError):
+            # The call may have been applied before it failed
+            self._cache_invalidate(controller, action)
+            raise
+        self._cache_invalidate(controller, action)
+        self._cache_store(cache_slot, controller, data)
         return data
+
+    def _cache_lookup(
+        self, controller: str, action: str, params: Dict[str, Any]
+    ) -> Tuple[Optional[Tuple[str, int]], Optional[Dict[str, Any]]]:
+        """
+        Cache slot of a call (its key and the cache generation; None if the
+        call is not cached) and the cached response, if any.
+        """
+        cache = self.cache
+        if cache is None:
+            return None, None
+        key = cache.key(self.api_key, controller, action, params)
+        if key is None:
+            return None, None
+        generation = cache.generation
+        return (key, generation), cache.get(key)
+
+    def _cache_store(self, slot: Optional[Tuple[str, int]], controller: str, data: Dict[str, Any]) -> None:
+        """Cache a response in the slot returned by _cache_lookup()."""
+        if slot is not None and self.cache is not None:
+            key, generation = slot
+            self.cache.set(key, controller, data, generation)
+
+    def _cache_invalidate(self, controller: str, action: str) -> None:
+        """Drop the cached responses a mutating call may have changed."""
+        if self.cache is not None:
+            self.cache.invalidate_after(controller, action)
+
+    def _download_to(
+        self,
+        controller: str,
+        action: str,
+        params: Dict[str, Any],
+        destination: DownloadDestination,
+    ) -> Dict[str, Any]:
+        """Send a download request and stream its Base64 content into destination."""
+        encoded_data = self._encode_request(controller, action, params)
+        with DownloadTarget(destination) as target:
+            def send(body: RequestBody, expires: Optional[float]) -> Dict[str, Any]:
+                return self._post_download(body, expires, target, controller, action)
+
+            return self._send_with_retries(action, encoded_data, send, target)
+
+    def _send_with_retries(
+        self,
+        action: str,
+        encoded_data: RequestBody,
+        send: Callable[[RequestBody, Optional[float]], Dict[str, Any]],
+        target: Optional[DownloadTarget] = None,
+    ) -> Dict[str, Any]:
+        """Call ``send`` until it succeeds or the retry policy gives up."""
+        expires = current_deadline()
+
+        attempt = 1
+        while True:
+            try:
+                return send(encoded_data, expires)
+            except WeFactAPIError as e:
+                policy = self._retry_policy_for(encoded_data, target)
+                if policy is None or not policy.should_retry(action, e, attempt):
+                    raise
+                delay = policy.backoff(attempt, e)
+                if expires is not None and time.monotonic() + delay >= expires:
+                    # No time left for another attempt
+                    raise
+                time.sleep(delay)
+                attempt += 1
+
+    def _retry_policy_for(
+        self, body: RequestBody, target: Optional[DownloadTarget] = None
+    ) -> Optional[RetryPolicy]:
+        """The retry policy, unless an upload or download stream cannot be rewound."""
+        if isinstance(body, StreamingFormBody) and not body.replayable:
+            return None
+        if target is not None and not target.replayable:
+            return None
+        return self.retry_policy
+
+    def _request_timeout(self, expires: Optional[float]) -> Optional[Timeout]:
+        """Connect/read timeouts for one attempt, capped by the call deadline."""
+        remaining = remaining_time(expires)
+        if remaining is None:
+            return self.timeout
+        if remaining <= 0:
+            raise RequestTimeoutError('Deadline exceeded')
+        connect, read = self.timeout if self.timeout is not None else (None, None)
+        return (
+            remaining if connect is None else min(connect, remaining),
+            remaining if read is None else min(read, remaining),
+        )
+
+    def _acquire_rate_limit(self, expires: Optional[float]) -> None:
+        """Wait for the client-wide request budget, without overrunning the deadline."""
+        if self.rate_limiter is None:
+            return
+        if not self.rate_limiter.acquire(timeout=remaining_time(expires)):
+            raise RequestTimeoutError('Deadline exceeded while waiting for the rate limiter')
+
+    def _post(
+        self,
+        encoded_data: RequestBody,
+        expires: Optional[float] = None,
+        controller: Optional[str] = None,
+        action: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send one request attempt and process its response."""
+        # Under a deadline the body is streamed, so a slowly trickling
+        # response cannot outlive it one short read at a time
+        stream = expires is not None
+        with _transport_errors():
+            response = self._http_post(encoded_data, expires, stream=stream)
+            if stream:
+                _read_body(response, expires)
+
+        return self._process_response(response, controller, action)
+
+    def _post_download(
+        self,
+        encoded_data: RequestBody,
+        expires: Optional[float],
+        target: DownloadTarget,
+        controller: Optional[str] = None,
+        action: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send one download attempt, decoding the Base64 field while it is received."""
+        with _transport_errors():
+            response = self._http_post(encoded_data, expires, stream=True)
+
+        with self._observe(ApiResponse(response, controller, action)) as parsed:
+            try:
+                parsed.raise_for_status()
+
+                parser = Base64FieldParser(target.open())
+                try:
+                    with _transport_errors():
+                        for chunk in _iter_body(response, expires):
+                            parser.feed(chunk)
+                    parsed.set_json(parser.close())
+                except ValueError as e:
+                    raise ValidationError('Invalid JSON response') from e
+            finally:
+                response.close()
+
+            return _download_result(parsed, parser)
+
+    def _http_post(self, encoded_data: RequestBody, expires: Optional[float], stream: bool = False) -> Any:
+        """POST a request body through the rate limiter."""
+        # Use the client's pooled session when available
+        http = self.session if self.session is not None else _import_requests()
+
+        self._acquire_rate_limit(expires)
+
+        if isinstance(encoded_data, StreamingFormBody) and encoded_data.content_length is None:
+            # Unknown length: send with chunked transfer encoding
+            encoded_data = iter(encoded_data)
+
+        kwargs = {'stream': True} if stream else {}
+        return http.post(
+            self.api_url, 
+            data=encoded_data,
+            headers={'Content-Type': 'application/x-www-form-urlencoded'},
+            timeout=self._request_timeout(expires),
+            **kwargs,
+        )
+
+
+@contextmanager
+def _transport_errors() -> Iterator[None]:
+    """Map requests exceptions to client exceptions."""
+    requests = _import_requests()
+    try:
+        yield
+    except requests.Timeout as e:
+        raise RequestTimeoutError(str(e)) from e
+    except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+        # Connection refused/reset: may succeed when retried
+        raise TransportError(str(e)) from e
+    except requests.RequestException as e:
+        # Network/transport error
+        raise ClientError(str(e)) from e
+
+
+def _iter_body(response: Any, expires: Optional[float], chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the body of a streamed response as it arrives, checking the deadline between reads.
+
+    urllib3 responses are read with ``read1()``, which returns whatever a
+    single socket read delivers instead of waiting for a full chunk; other
+    responses fall back to ``iter_content()``.
+    """
+    from urllib3.response import HTTPResponse
+
+    raw = getattr(response, 'raw', None)
+    if isinstance(raw, HTTPResponse) and hasattr(raw, 'read1'):  # read1() needs urllib3 2
+        chunks: Iterator[bytes] = iter(lambda: raw.read1(chunk_size, decode_content=True), b'')
+    else:
+        chunks = response.iter_content(chunk_size)
+    for chunk in chunks:
+        if expires is not None and remaining_time(expires) <= 0:
+            response.close()
+            raise RequestTimeoutError('Deadline exceeded while reading the response')
+        yield chunk
+
+
+def _read_body(response: Any, expires: Optional[float]) -> None:
+    """Read a streamed response body within the deadline and keep it as ``response.content``."""
+    try:
+        # requests serves content, text and json() from _content once it is set
+        response._content = b''.join(_iter_body(response, expires))
+    except BaseException:
+        response.close()
+        raise
+
+
+def _download_result(parsed: ApiResponse, parser: Base64FieldParser) -> Dict[str, Any]:
+    """Check a parsed download response and drop the emptied Base64 field."""
+    data = parsed.json()
+    raise_for_wefact_payload(parsed.response, data)
+    if not parser.found:
+        raise ValidationError('Response contains no Base64 content')
+    for value in data.values():
+        if isinstance(value, dict) and value.get('Base64') == '':
+            del value['Base64']
+    return data
@@ -5,22 +5,84 @@ Each resource module provides a class that handles API operations for a specific
 WeFact entity (invoices, debtors, products, etc.).
 
 All resources use the controller/action API pattern via RequestMixin.
+
+Resource classes are imported on first access, so importing this package
+does not load every resource module (or httpx for the async variants).
 """
 
-from .base import BaseResource
-from .invoice import InvoiceResource
-from .credit_invoice import CreditInvoiceResource
-from .debtor import DebtorResource
-from .product import ProductResource
-from .creditor import CreditorResource
-from .group import GroupResource
-from .subscription import SubscriptionResource
-from .interaction import InteractionResource
-from .quote import QuoteResource
-from .task import TaskResource
-from .transaction import TransactionResource
-from .settings import SettingsResource
-from .cost_category import CostCategoryResource
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_imports
+
+if TYPE_CHECKING:
+    from .base import BaseResource
+    from .invoice import InvoiceResource
+    from .credit_invoice import CreditInvoiceResource
+    from .debtor import DebtorResource
+    from .product import ProductResource
+    from .creditor import CreditorResource
+    from .group import GroupResource
+    from .subscription import SubscriptionResource
+    from .interaction import InteractionResource
+    from .quote import QuoteResource
+    from .task import TaskResource
+    from .transaction import TransactionResource
+    from .settings import SettingsResource
+    from .cost_category import CostCategoryResource
+    from .async_resources import (
+        AsyncBaseResource,
+        AsyncInvoiceResource,
+        AsyncCreditInvoiceResource,
+        AsyncDebtorResource,
+        AsyncProductResource,
+        AsyncCreditorResource,
+        AsyncGroupResource,
+        AsyncSubscriptionResource,
+        AsyncInteractionResource,
+        AsyncQuoteResource,
+        AsyncTaskResource,
+        AsyncTransactionResource,
+        AsyncSettingsResource,
+        AsyncCostCategoryResource,
+    )
+
+# Public name -> submodule defining it
+_LAZY_IMPORTS = {
+    "BaseResource": "base",
+    "InvoiceResource": "invoice",
+    "CreditInvoiceResource": "credit_invoice",
+    "DebtorResource": "debtor",
+    "ProductResource": "product",
+    "CreditorResource": "creditor",
+    "GroupResource": "group",
+    "SubscriptionResource": "subscription",
+    "InteractionResource": "interaction",
+    "QuoteResource": "quote",
+    "TaskResource": "task",
+    "TransactionResource": "transaction",
+    "SettingsResource": "settings",
+    "CostCategoryResource": "cost_category",
+    **dict.fromkeys((
+        "AsyncBaseResource",
+        "AsyncInvoiceResource",
+        "AsyncCreditInvoiceResource",
+        "AsyncDebtorResource",
+        "AsyncProductResource",
+        "AsyncCreditorResource",
+        "AsyncGroupResource",
+        "AsyncSubscriptionResource",
+        "AsyncInteractionResource",
+        "AsyncQuoteResource",
+        "AsyncTaskResource",
+        "AsyncTransactionResource",
+        "AsyncSettingsResource",
+        "AsyncCostCategoryResource",
+    ), "async_resources"),
+}
+
+
+__getattr__, __dir__ = lazy_imports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     "BaseResource",
@@ -37,4 +99,18 @@ __all__ = [
     "TransactionResource",
     "SettingsResource",
     "CostCategoryResource",
+    "AsyncBaseResource",
+    "AsyncInvoiceResource",
+    "AsyncCreditInvoiceResource",
+    "AsyncDebtorResource",
+    "AsyncProductResource",
+    "AsyncCreditorResource",
+    "AsyncGroupResource",
+    "AsyncSubscriptionResource",
+    "AsyncInteractionResource",
+    "AsyncQuoteResource",
+    "AsyncTaskResource",
+    "AsyncTransactionResource",
+    "AsyncSettingsResource",
+    "AsyncCostCategoryResource",
 ]
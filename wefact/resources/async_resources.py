@@ -0,0 +1,244 @@
+"""
+Async variants of all WeFact API resources.
+
+Each async resource reuses the action methods of its sync counterpart; because
+``_send_request`` is a coroutine here, every action (``credit``, ``match``,
+``attachment_add``, ...) returns an awaitable instead of a response dict.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, List, Union
+
+from ..async_request import AsyncRequestMixin
+from ..context import ContextAttribute
+from ..enums.cost_category_actions import CostCategoryAction
+from .base import BaseResource, DetailPolicy
+from .invoice import InvoiceResource
+from .credit_invoice import CreditInvoiceResource
+from .debtor import DebtorResource
+from .product import ProductResource
+from .creditor import CreditorResource
+from .group import GroupResource
+from .subscription import SubscriptionResource
+from .interaction import InteractionResource
+from .quote import QuoteResource
+from .task import TaskResource
+from .transaction import TransactionResource
+from .settings import SettingsResource
+from .cost_category import CostCategoryResource
+
+
+class AsyncBaseResource(AsyncRequestMixin, BaseResource):
+    """Base class for async resources. Overrides helpers that chain requests."""
+
+    # AsyncRequestMixin's class default would otherwise hide the context
+    session = ContextAttribute()
+
+    async def iter_pages(
+        self,
+        offset: int = 0,
+        per_page: int = 1000,
+        prefetch: int = 0,
+        **params,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Async version of BaseResource.iter_pages(); use with ``async for``.
+
+        With ``prefetch``, up to that many upcoming pages are requested as
+        concurrent tasks while the current page is consumed.
+        """
+        plural_name = self.get_plural_resource_name()
+
+        result = await self.list(limit=per_page, offset=offset, **params)
+        total = result.get("totalresults")
+
+        if prefetch > 0 and total is not None:
+            offsets = iter(range(offset + per_page, int(total), per_page))
+
+            def submit(page_offset: int) -> asyncio.Task:
+                return asyncio.ensure_future(self.list(limit=per_page, offset=page_offset, **params))
+
+            pending = deque(submit(page_offset) for page_offset in islice(offsets, prefetch))
+            try:
+                while True:
+                    items = result.get(plural_name, [])
+                    if not items:
+                        return
+                    yield items
+                    if not pending:
+                        return
+                    result = await pending.popleft()
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        pending.append(submit(next_offset))
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        while True:
+            items = result.get(plural_name, [])
+            if not items:
+                return
+
+            yield items
+
+            if result.get("currentresults", 0) < per_page:
+                return
+            offset += per_page
+            result = await self.list(limit=per_page, offset=offset, **params)
+
+    async def iter_all(
+        self,
+        offset: int = 0,
+        per_page: int = 1000,
+        workers: int = 1,
+        detail: DetailPolicy = True,
+        prefetch: int = 0,
+        **params,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Async version of BaseResource.iter_all(); use with ``async for``.
+
+        Up to ``workers`` detail requests of a page are in flight at once.
+        Items keep the order in which the API lists them. See
+        BaseResource.iter_all() for the ``detail`` and ``prefetch`` options.
+        """
+        semaphore = asyncio.Semaphore(max(1, workers))
+
+        async def fetch_detail(item: Dict[str, Any]) -> Dict[str, Any]:
+            if not self._needs_detail(item, detail):
+                return item
+            async with semaphore:
+                return await self._fetch_detail(item)
+
+        async for page in self.iter_pages(offset, per_page, prefetch, **params):
+            for item in await asyncio.gather(*(fetch_detail(item) for item in page)):
+                yield item
+
+    async def list_all(
+        self,
+        offset: int = 0,
+        per_page: int = 1000,
+        workers: int = 1,
+        detail: DetailPolicy = True,
+        prefetch: int = 0,
+        **params,
+    ) -> List[Dict[str, Any]]:
+        """
+        List all items with automatic pagination and detailed information.
+
+        Note: This makes one API call per item for full details, which can be slow
+        for large datasets. Requests are paced by the client's rate limiter.
+        Use iter_all() to process items without holding all of them in memory.
+
+        Args:
+            offset: Offset of the first item to list
+            per_page: Number of items requested per page
+            workers: Number of detail requests in flight at once. Results
+                keep the order in which the API lists them.
+            detail: Which items to fetch full details for (see iter_all()).
+                Pass False for summary exports to skip all show() calls.
+            prefetch: Number of listing pages to fetch ahead
+            **params: Additional list filters
+        """
+        return [item async for item in self.iter_all(offset, per_page, workers, detail, prefetch, **params)]
+
+    async def _fetch_detail(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        detail = await self.show(Identifier=item["Identifier"])
+        if isinstance(detail, dict) and self.controller_name in detail:
+            return detail[self.controller_name]
+        return item
+
+    async def resolve(self, code: str) -> str:
+        identifier = self._indexed("identifier", code)
+        if identifier is None:
+            detail = await self.show(**{self._code_field(): code})
+            identifier = self._detail_field(detail, "Identifier")
+        return identifier
+
+    async def resolve_code(self, identifier: Union[int, str]) -> str:
+        code = self._indexed("code", identifier)
+        if code is None:
+            detail = await self.show(Identifier=identifier)
+            code = self._detail_field(detail, self._code_field())
+        return code
+
+
+class AsyncInvoiceResource(AsyncBaseResource, InvoiceResource):
+    """Async invoice resource."""
+
+
+class AsyncCreditInvoiceResource(AsyncBaseResource, CreditInvoiceResource):
+    """Async credit invoice resource."""
+
+
+class AsyncDebtorResource(AsyncBaseResource, DebtorResource):
+    """Async debtor resource."""
+
+
+class AsyncProductResource(AsyncBaseResource, ProductResource):
+    """Async product resource."""
+
+
+class AsyncCreditorResource(AsyncBaseResource, CreditorResource):
+    """Async creditor resource."""
+
+
+class AsyncGroupResource(AsyncBaseResource, GroupResource):
+    """Async group resource."""
+
+
+class AsyncSubscriptionResource(AsyncBaseResource, SubscriptionResource):
+    """Async subscription resource."""
+
+
+class AsyncInteractionResource(AsyncBaseResource, InteractionResource):
+    """Async interaction resource."""
+
+
+class AsyncQuoteResource(AsyncBaseResource, QuoteResource):
+    """Async quote resource."""
+
+
+class AsyncTaskResource(AsyncBaseResource, TaskResource):
+    """Async task resource."""
+
+
+class AsyncTransactionResource(AsyncBaseResource, TransactionResource):
+    """Async transaction resource."""
+
+
+class AsyncSettingsResource(AsyncBaseResource, SettingsResource):
+    """Async settings resource."""
+
+
+class AsyncCostCategoryResource(AsyncBaseResource, CostCategoryResource):
+    """Async cost category resource. Unwraps responses after awaiting them."""
+
+    async def list(self, **params):
+        response = await self._send_request(
+            self.controller_name, CostCategoryAction.LIST, params
+        )
+        return self._unwrap(response, 'costcategories')
+
+    async def show(self, **params):
+        response = await self._send_request(
+            self.controller_name, CostCategoryAction.SHOW, params
+        )
+        return self._unwrap(response, 'costcategory')
+
+    async def create(self, **params):
+        response = await self._send_request(
+            self.controller_name, CostCategoryAction.ADD, params
+        )
+        return self._unwrap(response, 'costcategory')
+
+    async def edit(self, **params):
+        response = await self._send_request(
+            self.controller_name, CostCategoryAction.EDIT, params
+        )
+        return self._unwrap(response, 'costcategory')
@@ -1,10 +1,29 @@
 """Base resource class for all WeFact API resources."""
 
 from __future__ import annotations
-from typing import Any, Dict, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Iterator, List, Mapping, Optional, Union
 
-from ..request import RequestMixin
+from ..config import DEFAULT_API_URL, DEFAULT_RATE_LIMIT_BURST, DEFAULT_REQUESTS_PER_MINUTE
+from ..context import ClientContext, ContextAttribute
+from ..rate_limit import TokenBucket
+from ..request import RequestMixin, Timeout
+from ..retry import RetryPolicy
+from ..timeouts import in_current_context
+from ..utils import format_datetime_for_api
 from ..enums import Action
+from ..exceptions import ClientError
+from ..identifiers import CODE_FIELDS
+
+if TYPE_CHECKING:
+    import requests
+
+# Which listed items list_all()/iter_all() fetch full details for: True (all),
+# False/None (none), a predicate on the summary item, or required field names
+DetailPolicy = Union[bool, None, Callable[[Dict[str, Any]], bool], Collection[str]]
 
 
 class BaseResource(RequestMixin):
@@ -13,48 +32,267 @@ class BaseResource(RequestMixin):
 
     Provides common CRUD operations (list, show, create, edit, delete) that
     work for most resources. Individual resources can override or extend these.
+
+    Transport settings live on a ClientContext. Resources handed out by a
+    client share the client's context; a resource created on its own gets a
+    private one from the given arguments, throttled to the default WeFact
+    budget unless a ``rate_limiter`` is passed. As on the client, pass
+    ``requests_per_minute=None`` to disable client-side rate limiting.
     """
 
     controller_name: str
 
-    def __init__(self, api_key: str, api_url: str = "https://api.mijnwefact.nl/v2/"):
-        self.api_key = api_key
-        self.api_url = api_url
+    api_key = ContextAttribute()
+    api_url = ContextAttribute()
+    session = ContextAttribute()
+    rate_limiter = ContextAttribute()
+    retry_policy = ContextAttribute()
+    timeout = ContextAttribute()
+    cache = ContextAttribute()
+    identifiers = ContextAttribute()
+    response_hooks = ContextAttribute()
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = DEFAULT_API_URL,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Optional[Timeout] = None,
+        *,
+        requests_per_minute: Optional[float] = DEFAULT_REQUESTS_PER_MINUTE,
+        context: Optional[ClientContext] = None,
+    ):
+        if context is None:
+            if rate_limiter is None and requests_per_minute is not None:
+                rate_limiter = TokenBucket.per_minute(
+                    requests_per_minute, DEFAULT_RATE_LIMIT_BURST
+                )
+            context = ClientContext(
+                api_key,
+                api_url,
+                session=session,
+                rate_limiter=rate_limiter,
+                retry_policy=retry_policy,
+                timeout=timeout,
+            )
+        self.context = context
 
     def list(self, **params) -> Dict[str, Any]:
         """List items with optional filtering and pagination."""
         return self._send_request(self.controller_name, Action.LIST, params)
 
-    def list_all(self, offset: int = 0, per_page: int = 1000) -> List[Dict[str, Any]]:
+    def iter_pages(
+        self,
+        offset: int = 0,
+        per_page: int = 1000,
+        prefetch: int = 0,
+        **params,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over listing pages, requesting each page only when needed.
+
+        With ``prefetch``, the remaining offsets are derived from the
+        ``totalresults`` of the first page and up to ``prefetch`` upcoming
+        pages are requested concurrently while the current one is consumed.
+        Requests still go through the client's rate limiter.
+
+        Args:
+            offset: Offset of the first item to list
+            per_page: Number of items requested per page
+            prefetch: Number of pages to fetch ahead in background threads
+            **params: Additional list filters (e.g. status, searchat/searchfor)
+
+        Yields:
+            The list of (summary) items of each page
+        """
+        plural_name = self.get_plural_resource_name()
+
+        result = self.list(limit=per_page, offset=offset, **params)
+        total = result.get("totalresults")
+
+        if prefetch > 0 and total is not None:
+            offsets = iter(range(offset + per_page, int(total), per_page))
+            # Worker threads keep the caller's deadline
+            list_page = in_current_context(self.list)
+            with ThreadPoolExecutor(max_workers=prefetch) as executor:
+                def submit(page_offset: int) -> Future:
+                    return executor.submit(list_page, limit=per_page, offset=page_offset, **params)
+
+                pending = deque(submit(page_offset) for page_offset in islice(offsets, prefetch))
+                while True:
+                    items = result.get(plural_name, [])
+                    if not items:
+                        return
+                    yield items
+                    if not pending:
+                        return
+                    result = pending.popleft().result()
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        pending.append(submit(next_offset))
+
+        while True:
+            items = result.get(plural_name, [])
+            if not items:
+                return
+
+            yield items
+
+            if result.get("currentresults", 0) < per_page:
+                return
+            offset += per_page
+            result = self.list(limit=per_page, offset=offset, **params)
+
+    def iter_all(
+        self,
+        offset: int = 0,
+        per_page: int = 1000,
+        workers: int = 1,
+        detail: DetailPolicy = True,
+        prefetch: int = 0,
+        **params,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all items with detailed information.
+
+        Items are yielded as soon as their details arrive; only one page is
+        held in memory at a time, however many items the account has.
+
+        Args:
+            offset: Offset of the first item to list
+            per_page: Number of items requested per page
+            workers: Number of threads fetching details concurrently. Items
+                keep the order in which the API lists them.
+            detail: Which items to fetch full details for with show():
+                True for all items, False for none (summary fields only),
+                a callable ``detail(item) -> bool``, or a collection of field
+                names, in which case show() is called only for items missing
+                one of these fields
+            prefetch: Number of listing pages to fetch ahead (see iter_pages())
+            **params: Additional list filters
+
+        Yields:
+            Detailed (or summary) items
+        """
+        def fetch(item: Dict[str, Any]) -> Dict[str, Any]:
+            if self._needs_detail(item, detail):
+                return self._fetch_detail(item)
+            return item
+
+        pages = self.iter_pages(offset, per_page, prefetch, **params)
+        if workers > 1 and detail is not False and detail is not None:
+            # Worker threads keep the caller's deadline
+            fetch_in_context = in_current_context(fetch)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for page in pages:
+                    yield from executor.map(fetch_in_context, page)
+        else:
+            for page in pages:
+                for item in page:
+                    yield fetch(item)
+
+    def list_all(
+        self,
+        offset: int = 0,
+        per_page: int = 1000,
+        workers: int = 1,
+        detail: DetailPolicy = True,
+        prefetch: int = 0,
+        **params,
+    ) -> List[Dict[str, Any]]:
         """
         List all items with automatic pagination and detailed information.
 
         Note: This makes one API call per item for full details, which can be slow
-        for large datasets. Use with caution and respect rate limits.
+        for large datasets. Requests are paced by the client's rate limiter.
+        Use iter_all() to process items without holding all of them in memory.
+
+        Args:
+            offset: Offset of the first item to list
+            per_page: Number of items requested per page
+            workers: Number of threads fetching details concurrently. Results
+                keep the order in which the API lists them.
+            detail: Which items to fetch full details for (see iter_all()).
+                Pass False for summary exports to skip all show() calls.
+            prefetch: Number of listing pages to fetch ahead (see iter_pages())
+            **params: Additional list filters
         """
-        limit_per_second = 300 / 60
-        calls = 1
-        data: List[Dict[str, Any]] = []
-        plural_name = self.get_plural_resource_name()
+        return list(self.iter_all(offset, per_page, workers, detail, prefetch, **params))
+
+    def iter_modified(
+        self,
+        since: Union[datetime, str, None],
+        known: Optional[Mapping[str, Any]] = None,
+        offset: int = 0,
+        per_page: int = 1000,
+        workers: int = 1,
+        detail: DetailPolicy = True,
+        prefetch: int = 0,
+        **params,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the items modified at or after a watermark.
+
+        Lists with the ``modified[from]`` filter, so unchanged items are not
+        transferred at all. Use the largest ``Modified`` value of the
+        returned items as the next watermark: it is the API's own clock, so
+        local clock skew cannot skip changes. Deleted items are not listed;
+        run a full listing now and then to detect them.
+
+        Args:
+            since: Watermark (datetime or "YYYY-MM-DD HH:MM:SS"); None lists
+                all items
+            known: ``Modified`` marker per Identifier of the items the caller
+                already has. show() is only called for items whose marker
+                differs, e.g. when the listing overlaps the previous one.
+            offset: Offset of the first item to list
+            per_page: Number of items requested per page
+            workers: Number of threads fetching details concurrently
+            detail: Which changed items to fetch full details for (see iter_all())
+            prefetch: Number of listing pages to fetch ahead
+            **params: Additional list filters
 
-        result = self.list(limit=per_page, offset=offset)
+        Yields:
+            Detailed (or summary) items modified since the watermark
+        """
+        if since is not None:
+            params["modified"] = {**params.get("modified", {}), "from": format_datetime_for_api(since)}
+        return self.iter_all(offset, per_page, workers, self._changed_detail(detail, known), prefetch, **params)
 
-        for index, item in enumerate(result.get(plural_name, [])):
-            calls += 1
-            if calls % limit_per_second == 0:
-                import time
+    def _changed_detail(self, detail: DetailPolicy, known: Optional[Mapping[str, Any]]) -> DetailPolicy:
+        """Restrict a detail policy to items whose Modified marker is not in ``known``."""
+        if not known or not detail:
+            return detail
 
-                time.sleep(1)
-            detail = self.show(Identifier=item["Identifier"])
-            if isinstance(detail, dict) and self.controller_name in detail:
-                result[plural_name][index] = detail[self.controller_name]
+        def needs_detail(item: Dict[str, Any]) -> bool:
+            modified = item.get("Modified")
+            if modified is not None and known.get(str(item.get("Identifier"))) == modified:
+                return False
+            return self._needs_detail(item, detail)
 
-        data.extend(result.get(plural_name, []))
+        return needs_detail
 
-        if result.get("currentresults", 0) >= per_page:
-            data.extend(self.list_all(offset + per_page, per_page))
+    @staticmethod
+    def _needs_detail(item: Dict[str, Any], detail: DetailPolicy) -> bool:
+        """Apply a detail policy to a summary item."""
+        if detail is True:
+            return True
+        if not detail:
+            return False
+        if callable(detail):
+            return bool(detail(item))
+        if isinstance(detail, str):
+            detail = (detail,)
+        return any(field not in item for field in detail)
 
-        return data
+    def _fetch_detail(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace a summary item from a listing by its full details."""
+        detail = self.show(Identifier=item["Identifier"])
+        if isinstance(detail, dict) and self.controller_name in detail:
+            return detail[self.controller_name]
+        return item
 
     def show(self, **params) -> Dict[str, Any]:
         """Get detailed information about a specific item."""
@@ -72,6 +310,50 @@ class BaseResource(RequestMixin):
         """Delete an item."""
         return self._send_request(self.controller_name, Action.DELETE, params)
 
+    def resolve(self, code: str) -> str:
+        """
+        Identifier of the item with a business code (e.g. "DB10000").
+
+        Answered from the client's identifier index when it knows the code;
+        otherwise looked up with show().
+
+        Raises:
+            ClientError: If the resource has no business codes
+            NotFoundError/ValidationError: If no item has the code
+        """
+        identifier = self._indexed("identifier", code)
+        if identifier is None:
+            detail = self.show(**{self._code_field(): code})
+            identifier = self._detail_field(detail, "Identifier")
+        return identifier
+
+    def resolve_code(self, identifier: Union[int, str]) -> str:
+        """Business code of the item with ``identifier``; the inverse of resolve()."""
+        code = self._indexed("code", identifier)
+        if code is None:
+            detail = self.show(Identifier=identifier)
+            code = self._detail_field(detail, self._code_field())
+        return code
+
+    def _code_field(self) -> str:
+        """Field holding the business code of this resource's items."""
+        try:
+            return CODE_FIELDS[self.controller_name]
+        except KeyError:
+            raise ClientError("resolve is not available for this resource.") from None
+
+    def _indexed(self, lookup: str, value: Any) -> Optional[str]:
+        """Look up a code ("identifier") or Identifier ("code") in the client's index."""
+        self._code_field()
+        index = self.identifiers
+        if index is None:
+            return None
+        return getattr(index, lookup)(self.controller_name, value)
+
+    def _detail_field(self, detail: Dict[str, Any], field: str) -> str:
+        """A field of the item in a show() response."""
+        return str(detail[self.controller_name][field])
+
     def get_plural_resource_name(self) -> str:
         """Get the plural name for this resource (used in API responses)."""
         return f"{self.controller_name}s"
@@ -18,6 +18,16 @@ class CostCategoryResource(BaseResource):
         """Cost categories use 'costcategories' as plural name."""
         return "costcategories"
 
+    @staticmethod
+    def _unwrap(response, key):
+        """Unwrap the nested structure: {'settings': {key: ...}}."""
+        if 'settings' in response and key in response['settings']:
+            return {
+                **response,
+                key: response['settings'][key]
+            }
+        return response
+
     def list(self, **params):
         """
         List cost categories.
@@ -28,13 +38,7 @@ class CostCategoryResource(BaseResource):
         response = self._send_request(
             self.controller_name, CostCategoryAction.LIST, params
         )
-        # Unwrap the nested structure: {'settings': {'costcategories': [...]}}
-        if 'settings' in response and 'costcategories' in response['settings']:
-            return {
-                **response,
-                'costcategories': response['settings']['costcategories']
-            }
-        return response
+        return self._unwrap(response, 'costcategories')
 
     def show(self, **params):
         """
@@ -49,13 +53,7 @@ class CostCategoryResource(BaseResource):
         response = self._send_request(
             self.controller_name, CostCategoryAction.SHOW, params
         )
-        # Unwrap the nested structure if needed
-        if 'settings' in response and 'costcategory' in response['settings']:
-            return {
-                **response,
-                'costcategory': response['settings']['costcategory']
-            }
-        return response
+        return self._unwrap(response, 'costcategory')
 
     def create(self, **params):
         """
@@ -70,13 +68,7 @@ class CostCategoryResource(BaseResource):
         response = self._send_request(
             self.controller_name, CostCategoryAction.ADD, params
         )
-        # Unwrap the nested structure: {'settings': {'costcategory': {...}}}
-        if 'settings' in response and 'costcategory' in response['settings']:
-            return {
-                **response,
-                'costcategory': response['settings']['costcategory']
-            }
-        return response
+        return self._unwrap(response, 'costcategory')
 
     def edit(self, **params):
         """
@@ -92,13 +84,7 @@ class CostCategoryResource(BaseResource):
         response = self._send_request(
             self.controller_name, CostCategoryAction.EDIT, params
         )
-        # Unwrap if needed
-        if 'settings' in response and 'costcategory' in response['settings']:
-            return {
-                **response,
-                'costcategory': response['settings']['costcategory']
-            }
-        return response
+        return self._unwrap(response, 'costcategory')
 
     def delete(self, **params):
         """
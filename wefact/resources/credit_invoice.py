@@ -98,7 +98,8 @@ class CreditInvoiceResource(BaseResource):
             ReferenceIdentifier: Credit invoice ID (numeric string)
             CreditInvoiceCode: Or use credit invoice code
             Filename: Attachment filename
-            Base64: Base64 encoded file content
+            Base64: Base64 encoded file content, or a pathlib.Path or binary
+                file object whose content is streamed Base64-encoded
             
         Returns:
             Success confirmation
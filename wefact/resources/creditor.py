@@ -23,7 +23,8 @@ class CreditorResource(BaseResource):
             ReferenceIdentifier: Creditor ID (numeric string)
             CreditorCode: Or use creditor code
             Filename: Attachment filename
-            Base64: Base64 encoded file content
+            Base64: Base64 encoded file content, or a pathlib.Path or binary
+                file object whose content is streamed Base64-encoded
             
         Returns:
             Success confirmation
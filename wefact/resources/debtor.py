@@ -89,7 +89,8 @@ class DebtorResource(BaseResource):
             ReferenceIdentifier: Debtor ID (numeric string)
             DebtorCode: Or use debtor code (e.g., "DB10000")
             Filename: Attachment filename
-            Base64: Base64 encoded file content
+            Base64: Base64 encoded file content, or a pathlib.Path or binary
+                file object whose content is streamed Base64-encoded
             
         Returns:
             Success confirmation
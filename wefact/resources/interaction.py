@@ -22,7 +22,8 @@ class InteractionResource(BaseResource):
         Args:
             ReferenceIdentifier: Interaction ID (numeric string)
             Filename: Attachment filename
-            Base64: Base64 encoded file content
+            Base64: Base64 encoded file content, or a pathlib.Path or binary
+                file object whose content is streamed Base64-encoded
             
         Returns:
             Success confirmation
@@ -154,6 +154,26 @@ class InvoiceResource(BaseResource):
             self.controller_name, InvoiceAction.DOWNLOAD, params
         )
 
+    def download_to(self, destination, **params):
+        """
+        Download invoice PDF straight into a file or stream.
+
+        The Base64 content is decoded while the response is received, so
+        memory use does not depend on the size of the document. A path is
+        only written once the download succeeded.
+
+        Args:
+            destination: Path to write the PDF to, or a binary file object
+            Identifier: Invoice ID (numeric string)
+            InvoiceCode: Or use invoice code (e.g., "INV10000")
+
+        Returns:
+            Response of download() without the Base64 content (e.g. Filename)
+        """
+        return self._download_to(
+            self.controller_name, InvoiceAction.DOWNLOAD, params, destination
+        )
+
     # State management
     
     def block(self, **params):
@@ -323,7 +343,8 @@ class InvoiceResource(BaseResource):
             ReferenceIdentifier: Invoice ID (numeric string)
             InvoiceCode: Or use invoice code (e.g., "INV10000")
             Filename: Attachment filename
-            Base64: Base64 encoded file content
+            Base64: Base64 encoded file content, or a pathlib.Path or binary
+                file object whose content is streamed Base64-encoded
             
         Returns:
             Success confirmation
@@ -46,6 +46,26 @@ class QuoteResource(BaseResource):
             self.controller_name, QuoteAction.DOWNLOAD, params
         )
 
+    def download_to(self, destination, **params):
+        """
+        Download quote PDF straight into a file or stream.
+
+        The Base64 content is decoded while the response is received, so
+        memory use does not depend on the size of the document. A path is
+        only written once the download succeeded.
+
+        Args:
+            destination: Path to write the PDF to, or a binary file object
+            Identifier: Quote ID (numeric string)
+            PriceQuoteCode: Or use quote code
+
+        Returns:
+            Response of download() without the Base64 content (e.g. Filename)
+        """
+        return self._download_to(
+            self.controller_name, QuoteAction.DOWNLOAD, params, destination
+        )
+
     # Scheduling
     
     def schedule(self, **params):
@@ -186,7 +206,8 @@ class QuoteResource(BaseResource):
             ReferenceIdentifier: Quote ID (numeric string)
             PriceQuoteCode: Or use quote code
             Filename: Attachment filename
-            Base64: Base64 encoded file content
+            Base64: Base64 encoded file content, or a pathlib.Path or binary
+                file object whose content is streamed Base64-encoded
             
         Returns:
             Success confirmation
@@ -38,7 +38,8 @@ class TaskResource(BaseResource):
         Args:
             ReferenceIdentifier: Task ID (numeric string)
             Filename: Attachment filename
-            Base64: Base64 encoded file content
+            Base64: Base64 encoded file content, or a pathlib.Path or binary
+                file object whose content is streamed Base64-encoded
             
         Note:
             Type parameter is automatically set to "crm_task"
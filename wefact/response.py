@@ -0,0 +1,128 @@
+"""Response processing: decode each API response once and share the result."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional
+
+from .exceptions import (
+    ValidationError,
+    WeFactAPIError,
+    raise_for_response,
+    raise_for_wefact_payload,
+)
+
+__all__ = ["ApiResponse", "ResponseHook"]
+
+# Marks a body that has not been parsed yet; None is a valid (JSON null) body
+_UNSET: Any = object()
+
+
+class ApiResponse:
+    """
+    One HTTP response of the WeFact API, decoded at most once.
+
+    The parsed body is shared by success handling, error mapping and
+    response hooks, so none of them parses or decodes the response again.
+    Hooks registered with ``ClientContext.add_response_hook()`` receive the
+    ApiResponse of every attempt, including failed and retried ones.
+
+    Attributes:
+        response: The requests/httpx response
+        controller: Controller of the call, if known
+        action: Action of the call, if known
+        error: Exception raised for this response, if any
+    """
+
+    __slots__ = ("response", "controller", "action", "error", "_data", "_json_error")
+
+    def __init__(self, response: Any, controller: Optional[str] = None, action: Optional[str] = None):
+        self.response = response
+        self.controller = controller
+        self.action = action
+        self.error: Optional[WeFactAPIError] = None
+        self._data: Any = _UNSET
+        self._json_error: Optional[Exception] = None
+
+    @property
+    def status(self) -> Optional[int]:
+        """HTTP status code."""
+        return getattr(self.response, "status_code", None)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the HTTP status is in the 2xx range."""
+        return 200 <= int(self.status or 0) < 300
+
+    @property
+    def headers(self) -> Any:
+        """Response headers (the response's own case-insensitive mapping)."""
+        return getattr(self.response, "headers", None) or {}
+
+    @property
+    def content(self) -> Optional[bytes]:
+        """Raw response body, or None when it was streamed (downloads)."""
+        try:
+            content = getattr(self.response, "content", None)
+        except RuntimeError:
+            # A consumed stream: requests raises RuntimeError, httpx ResponseNotRead
+            return None
+        return content if isinstance(content, bytes) else None
+
+    def json(self) -> Any:
+        """
+        The JSON body, parsed on first use.
+
+        Raises:
+            ValueError (or the client library's decode error) when the body
+            is not JSON; the error is remembered and raised again on later calls.
+        """
+        if self._data is _UNSET:
+            if self._json_error is not None:
+                raise self._json_error
+            try:
+                self._data = self.response.json()
+            except Exception as e:
+                self._json_error = e
+                raise
+        return self._data
+
+    def set_json(self, data: Any) -> None:
+        """Use a body parsed elsewhere, e.g. by a streaming download parser."""
+        self._data = data
+
+    def body(self) -> Any:
+        """The JSON body, or the text of a non-JSON body (for error messages)."""
+        try:
+            return self.json()
+        except Exception:
+            return getattr(self.response, "text", None)
+
+    def raise_for_status(self) -> None:
+        """Raise the mapped WeFactAPIError for a non-2xx response."""
+        if not self.ok:
+            raise_for_response(self.response, self.body())
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Map HTTP and WeFact errors to exceptions and return the parsed body.
+
+        Raises:
+            WeFactAPIError: For HTTP errors, invalid JSON and ``status: error``
+                payloads
+        """
+        self.raise_for_status()
+
+        try:
+            data = self.json()
+        except ValueError as e:
+            raise ValidationError("Invalid JSON response") from e
+
+        # Align with WeFact: status=='error' indicates an application-level error.
+        # Only objects carry a status; passing None would parse the body again.
+        if isinstance(data, dict):
+            raise_for_wefact_payload(self.response, data)
+        return data
+
+
+# Called with the ApiResponse of each attempt
+ResponseHook = Callable[[ApiResponse], Any]
@@ -0,0 +1,97 @@
+"""Retry policy for transient WeFact API failures."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, FrozenSet, Optional
+
+from .enums.actions import Action
+from .enums.cost_category_actions import CostCategoryAction
+from .exceptions import RateLimitError, ServerError, TransportError, WeFactAPIError
+
+__all__ = [
+    "SAFE_ACTIONS",
+    "DEFAULT_RETRY_POLICY",
+    "RetryPolicy",
+]
+
+# Read-only actions that can be repeated without side effects. Cost
+# categories are served by the settings controller under prefixed action
+# names, so their list/show actions are listed separately.
+SAFE_ACTIONS: FrozenSet[str] = frozenset(action.value for action in (
+    Action.LIST,
+    Action.SHOW,
+    Action.DOWNLOAD,
+    Action.ATTACHMENT_DOWNLOAD,
+    CostCategoryAction.LIST,
+    CostCategoryAction.SHOW,
+))
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry transient failures with exponential backoff and full jitter.
+
+    Retried failures are server errors and 429 responses with a status in
+    ``retry_statuses``, and transport errors (connection refused/reset).
+    A ``Retry-After`` header takes precedence over the computed backoff,
+    capped at ``max_backoff``.
+
+    Only safe (read-only) actions are retried by default. Mutating actions
+    such as ``add`` or ``markaspaid`` may already have been applied when a
+    failure is reported, so retrying them is opt-in via ``retry_mutating``.
+
+    Attributes:
+        max_attempts: Total number of attempts, including the first one.
+        backoff_factor: Base delay in seconds; attempt n waits up to
+            ``backoff_factor * 2 ** (n - 1)``.
+        max_backoff: Upper bound for any delay, including ``Retry-After``
+            (seconds).
+        jitter: Randomise delays ("full jitter") to spread out retries.
+        retry_statuses: HTTP statuses that are retried.
+        safe_actions: Actions that are always safe to retry.
+        retry_mutating: Also retry actions not in ``safe_actions``.
+
+    Example:
+        >>> client = WeFact(api_key="...", retry=RetryPolicy(max_attempts=5))
+        >>> client = WeFact(api_key="...", retry=None)  # Disable retries
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    safe_actions: FrozenSet[str] = field(default_factory=lambda: SAFE_ACTIONS)
+    retry_mutating: bool = False
+
+    def is_retryable(self, action: Any, error: WeFactAPIError) -> bool:
+        """Whether `error` raised by `action` is transient and safe to retry."""
+        action = getattr(action, "value", action)
+        if action not in self.safe_actions and not self.retry_mutating:
+            return False
+        if isinstance(error, TransportError):
+            return True
+        if isinstance(error, (ServerError, RateLimitError)):
+            return error.status in self.retry_statuses
+        return False
+
+    def should_retry(self, action: Any, error: WeFactAPIError, attempt: int) -> bool:
+        """Whether to make another attempt after `attempt` failed with `error`."""
+        return attempt < self.max_attempts and self.is_retryable(action, error)
+
+    def backoff(self, attempt: int, error: Optional[WeFactAPIError] = None) -> float:
+        """Delay in seconds before the attempt following `attempt`."""
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            # Never let the server park a call for longer than max_backoff
+            return min(retry_after, self.max_backoff)
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+# Policy used by clients unless configured otherwise (safe actions only)
+DEFAULT_RETRY_POLICY = RetryPolicy()
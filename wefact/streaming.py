@@ -0,0 +1,473 @@
+"""Streaming Base64 request bodies (uploads) and response parsing (downloads)."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import json
+import os
+import re
+from contextlib import suppress
+from pathlib import Path
+from typing import IO, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote_plus
+
+from .config import DEFAULT_UPLOAD_CHUNK_SIZE
+
+# A file to upload: a path or a binary file object opened for reading
+FileSource = Union[os.PathLike, IO[bytes]]
+
+# Where a download is written: a path or a binary file object opened for writing
+DownloadDestination = Union[str, os.PathLike, IO[bytes]]
+
+_BASE64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+# Bytes b64decode() silently discards (everything but the alphabet and padding)
+_NON_BASE64 = bytes(sorted(set(range(256)) - set(_BASE64_ALPHABET + b"=")))
+
+# Start of a string or an escape sequence inside one
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+# A complete JSON escape sequence
+_JSON_ESCAPE = re.compile(rb'\\(u[0-9a-fA-F]{4}|[^u])')
+
+_JSON_WHITESPACE = b' \t\r\n'
+
+
+def is_file_source(value: object) -> bool:
+    """Whether a parameter value is a file to stream rather than Base64 text."""
+    return isinstance(value, os.PathLike) or (
+        hasattr(value, 'read') and not isinstance(value, (str, bytes))
+    )
+
+
+def iter_aligned_chunks(stream: IO[bytes], chunk_size: int) -> Iterator[bytes]:
+    """
+    Read a binary stream in chunks whose length is a multiple of 3.
+
+    Base64-encoding such chunks one by one gives the same text as encoding
+    the whole stream at once. Short reads are buffered until aligned.
+
+    Args:
+        stream: Binary file object to read from
+        chunk_size: Bytes to read at a time, rounded down to a multiple of 3
+
+    Yields:
+        Chunks of raw bytes; only the last one may be unaligned
+    """
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+    pending = b''
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            break
+        if not isinstance(data, bytes):
+            raise TypeError('File objects must be opened in binary mode')
+        if pending:
+            data = pending + data
+        cut = len(data) - len(data) % 3
+        pending = data[cut:]
+        if cut:
+            yield data[:cut]
+    if pending:
+        yield pending
+
+
+def _form_encode_base64(chunk: bytes) -> bytes:
+    """Base64-encode a chunk and percent-encode it like quote_plus() would."""
+    return (
+        base64.b64encode(chunk)
+        .replace(b'+', b'%2B')
+        .replace(b'/', b'%2F')
+        .replace(b'=', b'%3D')
+    )
+
+
+class StreamingFormBody:
+    """
+    Form-encoded request body with file fields Base64-encoded while sending.
+
+    Only one chunk of each file is held in memory at a time. Paths are opened
+    on every iteration and seekable streams are rewound, so the body can be
+    sent again when a request is retried.
+
+    Args:
+        head: The already encoded fields (``api_key=..&controller=..``)
+        files: ``(name, source)`` pairs appended as ``&name=<base64>``
+        chunk_size: Bytes of a file read and encoded at a time
+    """
+
+    def __init__(
+        self,
+        head: str,
+        files: List[Tuple[str, FileSource]],
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    ):
+        self.head = head.encode('ascii')
+        self.chunk_size = chunk_size
+        self.files = []
+        for name, source in files:
+            if isinstance(source, os.PathLike):
+                start = None
+            else:
+                start = source.tell() if _seekable(source) else None
+            self.files.append((f"&{quote_plus(name)}=".encode('ascii'), source, start))
+        self._length: Optional[int] = None
+        self._consumed = False
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the body can be sent more than once (paths and seekable streams)."""
+        return all(
+            isinstance(source, os.PathLike) or start is not None
+            for _, source, start in self.files
+        )
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """
+        Length of the encoded body, or None when a stream cannot be rewound.
+
+        Computed once by encoding the files without keeping the output.
+        """
+        if self._length is None and self.replayable:
+            length = len(self.head)
+            for field, source, start in self.files:
+                length += len(field)
+                for chunk in self._iter_source(source, start):
+                    length += len(_form_encode_base64(chunk))
+            self._length = length
+        return self._length
+
+    def __len__(self) -> int:
+        length = self.content_length
+        if length is None:
+            raise TypeError('Body length is unknown for non-seekable streams')
+        return length
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._consumed and not self.replayable:
+            raise ValueError('Upload stream was already sent and cannot be rewound')
+        self._consumed = True
+        yield self.head
+        for field, source, start in self.files:
+            yield field
+            for chunk in self._iter_source(source, start):
+                yield _form_encode_base64(chunk)
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """
+        Iterate over the body from async code (httpx ``content=``).
+
+        Files are read and encoded in a worker thread, off the event loop.
+        """
+        chunks = iter(self)
+        try:
+            while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                yield chunk
+        finally:
+            # Still running in the worker thread when a read was cancelled
+            with suppress(ValueError):
+                chunks.close()
+
+    def _iter_source(self, source: FileSource, start: Optional[int]) -> Iterator[bytes]:
+        if isinstance(source, os.PathLike):
+            with open(Path(source), 'rb') as f:
+                yield from iter_aligned_chunks(f, self.chunk_size)
+            return
+        if start is not None:
+            source.seek(start)
+        yield from iter_aligned_chunks(source, self.chunk_size)
+
+
+def _seekable(stream: IO[bytes]) -> bool:
+    seekable = getattr(stream, 'seekable', None)
+    try:
+        return bool(seekable()) if seekable is not None else False
+    except (OSError, ValueError):
+        return False
+
+
+class Base64Decoder:
+    """
+    Incremental Base64 decoder.
+
+    Feeding the text in pieces gives the same bytes as ``base64.b64decode()``
+    on the whole text: characters outside the alphabet are skipped, and
+    complete padding ends the input.
+    """
+
+    def __init__(self):
+        self._carry = b''  # Data characters of an incomplete quad
+        self._pads = 0  # Padding characters seen since the last data character
+        self.done = False
+
+    def feed(self, text: bytes) -> bytes:
+        """Decode the next piece of Base64 text (ASCII bytes)."""
+        if self.done:
+            return b''
+        out = []
+        data = text.translate(None, _NON_BASE64)
+        while data:
+            pad = data.find(b'=')
+            if pad < 0:
+                head, data = data, b''
+            else:
+                head = data[:pad]
+            if head:
+                head = self._carry + head
+                cut = len(head) - len(head) % 4
+                if cut:
+                    out.append(binascii.a2b_base64(head[:cut]))
+                self._carry = head[cut:]
+                self._pads = 0
+            if pad < 0:
+                break
+
+            rest = data[pad:].lstrip(b'=')
+            self._pads += len(data) - pad - len(rest)
+            data = rest
+            carry = self._carry
+            if len(carry) >= 2 and len(carry) + self._pads >= 4:
+                # Complete padding ends the input, like b64decode()
+                out.append(binascii.a2b_base64(carry + b'=' * (4 - len(carry))))
+                self._carry = b''
+                self.done = True
+                break
+        return b''.join(out)
+
+    def finish(self) -> bytes:
+        """
+        Decode what is left at the end of the input.
+
+        Raises:
+            binascii.Error: If the input ends with an incomplete quad
+        """
+        carry, self._carry = self._carry, b''
+        self.done = True
+        # Raises for a truncated quad, like b64decode()
+        return binascii.a2b_base64(carry) if carry else b''
+
+
+class Base64FieldParser:
+    """
+    Extract a Base64 string field from a JSON response while it is received.
+
+    The response is scanned until the ``"<field>":"`` key, after which the
+    value is unescaped, decoded and passed to ``write`` chunk by chunk. The
+    rest of the document is kept (without the value) and parsed by close().
+
+    Args:
+        write: Called with every chunk of decoded bytes
+        field: Name of the JSON field holding the Base64 content
+    """
+
+    def __init__(self, write: Callable[[bytes], Any], field: str = 'Base64'):
+        self._write = write
+        self._field = field.encode()
+        self._decoder = Base64Decoder()
+        self._head = bytearray()  # Document up to and including the value's opening quote
+        self._tail = bytearray()  # Document from the value's closing quote
+        self._pending = b''  # Unprocessed end of the value (a split escape)
+        self._state = 'head'
+        # Tokenizer state while scanning the head
+        self._pos = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_string: Optional[bytes] = None
+        self._key_matched = False
+        self.found = False
+        self.written = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Process the next chunk of the response body."""
+        if self._state == 'head':
+            self._head += chunk
+            start = self._scan_head()
+            if start is None:
+                return
+            chunk = bytes(self._head[start:])
+            del self._head[start:]
+            self._state = 'value'
+            self.found = True
+        if self._state == 'value':
+            self._feed_value(chunk)
+        else:
+            self._tail += chunk
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish parsing and return the document without the Base64 value.
+
+        Raises:
+            ValueError: If the response is not valid JSON or ends inside the value
+            binascii.Error: If the Base64 content is incorrectly padded
+        """
+        if self._state == 'value':
+            raise ValueError(f'Response ended inside the {self._field.decode()} field')
+        return json.loads(bytes(self._head + self._tail))
+
+    def _scan_head(self) -> Optional[int]:
+        """Tokenize the head; return the offset of the field's value once found."""
+        data = self._head
+        i, n = self._pos, len(data)
+        while i < n:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(data, i)
+                if match is None:
+                    i = n
+                    break
+                i = match.start()
+                if data[i] == 0x5C:  # Backslash: skip the escaped character
+                    if i + 1 >= n:
+                        break
+                    i += 2
+                    continue
+                self._in_string = False
+                self._last_string = bytes(data[self._string_start:i])
+                i += 1
+                continue
+
+            byte = data[i]
+            if byte in _JSON_WHITESPACE:
+                pass
+            elif byte == 0x22:  # Opening quote
+                if self._key_matched:
+                    self._pos = i + 1
+                    return i + 1
+                self._in_string = True
+                self._string_start = i + 1
+            elif byte == 0x3A:  # Colon after a key
+                self._key_matched = self._last_string == self._field
+            else:
+                self._key_matched = False
+                self._last_string = None
+            i += 1
+        self._pos = i
+        return None
+
+    def _feed_value(self, chunk: bytes) -> None:
+        data = self._pending + chunk if self._pending else chunk
+        end = _closing_quote(data)
+        value = data if end is None else data[:end]
+
+        if b'\\' in value:
+            unescaped = value.replace(b'\\/', b'/')  # PHP escapes slashes
+            if b'\\' in unescaped:
+                unescaped, pending = _unescape(value)
+            else:
+                pending = b''
+        else:
+            unescaped, pending = value, b''
+        if end is not None and pending:
+            raise ValueError('Invalid escape sequence in the Base64 field')
+        self._pending = pending
+
+        decoded = self._decoder.feed(unescaped)
+        if end is not None:
+            decoded += self._decoder.finish()
+            self._tail += data[end:]
+            self._state = 'tail'
+        if decoded:
+            self._write(decoded)
+            self.written += len(decoded)
+
+
+def _closing_quote(data: bytes) -> Optional[int]:
+    """Offset of the first unescaped quote, if any."""
+    start = 0
+    while True:
+        end = data.find(b'"', start)
+        if end < 0:
+            return None
+        escape = end
+        while escape > 0 and data[escape - 1] == 0x5C:
+            escape -= 1
+        if (end - escape) % 2 == 0:
+            return end
+        start = end + 1
+
+
+def _unescape(value: bytes) -> Tuple[bytes, bytes]:
+    """Unescape JSON string content; return it with a trailing incomplete escape."""
+    out = []
+    pos = 0
+    for match in _JSON_ESCAPE.finditer(value):
+        out.append(value[pos:match.start()])
+        escaped = match.group(1)
+        if escaped[:1] == b'u':
+            out.append(chr(int(escaped[1:], 16)).encode())
+        else:
+            # \/ and \\ map to themselves; control characters are not Base64 anyway
+            out.append(escaped)
+        pos = match.end()
+    rest = value[pos:]
+    split = rest.find(b'\\')
+    if split >= 0:
+        if len(rest) - split > 5:
+            raise ValueError('Invalid escape sequence in the Base64 field')
+        out.append(rest[:split])
+        return b''.join(out), rest[split:]
+    out.append(rest)
+    return b''.join(out), b''
+
+
+class DownloadTarget:
+    """
+    Destination of a streamed download, safe to write to again on retry.
+
+    Paths are written to a ``.part`` file next to them, renamed into place
+    once the download succeeded and removed when it failed, so a path never
+    holds a partial document. Seekable streams are rewound for a retry.
+
+    Args:
+        destination: Path, or a binary file object opened for writing
+    """
+
+    def __init__(self, destination: DownloadDestination):
+        self.destination = destination
+        self._file: Optional[IO[bytes]] = None
+        self._written = False
+        if isinstance(destination, (str, os.PathLike)):
+            self.path: Optional[Path] = Path(destination)
+            self._partial = self.path.with_name(self.path.name + '.part')
+            self._start = None
+        else:
+            self.path = None
+            self._start = destination.tell() if _seekable(destination) else None
+
+    @property
+    def replayable(self) -> bool:
+        """Whether a failed attempt can be undone for a retry."""
+        return self.path is not None or self._start is not None or not self._written
+
+    def open(self) -> Callable[[bytes], Any]:
+        """Start an attempt and return the function writing its bytes."""
+        if self.path is not None:
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self._partial, 'wb')
+            return self._file.write
+        if self._written and self._start is not None:
+            self.destination.seek(self._start)
+            self.destination.truncate()
+            self._written = False
+
+        def write(chunk: bytes) -> Any:
+            self._written = True
+            return self.destination.write(chunk)
+
+        return write
+
+    def __enter__(self) -> 'DownloadTarget':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        if exc_type is None:
+            os.replace(self._partial, self.path)
+        else:
+            self._partial.unlink(missing_ok=True)
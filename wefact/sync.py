@@ -0,0 +1,637 @@
+"""Local SQLite mirror of WeFact resources, refreshed incrementally."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Mapping, Optional,
+    Sequence, Tuple, Union,
+)
+
+from .resources.base import DetailPolicy
+from .timeouts import in_current_context
+
+__all__ = ["Column", "TableSpec", "TABLES", "DEFAULT_WATERMARK_OVERLAP", "SyncResult", "Mirror"]
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    Typed column holding one API field of the mirrored items.
+
+    Attributes:
+        name: API field, also used as column name
+        type: SQLite type: TEXT, INTEGER or REAL
+        index: Create an index on the column
+    """
+
+    name: str
+    type: str = "TEXT"
+    index: bool = False
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """
+    Table mirroring the items of one controller.
+
+    Besides ``columns`` every table has ``Identifier`` (primary key),
+    ``Created`` and ``Modified``, the complete item as JSON in ``data`` and
+    bookkeeping columns used by incremental refreshes.
+
+    Attributes:
+        controller: API controller
+        resource: Attribute of the client holding the resource
+        table: Table name
+        columns: Typed columns
+    """
+
+    controller: str
+    resource: str
+    table: str
+    columns: Tuple[Column, ...] = ()
+
+
+def _code(name: str) -> Column:
+    return Column(name, "TEXT", index=True)
+
+
+def _date(name: str) -> Column:
+    return Column(name, "TEXT", index=True)
+
+
+def _amount(name: str) -> Column:
+    return Column(name, "REAL")
+
+
+# Mirrored controllers. Dates are stored as the API returns them
+# (YYYY-MM-DD), so they sort and compare as text.
+TABLES: Mapping[str, TableSpec] = {spec.controller: spec for spec in (
+    TableSpec("debtor", "debtors", "debtors", (
+        _code("DebtorCode"), Column("CompanyName"), Column("Initials"), Column("SurName"),
+        Column("EmailAddress"), Column("City"), Column("Country"),
+    )),
+    TableSpec("creditor", "creditors", "creditors", (
+        _code("CreditorCode"), Column("CompanyName"), Column("SurName"), Column("EmailAddress"),
+    )),
+    TableSpec("product", "products", "products", (
+        _code("ProductCode"), Column("ProductName"), _amount("PriceExcl"),
+        Column("PricePeriod", index=True), _amount("TaxPercentage"),
+    )),
+    TableSpec("group", "groups", "groups", (
+        Column("GroupName"), Column("Type", index=True),
+    )),
+    TableSpec("invoice", "invoices", "invoices", (
+        _code("InvoiceCode"), Column("Debtor", "INTEGER", index=True), _code("DebtorCode"),
+        Column("CompanyName"), Column("Status", "INTEGER", index=True), Column("SubStatus", index=True),
+        _date("Date"), _date("PayBefore"), _amount("AmountExcl"), _amount("AmountIncl"),
+        _amount("AmountPaid"),
+    )),
+    TableSpec("creditinvoice", "credit_invoices", "credit_invoices", (
+        _code("CreditInvoiceCode"), Column("Creditor", "INTEGER", index=True), _code("CreditorCode"),
+        Column("Status", "INTEGER", index=True), _date("Date"), _date("PayBefore"),
+        _amount("AmountExcl"), _amount("AmountIncl"), _amount("AmountPaid"),
+    )),
+    TableSpec("pricequote", "quotes", "quotes", (
+        _code("PriceQuoteCode"), Column("Debtor", "INTEGER", index=True), _code("DebtorCode"),
+        Column("CompanyName"), Column("Status", "INTEGER", index=True), _date("Date"),
+        _amount("AmountExcl"), _amount("AmountIncl"),
+    )),
+    TableSpec("subscription", "subscriptions", "subscriptions", (
+        Column("Debtor", "INTEGER", index=True), _code("DebtorCode"), _code("ProductCode"),
+        Column("Description"), _amount("PriceExcl"), Column("Periodic", index=True),
+        _date("StartPeriod"), _date("EndPeriod"), _date("NextDate"), _date("TerminationDate"),
+    )),
+    TableSpec("interaction", "interactions", "interactions", (
+        Column("Debtor", "INTEGER", index=True), _code("DebtorCode"), _date("Date"),
+        Column("CommunicationMethod"), Column("Description"),
+    )),
+    TableSpec("task", "tasks", "tasks", (
+        Column("Title"), Column("Status", index=True), _date("DueDate"),
+    )),
+    TableSpec("transaction", "transactions", "transactions", (
+        _date("Date"), _amount("Amount"), Column("Status", index=True), Column("Description"),
+    )),
+)}
+
+# Columns of every table, before the spec's own columns
+_BASE_COLUMNS = (Column("Created"), _date("Modified"))
+
+# Seconds an incremental listing reaches back before the watermark. Items
+# modified while a multi-page listing ran can be missed by it, and the
+# ``modified[from]`` filter only has one-second resolution.
+DEFAULT_WATERMARK_OVERLAP = 300.0
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one Mirror.sync() call."""
+
+    controller: str
+    listed: int = 0  # Items in the listing
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0  # Mirrored items no longer listed
+    unchanged: int = 0  # Listed items whose summary did not change
+    details: int = 0  # show() calls made
+    since: Optional[str] = None  # Watermark the listing was based on (None: full listing)
+    watermark: Optional[str] = None  # Latest Modified marker listed
+    seconds: float = 0.0
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _convert(value: Any, type_: str) -> Any:
+    """API value (usually a string) as the column type; None when empty or invalid."""
+    if value is None or value == "":
+        return None
+    if type_ == "TEXT":
+        return value if isinstance(value, str) else json.dumps(value)
+    try:
+        return int(value) if type_ == "INTEGER" else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _batched(items: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Group items into lists of ``size`` items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+async def _batched_async(items: AsyncIterable[Dict[str, Any]], size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Group the items of an async iterable into lists of ``size`` items."""
+    batch: List[Dict[str, Any]] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _fingerprint(item: Mapping[str, Any]) -> str:
+    """Hash of a summary item, to recognise items that did not change."""
+    encoded = json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode()).hexdigest()
+
+
+class Mirror:
+    """
+    Local SQLite copy of WeFact resources for fast, request-free reads.
+
+    ``sync()`` pages through a resource's listing (reusing
+    ``BaseResource.iter_modified()``) and stores every item in a table with
+    typed, indexed columns for codes, statuses and dates, plus the whole
+    item as JSON. Later syncs are incremental: they list only the items
+    modified since the controller's watermark, and items whose listed fields
+    did not change are neither written nor fetched again. Only changed items
+    cost a ``show()`` call when full details are mirrored.
+
+    The database uses WAL journaling, so dashboards in other processes can
+    read it (``sqlite3.connect(path)``) while a sync writes.
+
+    Args:
+        path: Database file, or ``":memory:"``
+        tables: Mirrored controllers and their table layout
+        overlap: Seconds incremental listings reach back before the
+            watermark, to catch items modified while the previous listing
+            ran. Re-listed items that did not change are skipped.
+
+    Example:
+        >>> with Mirror("wefact.db") as mirror:
+        ...     mirror.sync_all(client)                     # Full load, then incremental
+        ...     mirror.find("invoice", Status=2, order_by="Date")
+        ...     mirror.get("debtor", 1)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        tables: Mapping[str, TableSpec] = TABLES,
+        overlap: float = DEFAULT_WATERMARK_OVERLAP,
+    ):
+        self.path = os.fspath(path)
+        self.tables = dict(tables)
+        self.overlap = overlap
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        statements = [
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            "controller TEXT PRIMARY KEY, synced_at REAL NOT NULL, items INTEGER NOT NULL, "
+            "watermark TEXT)"
+        ]
+        for spec in self.tables.values():
+            table = _quote(spec.table)
+            columns = "".join(
+                f", {_quote(column.name)} {column.type}" for column in _BASE_COLUMNS + spec.columns
+            )
+            statements.append(
+                f"CREATE TABLE IF NOT EXISTS {table} (Identifier INTEGER PRIMARY KEY{columns}, "
+                "data TEXT NOT NULL, fingerprint TEXT NOT NULL, detailed INTEGER NOT NULL, "
+                "synced_at REAL NOT NULL)"
+            )
+            for column in _BASE_COLUMNS + spec.columns:
+                if column.index:
+                    statements.append(
+                        f"CREATE INDEX IF NOT EXISTS {_quote(f'{spec.table}_{column.name}')} "
+                        f"ON {table} ({_quote(column.name)})"
+                    )
+        with self._lock:
+            self._db.executescript(";\n".join(statements))
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "Mirror":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def spec(self, controller: str) -> TableSpec:
+        """Table layout of a mirrored controller."""
+        try:
+            return self.tables[controller]
+        except KeyError:
+            raise ValueError(f"Controller {controller!r} is not mirrored") from None
+
+    # Synchronisation
+
+    def sync(
+        self,
+        resource: Any,
+        detail: DetailPolicy = False,
+        workers: int = 1,
+        prefetch: int = 0,
+        per_page: int = 1000,
+        prune: bool = True,
+        full: bool = False,
+        **params,
+    ) -> SyncResult:
+        """
+        Mirror the items of a resource.
+
+        The first sync loads everything and records the latest ``Modified``
+        marker of the listed items as the controller's watermark. Later
+        syncs only list the items modified since the watermark (see
+        BaseResource.iter_modified()), and only write (and fetch details
+        for) those whose listed fields changed. A refresh of 50,000 invoices
+        then transfers just the few hundred that changed.
+
+        The listing starts ``overlap`` seconds before the watermark: an item
+        modified while a long listing ran may have been skipped by it, and
+        ``modified[from]`` only has one-second resolution. Items listed again
+        without changes are recognised by their fingerprint and counted as
+        unchanged.
+
+        Items deleted in WeFact do not show up in such a listing: run a
+        ``full`` sync now and then (e.g. weekly) to remove them.
+
+        Args:
+            resource: Resource to mirror, e.g. ``client.invoices``
+            detail: Which new or changed items to fetch full details for with
+                show() (see BaseResource.iter_all()). The default mirrors the
+                listed summary fields only: one request per page.
+            workers: Number of threads fetching details concurrently
+            prefetch: Number of listing pages to fetch ahead
+            per_page: Number of items requested per page
+            prune: Delete mirrored items that are no longer listed by a full
+                sync. Ignored for incremental and filtered syncs.
+            full: List all items even when a watermark is recorded
+            **params: List filters; only the listed items are refreshed and
+                the watermark is neither used nor advanced
+
+        Returns:
+            Counts of the listed, written and deleted items
+        """
+        spec = self.spec(resource.controller_name)
+        result = SyncResult(spec.controller)
+        started = time.monotonic()
+        seen: List[int] = []
+        listing = self._listing(spec, resource, params, full, result, per_page, prefetch)
+
+        def needs_detail(item: Dict[str, Any]) -> bool:
+            return resource._needs_detail(item, detail)
+
+        def fetch(item: Dict[str, Any]) -> Dict[str, Any]:
+            return resource._fetch_detail(item) if needs_detail(item) else item
+
+        # Worker threads keep the caller's deadline
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        fetch_all = executor.map if executor else map
+        try:
+            for page in _batched(listing, per_page):
+                changed = self._changed(spec, page, needs_detail, result, seen)
+                details = list(fetch_all(in_current_context(fetch), changed))
+                self._write(spec, changed, details, [needs_detail(item) for item in changed], result)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self._finish(spec, seen, prune, not params, result, started)
+        return result
+
+    async def sync_async(
+        self,
+        resource: Any,
+        detail: DetailPolicy = False,
+        workers: int = 1,
+        prefetch: int = 0,
+        per_page: int = 1000,
+        prune: bool = True,
+        full: bool = False,
+        **params,
+    ) -> SyncResult:
+        """Awaitable sync() for resources of an AsyncWeFact client."""
+        spec = self.spec(resource.controller_name)
+        result = SyncResult(spec.controller)
+        started = time.monotonic()
+        seen: List[int] = []
+        listing = self._listing(spec, resource, params, full, result, per_page, prefetch)
+        semaphore = asyncio.Semaphore(max(1, workers))
+
+        def needs_detail(item: Dict[str, Any]) -> bool:
+            return resource._needs_detail(item, detail)
+
+        async def fetch(item: Dict[str, Any]) -> Dict[str, Any]:
+            if not needs_detail(item):
+                return item
+            async with semaphore:
+                return await resource._fetch_detail(item)
+
+        async for page in _batched_async(listing, per_page):
+            changed = self._changed(spec, page, needs_detail, result, seen)
+            details = await asyncio.gather(*map(fetch, changed))
+            self._write(spec, changed, details, [needs_detail(item) for item in changed], result)
+        self._finish(spec, seen, prune, not params, result, started)
+        return result
+
+    def sync_all(self, client: Any, controllers: Optional[Iterable[str]] = None, **kwargs) -> Dict[str, SyncResult]:
+        """
+        Mirror all (or the given) controllers of a WeFact client.
+
+        Args:
+            client: WeFact client
+            controllers: Controllers to mirror; default: all of ``tables``
+            **kwargs: Passed on to sync()
+
+        Returns:
+            Result per controller
+        """
+        return {
+            controller: self.sync(getattr(client, self.spec(controller).resource), **kwargs)
+            for controller in (controllers or self.tables)
+        }
+
+    async def sync_all_async(
+        self, client: Any, controllers: Optional[Iterable[str]] = None, **kwargs
+    ) -> Dict[str, SyncResult]:
+        """Awaitable sync_all() for an AsyncWeFact client."""
+        results = {}
+        for controller in controllers or self.tables:
+            resource = getattr(client, self.spec(controller).resource)
+            results[controller] = await self.sync_async(resource, **kwargs)
+        return results
+
+    def _listing(
+        self,
+        spec: TableSpec,
+        resource: Any,
+        params: Dict[str, Any],
+        full: bool,
+        result: SyncResult,
+        per_page: int,
+        prefetch: int,
+    ) -> Union[Iterator[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]:
+        """
+        Summary items of a sync: all items, the caller's filtered listing, or
+        the items modified since the watermark (less the overlap).
+        """
+        since: Union[datetime, str, None] = None
+        if not params and not full:
+            result.since = since = self.watermark(spec.controller)
+            if since is not None and self.overlap:
+                try:
+                    since = datetime.fromisoformat(since) - timedelta(seconds=self.overlap)
+                except ValueError:
+                    # Not an API timestamp: list from the marker itself
+                    pass
+        # Details are fetched by sync() for changed items only
+        return resource.iter_modified(since, per_page=per_page, prefetch=prefetch, detail=False, **params)
+
+    def _changed(
+        self,
+        spec: TableSpec,
+        page: Sequence[Dict[str, Any]],
+        needs_detail: Callable[[Dict[str, Any]], bool],
+        result: SyncResult,
+        seen: List[int],
+    ) -> List[Dict[str, Any]]:
+        """Listed items that are new or changed since they were mirrored."""
+        identifiers = [int(item["Identifier"]) for item in page]
+        seen.extend(identifiers)
+        result.listed += len(page)
+        modified = max((str(item["Modified"]) for item in page if item.get("Modified")), default=None)
+        if modified is not None and (result.watermark is None or modified > result.watermark):
+            result.watermark = modified
+        with self._lock:
+            stored = {
+                row[0]: (row[1], row[2])
+                for row in self._db.execute(
+                    f"SELECT Identifier, fingerprint, detailed FROM {_quote(spec.table)} "
+                    f"WHERE Identifier IN ({','.join('?' * len(identifiers))})",
+                    identifiers,
+                )
+            } if identifiers else {}
+        changed = []
+        for identifier, item in zip(identifiers, page):
+            previous = stored.get(identifier)
+            if previous is not None and previous[0] == _fingerprint(item) and (
+                previous[1] or not needs_detail(item)
+            ):
+                result.unchanged += 1
+            else:
+                changed.append(item)
+        return changed
+
+    def _write(
+        self,
+        spec: TableSpec,
+        summaries: Sequence[Dict[str, Any]],
+        items: Sequence[Dict[str, Any]],
+        detailed: Sequence[bool],
+        result: SyncResult,
+    ) -> None:
+        """Insert or replace changed items in one transaction."""
+        if not items:
+            return
+        columns = _BASE_COLUMNS + spec.columns
+        names = ", ".join(_quote(column.name) for column in columns)
+        placeholders = ", ".join("?" * (len(columns) + 5))
+        now = time.time()
+        rows = []
+        for summary, item, full in zip(summaries, items, detailed):
+            # Details lack nothing the summary has, but keep listed fields anyway
+            merged = {**summary, **item} if full else item
+            rows.append((
+                int(merged["Identifier"]),
+                *(_convert(merged.get(column.name), column.type) for column in columns),
+                json.dumps(merged, separators=(",", ":"), default=str),
+                _fingerprint(summary),
+                int(full),
+                now,
+            ))
+        with self._lock:
+            existing = {
+                row[0] for row in self._db.execute(
+                    f"SELECT Identifier FROM {_quote(spec.table)} "
+                    f"WHERE Identifier IN ({','.join('?' * len(rows))})",
+                    [row[0] for row in rows],
+                )
+            }
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    f"INSERT OR REPLACE INTO {_quote(spec.table)} (Identifier, {names}, "
+                    f"data, fingerprint, detailed, synced_at) VALUES ({placeholders})",
+                    rows,
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        result.updated += len(existing)
+        result.inserted += len(rows) - len(existing)
+        result.details += sum(detailed)
+
+    def _finish(
+        self,
+        spec: TableSpec,
+        seen: List[int],
+        prune: bool,
+        complete: bool,
+        result: SyncResult,
+        started: float,
+    ) -> None:
+        """
+        Delete items no longer listed and record the sync.
+
+        Only an unfiltered (``complete``) sync advances the watermark, and
+        only a complete full listing can tell which items were deleted.
+        """
+        table = _quote(spec.table)
+        watermark = result.since
+        if complete and result.watermark is not None and (watermark is None or result.watermark > watermark):
+            watermark = result.watermark
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                if prune and complete and result.since is None:
+                    listed = set(seen)
+                    stale = [
+                        (row[0],) for row in self._db.execute(f"SELECT Identifier FROM {table}")
+                        if row[0] not in listed
+                    ]
+                    self._db.executemany(f"DELETE FROM {table} WHERE Identifier = ?", stale)
+                    result.deleted = len(stale)
+                self._db.execute(
+                    "INSERT INTO sync_state (controller, synced_at, items, watermark) "
+                    f"VALUES (?, ?, (SELECT COUNT(*) FROM {table}), ?) "
+                    "ON CONFLICT (controller) DO UPDATE SET synced_at = excluded.synced_at, "
+                    "items = excluded.items, watermark = COALESCE(excluded.watermark, watermark)",
+                    (spec.controller, time.time(), watermark if complete else None),
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        result.seconds = time.monotonic() - started
+
+    # Reading
+
+    def get(self, controller: str, identifier: Union[int, str]) -> Optional[Dict[str, Any]]:
+        """The mirrored item with ``identifier``, or None."""
+        spec = self.spec(controller)
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT data FROM {_quote(spec.table)} WHERE Identifier = ?", (int(identifier),)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def find(
+        self,
+        controller: str,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        **where,
+    ) -> List[Dict[str, Any]]:
+        """
+        Mirrored items whose typed columns equal the given values.
+
+        Args:
+            controller: Mirrored controller
+            order_by: Column to sort by; prefix with ``-`` for descending
+            limit: Maximum number of items
+            **where: Column values, e.g. ``Status=2, DebtorCode="DB10000"``
+
+        Returns:
+            The matching items (as mirrored JSON)
+        """
+        spec = self.spec(controller)
+        columns = {"Identifier"} | {column.name for column in _BASE_COLUMNS + spec.columns}
+        for name in [*where, *([order_by.lstrip("-")] if order_by else [])]:
+            if name not in columns:
+                raise ValueError(f"{name!r} is not a column of {spec.table}")
+        sql = f"SELECT data FROM {_quote(spec.table)}"
+        if where:
+            sql += " WHERE " + " AND ".join(f"{_quote(name)} = ?" for name in where)
+        if order_by:
+            sql += f" ORDER BY {_quote(order_by.lstrip('-'))}" + (" DESC" if order_by.startswith("-") else "")
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._db.execute(sql, list(where.values())).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def query(self, sql: str, params: Union[Sequence[Any], Mapping[str, Any]] = ()) -> List[sqlite3.Row]:
+        """Run a read-only SQL query on the mirror, e.g. an aggregate for a dashboard."""
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def last_synced(self, controller: str) -> Optional[float]:
+        """Time (``time.time()``) of the last completed sync of a controller, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT synced_at FROM sync_state WHERE controller = ?", (controller,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def watermark(self, controller: str) -> Optional[str]:
+        """Latest ``Modified`` marker mirrored by a complete sync of a controller, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT watermark FROM sync_state WHERE controller = ?", (controller,)
+            ).fetchone()
+        return row[0] if row is not None else None
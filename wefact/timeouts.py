@@ -0,0 +1,74 @@
+"""Per-call deadlines for WeFact API requests."""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+__all__ = [
+    "deadline",
+    "current_deadline",
+    "remaining_time",
+    "in_current_context",
+]
+
+# Absolute deadline on the time.monotonic() clock, or None
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "wefact_deadline", default=None
+)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound the total time of all requests made inside the block.
+
+    The deadline covers rate limiter waits, connection setup, reading the
+    response and retries. When it expires a RequestTimeoutError is raised.
+    Nested deadlines never extend an outer one.
+
+    Args:
+        seconds: Time budget for the block
+
+    Example:
+        >>> with deadline(5):
+        ...     client.invoices.show(Identifier=123)
+    """
+    expires = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        expires = min(expires, outer)
+    token = _deadline.set(expires)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> Optional[float]:
+    """Absolute deadline (time.monotonic() clock) of the current context, if any."""
+    return _deadline.get()
+
+
+def remaining_time(expires: Optional[float]) -> Optional[float]:
+    """Seconds left until `expires` (never negative), or None without a deadline."""
+    if expires is None:
+        return None
+    return max(0.0, expires - time.monotonic())
+
+
+def in_current_context(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap `fn` to run in a copy of the caller's context.
+
+    Worker threads do not inherit context variables, so functions handed to
+    a thread pool are wrapped to keep the caller's deadline.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
@@ -1,9 +1,26 @@
 """Utility functions for WeFact API."""
 
 import base64
+import io
+import mmap
+import os
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Union
+from typing import IO, Iterator, Union
+
+from .config import DEFAULT_BASE64_CHUNK_SIZE
+from .streaming import Base64Decoder, iter_aligned_chunks
+
+# Input of the streaming encoder: a path, bytes, or a binary file object
+BinarySource = Union[str, os.PathLike, bytes, bytearray, memoryview, IO[bytes]]
+
+# Input of the streaming decoder: Base64 text, a path to it, or a file object
+Base64Source = Union[str, bytes, os.PathLike, IO]
+
+# Output of the streaming helpers: a path or a writable file object
+Destination = Union[str, os.PathLike, IO]
+
 
 
 def convert_to_base64(file_path: Union[str, Path]) -> str:
@@ -23,6 +40,9 @@ def convert_to_base64(file_path: Union[str, Path]) -> str:
         ...     Filename="invoice.pdf",
         ...     Base64=base64_content
         ... )
+
+    For large files, see encode_base64_stream(), or pass the path itself as
+    ``Base64`` to stream the upload.
     """
     file_path = Path(file_path)
     with open(file_path, 'rb') as f:
@@ -40,11 +60,191 @@ def decode_base64_to_file(base64_string: str, output_path: Union[str, Path]) ->
     Example:
         >>> response = client.invoices.download(Identifier=123)
         >>> decode_base64_to_file(response['Base64'], "invoice.pdf")
+
+    The string is decoded and written in chunks (see decode_base64_stream()).
+    """
+    decode_base64_stream(base64_string, Path(output_path))
+
+
+def iter_base64_encode(
+    source: BinarySource,
+    chunk_size: int = DEFAULT_BASE64_CHUNK_SIZE,
+    use_mmap: bool = False,
+) -> Iterator[bytes]:
+    """
+    Base64-encode a file or stream in fixed-size chunks.
+
+    Chunks of raw input are aligned to 3 bytes, so the concatenated output
+    equals ``base64.b64encode()`` of the whole input while only one chunk is
+    held in memory at a time.
+
+    Args:
+        source: Path of the file to encode, bytes, or a binary file object
+        chunk_size: Raw bytes encoded per chunk (rounded down to a multiple of 3)
+        use_mmap: Memory-map a file given by path instead of reading it,
+            which avoids copying it through read buffers
+
+    Yields:
+        Base64-encoded chunks (ASCII bytes)
+    """
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield base64.b64encode(view[start:start + chunk_size])
+        return
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            if use_mmap and os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield from iter_base64_encode(mapped, chunk_size)
+            else:
+                for chunk in iter_aligned_chunks(f, chunk_size):
+                    yield base64.b64encode(chunk)
+        return
+
+    for chunk in iter_aligned_chunks(source, chunk_size):
+        yield base64.b64encode(chunk)
+
+
+def encode_base64_stream(
+    source: BinarySource,
+    destination: Destination,
+    chunk_size: int = DEFAULT_BASE64_CHUNK_SIZE,
+    use_mmap: bool = False,
+) -> int:
+    """
+    Base64-encode a file or stream and write the result incrementally.
+
+    Args:
+        source: Path of the file to encode, bytes, or a binary file object
+        destination: Path to write to, or a writable file object (text or binary)
+        chunk_size: Raw bytes encoded per chunk
+        use_mmap: Memory-map a file given by path instead of reading it
+
+    Returns:
+        Number of Base64 characters written
+
+    Example:
+        >>> encode_base64_stream("scan.pdf", "scan.pdf.b64", use_mmap=True)
+    """
+    written = 0
+    with _open_destination(destination) as (write, text):
+        for chunk in iter_base64_encode(source, chunk_size, use_mmap):
+            write(chunk.decode('ascii') if text else chunk)
+            written += len(chunk)
+    return written
+
+
+def iter_base64_decode(
+    source: Base64Source,
+    chunk_size: int = DEFAULT_BASE64_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Decode Base64 text in fixed-size chunks.
+
+    Behaves like ``base64.b64decode()``: characters outside the Base64
+    alphabet (such as line breaks) are skipped and decoding stops at the
+    padding, but only one chunk is held in memory at a time.
+
+    Args:
+        source: Base64 text (str or bytes), the path of a file containing it,
+            or a readable file object (text or binary)
+        chunk_size: Base64 characters read and decoded per chunk
+
+    Yields:
+        Chunks of decoded bytes
+
+    Raises:
+        binascii.Error: If the input is incorrectly padded
+    """
+    decoder = Base64Decoder()
+    for raw in _iter_base64_text(source, chunk_size):
+        decoded = decoder.feed(raw)
+        if decoded:
+            yield decoded
+        if decoder.done:
+            return
+    decoded = decoder.finish()
+    if decoded:
+        yield decoded
+
+
+def decode_base64_stream(
+    source: Base64Source,
+    destination: Destination,
+    chunk_size: int = DEFAULT_BASE64_CHUNK_SIZE,
+) -> int:
+    """
+    Decode Base64 text and write the bytes incrementally.
+
+    Args:
+        source: Base64 text (str or bytes), the path of a file containing it,
+            or a readable file object (text or binary)
+        destination: Path to write to, or a writable binary file object.
+            Paths are replaced atomically once decoding succeeds.
+        chunk_size: Base64 characters read and decoded per chunk
+
+    Returns:
+        Number of bytes written
+
+    Example:
+        >>> with open("invoice.pdf", "wb") as f:
+        ...     decode_base64_stream(response["invoice"]["Base64"], f)
+    """
+    written = 0
+    with _open_destination(destination) as (write, text):
+        if text:
+            raise TypeError('Decoded bytes need a file object opened in binary mode')
+        for chunk in iter_base64_decode(source, chunk_size):
+            write(chunk)
+            written += len(chunk)
+    return written
+
+
+def _iter_base64_text(source: Base64Source, chunk_size: int) -> Iterator[bytes]:
+    """Read Base64 text from any supported source as ASCII bytes."""
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size].encode('ascii')
+        return
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size].tobytes()
+        return
+    if isinstance(source, os.PathLike):
+        with open(source, 'rb') as f:
+            yield from _iter_base64_text(f, chunk_size)
+        return
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk.encode('ascii') if isinstance(chunk, str) else chunk
+
+
+@contextmanager
+def _open_destination(destination: Destination):
+    """
+    Yield ``(write, is_text)`` for a path (opened and closed here) or a file object.
+
+    Paths are written to a ``.part`` file next to them and renamed into place
+    on success, so a failed write never leaves a truncated file behind.
     """
-    output_path = Path(output_path)
-    decoded_content = base64.b64decode(base64_string)
-    with open(output_path, 'wb') as f:
-        f.write(decoded_content)
+    if isinstance(destination, (str, os.PathLike)):
+        path = Path(destination)
+        partial = path.with_name(path.name + '.part')
+        try:
+            with open(partial, 'wb') as f:
+                yield f.write, False
+            os.replace(partial, path)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+    else:
+        yield destination.write, isinstance(destination, io.TextIOBase)
 
 
 def format_date_for_api(date: Union[datetime, str]) -> str:
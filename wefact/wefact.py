@@ -1,24 +1,122 @@
 from __future__ import annotations
 
-from .resources import (
-    InvoiceResource,
-    CreditInvoiceResource,
-    DebtorResource,
-    ProductResource,
-    CreditorResource,
-    GroupResource,
-    SubscriptionResource,
-    SettingsResource,
-    CostCategoryResource,
-    InteractionResource,
-    QuoteResource,
-    TaskResource,
-    TransactionResource,
+import os
+from typing import TYPE_CHECKING, Optional, Union
+
+from . import resources
+from .config import (
+    DEFAULT_API_URL,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
 )
+from .context import ClientContext, ContextAttribute
+from .rate_limit import RateLimitBackend, TokenBucket
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from .request import create_session
+
+if TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .identifiers import IdentifierIndex
+    from .resources import (
+        InvoiceResource,
+        CreditInvoiceResource,
+        DebtorResource,
+        ProductResource,
+        CreditorResource,
+        GroupResource,
+        SubscriptionResource,
+        SettingsResource,
+        CostCategoryResource,
+        InteractionResource,
+        QuoteResource,
+        TaskResource,
+        TransactionResource,
+    )
 
 
 class WeFact:
-    def __init__(self, api_key: str, api_url: str = "https://api.mijnwefact.nl/v2/"):
+    """
+    WeFact API client.
+
+    All resources of a client share one pooled HTTP session, so connections
+    to the API are kept alive and reused between calls. Close the client
+    when done, or use it as a context manager:
+
+        with WeFact(api_key="...") as client:
+            client.invoices.list()
+
+    Args:
+        api_key: WeFact API key
+        api_url: API base URL
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum number of connections kept open per host
+        pool_block: Block when all connections are in use instead of
+            opening extra, non-pooled connections
+        keep_alive: Reuse connections between requests
+        requests_per_minute: Client-wide request budget enforced before every
+            request. ``None`` disables client-side rate limiting.
+        burst: Number of requests that may be sent back-to-back
+        rate_limiter: Use this limiter instead of creating one, e.g. to share
+            a budget between several clients
+        rate_limit_backend: Where the default limiter keeps its state, e.g. a
+            FileLockBackend to share the budget between processes
+        retry: Retry policy for transient failures. By default only safe
+            (read-only) actions are retried; ``None`` disables retries.
+        connect_timeout: Seconds to wait for a connection to the API
+        read_timeout: Seconds to wait for response data. Pass None for both
+            timeouts to wait indefinitely. Use ``wefact.deadline()`` to bound
+            the total time of a call including retries and rate limit waits.
+        cache: Cache responses of read-only calls (list/show). True uses an
+            in-memory wefact.cache.ResponseCache with default settings; pass
+            a ResponseCache to configure TTLs, size or an on-disk backend.
+        identifiers: Keep a code/Identifier index (wefact.identifiers.
+            IdentifierIndex) filled from responses, used by the resources'
+            ``resolve()`` / ``resolve_code()``. True keeps it in memory, a
+            path loads it from (and ``save()``s it to) a JSON file.
+
+    Resources are created on first access and then reused, so
+    ``client.invoices`` always returns the same object. They share the
+    client's ``context`` (a ClientContext): changing ``session``,
+    ``rate_limiter``, ``retry_policy`` or ``timeout`` on the client applies
+    to all of its resources.
+    """
+
+    api_key = ContextAttribute()
+    api_url = ContextAttribute()
+    session = ContextAttribute()
+    rate_limiter = ContextAttribute()
+    retry_policy = ContextAttribute()
+    timeout = ContextAttribute()
+    cache = ContextAttribute()
+
+    @property
+    def identifiers(self) -> Optional[IdentifierIndex]:
+        """Code/Identifier index of this client, if enabled."""
+        return self.context.identifiers
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = DEFAULT_API_URL,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        requests_per_minute: Optional[float] = DEFAULT_REQUESTS_PER_MINUTE,
+        burst: float = DEFAULT_RATE_LIMIT_BURST,
+        rate_limiter: Optional[TokenBucket] = None,
+        rate_limit_backend: Optional[RateLimitBackend] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+        cache: Union[bool, ResponseCache, None] = None,
+        identifiers: Union[bool, str, os.PathLike, IdentifierIndex, None] = None,
+    ):
         if not isinstance(api_key, str):
             raise TypeError(
                 f"api_key must be a string, got {type(api_key).__name__}. "
@@ -27,57 +125,91 @@ class WeFact:
         if not api_key or not api_key.strip():
             raise ValueError("api_key cannot be empty")
         
-        self.api_key = api_key
-        self.api_url = api_url
+        self.context = ClientContext(api_key, api_url)
+        self.session = create_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+
+        if rate_limiter is None and requests_per_minute is not None:
+            rate_limiter = TokenBucket.per_minute(
+                requests_per_minute, burst, backend=rate_limit_backend
+            )
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry
+        self.timeout = (connect_timeout, read_timeout)
+        if cache is True:
+            from .cache import ResponseCache
+
+            cache = ResponseCache()
+        self.cache = cache or None
+        if identifiers is not None and identifiers is not False:
+            from .identifiers import IdentifierIndex
+
+            if not isinstance(identifiers, IdentifierIndex):
+                identifiers = IdentifierIndex(None if identifiers is True else identifiers)
+            identifiers.attach(self.context)
+
+    def close(self) -> None:
+        """Close the HTTP session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "WeFact":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     @property
     def invoices(self) -> InvoiceResource:
-        return InvoiceResource(self.api_key, self.api_url)
+        return self.context.resource(resources.InvoiceResource)
 
     @property
     def credit_invoices(self) -> CreditInvoiceResource:
-        return CreditInvoiceResource(self.api_key, self.api_url)
+        return self.context.resource(resources.CreditInvoiceResource)
 
     @property
     def debtors(self) -> DebtorResource:
-        return DebtorResource(self.api_key, self.api_url)
+        return self.context.resource(resources.DebtorResource)
 
     @property
     def products(self) -> ProductResource:
-        return ProductResource(self.api_key, self.api_url)
+        return self.context.resource(resources.ProductResource)
 
     @property
     def creditors(self) -> CreditorResource:
-        return CreditorResource(self.api_key, self.api_url)
+        return self.context.resource(resources.CreditorResource)
 
     @property
     def groups(self) -> GroupResource:
-        return GroupResource(self.api_key, self.api_url)
+        return self.context.resource(resources.GroupResource)
 
     @property
     def subscriptions(self) -> SubscriptionResource:
-        return SubscriptionResource(self.api_key, self.api_url)
+        return self.context.resource(resources.SubscriptionResource)
 
     @property
     def settings(self) -> SettingsResource:
-        return SettingsResource(self.api_key, self.api_url)
+        return self.context.resource(resources.SettingsResource)
 
     @property
     def cost_categories(self) -> CostCategoryResource:
-        return CostCategoryResource(self.api_key, self.api_url)
+        return self.context.resource(resources.CostCategoryResource)
 
     @property
     def interactions(self) -> InteractionResource:
-        return InteractionResource(self.api_key, self.api_url)
+        return self.context.resource(resources.InteractionResource)
 
     @property
     def quotes(self) -> QuoteResource:
-        return QuoteResource(self.api_key, self.api_url)
+        return self.context.resource(resources.QuoteResource)
 
     @property
     def tasks(self) -> TaskResource:
-        return TaskResource(self.api_key, self.api_url)
+        return self.context.resource(resources.TaskResource)
 
     @property
     def transactions(self) -> TransactionResource:
-        return TransactionResource(self.api_key, self.api_url)
+        return self.context.resource(resources.TransactionResource)
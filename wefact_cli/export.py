@@ -0,0 +1,90 @@
+"""wefact-export: download invoice or quote PDFs in bulk.
+
+Usage examples:
+    wefact-export invoices exports/2025-01 --filter status=4 --workers 8
+    wefact-export invoices invoices.zip --id 101 --id 102
+    wefact-export quotes - --ids-file quotes.txt > quotes.zip
+
+The API key is read from --api-key or the WEFACT_API_KEY environment
+variable (WEFACT_API_URL optionally overrides the API URL).
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from wefact import WeFact
+from wefact.config import DEFAULT_API_URL, DEFAULT_REQUESTS_PER_MINUTE
+from wefact.export import export_pdfs
+
+RESOURCES = ('invoices', 'quotes')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the export command."""
+    parser = argparse.ArgumentParser(
+        prog='wefact-export',
+        description='Download invoice or quote PDFs concurrently into a directory or ZIP archive. '
+                    'Interrupted exports resume where they stopped.',
+    )
+    parser.add_argument('resource', choices=RESOURCES, help='Documents to export')
+    parser.add_argument(
+        'destination',
+        help="Directory, path ending in .zip, or '-' to write a ZIP archive to stdout",
+    )
+    parser.add_argument('--id', dest='ids', action='append', default=[], metavar='IDENTIFIER',
+                        help='Export this document (repeatable); default: all listed documents')
+    parser.add_argument('--ids-file', help='File with one Identifier per line')
+    parser.add_argument('--filter', dest='filters', action='append', default=[], metavar='KEY=VALUE',
+                        help='List filter when exporting listed documents, e.g. status=4 (repeatable)')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent downloads (default: 4)')
+    parser.add_argument('--manifest', help='Resume manifest path (default: next to the destination)')
+    parser.add_argument('--requests-per-minute', type=int, default=DEFAULT_REQUESTS_PER_MINUTE,
+                        help=f'Client-side rate limit (default: {DEFAULT_REQUESTS_PER_MINUTE})')
+    parser.add_argument('--api-key', default=os.getenv('WEFACT_API_KEY'),
+                        help='WeFact API key (default: $WEFACT_API_KEY)')
+    parser.add_argument('--api-url', default=os.getenv('WEFACT_API_URL', DEFAULT_API_URL), help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the export command and return its exit status."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        parser.error('no API key: pass --api-key or set WEFACT_API_KEY')
+
+    filters = {}
+    for item in args.filters:
+        key, sep, value = item.partition('=')
+        if not sep:
+            parser.error(f'invalid --filter {item!r}, expected KEY=VALUE')
+        filters[key] = value
+
+    identifiers = list(args.ids)
+    if args.ids_file:
+        with open(args.ids_file) as f:
+            identifiers.extend(line.strip() for line in f if line.strip())
+
+    destination = sys.stdout.buffer if args.destination == '-' else args.destination
+    with WeFact(api_key=args.api_key, api_url=args.api_url,
+                requests_per_minute=args.requests_per_minute) as client:
+        result = export_pdfs(
+            getattr(client, args.resource),
+            destination,
+            identifiers or None,
+            workers=args.workers,
+            manifest=args.manifest,
+            **filters,
+        )
+
+    print(f'Exported {result.exported}, skipped {result.skipped} already exported, '
+          f'failed {len(result.failed)}', file=sys.stderr)
+    for identifier, error in result.failed.items():
+        print(f'  {identifier}: {error}', file=sys.stderr)
+    return 1 if result.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())